@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+"""
+Developer script to benchmark the JSON round trip (as_dict -> string ->
+objects) of the default and the compact "columnar" dict formats, using
+pmg_json_dumps / pmg_json_loads with the json and (if installed) orjson
+backends.
+
+Usage: python benchmark_serialization.py [repeats]
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from monty.serialization import loadfn
+
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.electronic_structure.bandstructure import BandStructureSymmLine
+from pymatgen.electronic_structure.dos import CompleteDos
+from pymatgen.util.serialization import pmg_json_dumps, pmg_json_loads, \
+    orjson
+
+test_dir = Path(__file__).absolute().parent.parent / "test_files"
+
+
+def get_objects():
+    """
+    Returns:
+        [(label, obj)] with the objects to benchmark.
+    """
+    structure = loadfn(str(test_dir / "TiO2_entries.json"))[5].structure
+    structure = structure * (3, 3, 2)
+    entries = [ComputedStructureEntry(structure, -1.0, parameters={"a": 1},
+                                      data={"b": [1, 2]}) for _ in range(20)]
+    with open(str(test_dir / "complete_dos.json")) as f:
+        dos = CompleteDos.from_dict(json.load(f))
+    with open(str(test_dir / "CaO_2605_bandstructure.json")) as f:
+        bs = BandStructureSymmLine.from_dict(json.load(f))
+    return [("Structure (%d sites)" % len(structure), structure),
+            ("%d ComputedStructureEntry" % len(entries), entries),
+            ("CompleteDos (complete_dos)", dos),
+            ("BandStructureSymmLine (CaO)", bs)]
+
+
+def round_trip(obj, fmt, backend):
+    """
+    as_dict(fmt=fmt) -> JSON string -> objects.
+    """
+    if isinstance(obj, list):
+        d = [o.as_dict(fmt=fmt) for o in obj]
+    else:
+        d = obj.as_dict(fmt=fmt)
+    return pmg_json_loads(pmg_json_dumps(d, backend=backend), backend=backend)
+
+
+def main(repeats=3):
+    """
+    Prints the best round trip time of each object and format.
+
+    Args:
+        repeats (int): Number of repeats. The best time is reported.
+    """
+    modes = [("default+json", None, "json"), ("columnar+json", "columnar", "json")]
+    if orjson is not None:
+        modes.append(("columnar+orjson", "columnar", "orjson"))
+
+    print("%-30s" % "round trip (ms)" + "".join("%17s" % m[0] for m in modes))
+    for label, obj in get_objects():
+        times = []
+        for _, fmt, backend in modes:
+            t = min(timeit.repeat(lambda: round_trip(obj, fmt, backend),
+                                  number=1, repeat=repeats))
+            times.append(t * 1000)
+        print("%-30s" % label + "".join("%17.1f" % t for t in times))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
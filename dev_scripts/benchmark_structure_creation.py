@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""
+Developer script to benchmark the cost per site of creating structures from
+the usual species inputs (element symbols, atomic numbers, species strings),
+of the dict round trip and of composition / species lookups.
+
+Usage: python benchmark_structure_creation.py [nsites] [repeats]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from pymatgen.core.lattice import Lattice
+from pymatgen.core.structure import Structure
+from pymatgen.core.periodic_table import Specie, get_el_sp
+
+
+def main(nsites=5000, repeats=5):
+    """
+    Prints the time per site for each benchmark.
+
+    Args:
+        nsites (int): Number of sites in the benchmark structures.
+        repeats (int): Number of repeats. The best time is reported.
+    """
+    rng = np.random.RandomState(0)
+    lattice = Lattice.cubic(30)
+    coords = rng.rand(nsites, 3)
+
+    inputs = {
+        "element symbols": ["Li", "Fe", "P", "O"],
+        "atomic numbers": [3, 26, 15, 8],
+        "species strings": ["Li+", "Fe2+", "Fe3+", "P5+", "O2-"],
+        "species with spin": ["Fe2+,spin=4", "Fe3+,spin=5", "O2-"],
+        "Specie objects": [Specie("Fe", 2), Specie("Fe", 3), Specie("O", -2)],
+    }
+
+    print("%-36s %12s" % ("benchmark (%d sites)" % nsites, "us/site"))
+    for name, choices in inputs.items():
+        species = [choices[i] for i in rng.randint(len(choices), size=nsites)]
+        s = Structure(lattice, species, coords)
+        d = s.as_dict()
+
+        benchmarks = [
+            ("Structure(%s)" % name,
+             lambda: Structure(lattice, species, coords)),
+            ("  Structure.from_dict", lambda: Structure.from_dict(d)),
+            ("  get_el_sp", lambda: [get_el_sp(sp) for sp in species]),
+            ("  composition + weight",
+             lambda: Structure(lattice, species, coords).composition.weight),
+        ]
+        for label, func in benchmarks:
+            t = min(timeit.repeat(func, number=1, repeat=repeats))
+            print("%-36s %12.2f" % (label, t / nsites * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -18,7 +18,7 @@ from functools import lru_cache
 import numpy as np
 from scipy.spatial import ConvexHull
 
-from pymatgen.core.composition import Composition
+from pymatgen.core.composition import Composition, get_composition_matrix
 from pymatgen.core.periodic_table import Element, DummySpecie, get_el_sp
 from pymatgen.util.coord import Simplex, in_coord_list
 from pymatgen.util.string import latexify
@@ -345,11 +345,10 @@ class PhaseDiagram(MSONable):
             raise PhaseDiagramError(
                 "There are no entries associated with a terminal element!.")
 
-        data = np.array([
-            [e.composition.get_atomic_fraction(el) for el in elements] + [
-                e.energy_per_atom]
-            for e in min_entries
-        ])
+        _, fracs = get_composition_matrix(
+            [e.composition for e in min_entries], elements, fractional=True)
+        data = np.column_stack(
+            [fracs, [e.energy_per_atom for e in min_entries]])
 
         # Use only entries with negative formation energy
         vec = [el_refs[el].energy_per_atom for el in elements] + [-1]
@@ -410,13 +409,12 @@ class PhaseDiagram(MSONable):
         """
         :return: The actual ndarray used to construct the convex hull.
         """
-        data = []
-        for entry in self.all_entries:
-            comp = entry.composition
-            row = [comp.get_atomic_fraction(el) for el in self.elements]
-            row.append(entry.energy_per_atom)
-            data.append(row)
-        return np.array(data)[:, 1:]
+        _, fracs = get_composition_matrix(
+            [e.composition for e in self.all_entries], self.elements,
+            fractional=True)
+        data = np.column_stack(
+            [fracs, [e.energy_per_atom for e in self.all_entries]])
+        return data[:, 1:]
 
     @property
     def unstable_entries(self):
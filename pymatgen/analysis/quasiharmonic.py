@@ -24,6 +24,7 @@ from scipy.optimize import minimize
 
 from pymatgen.core.units import FloatWithUnit
 from pymatgen.analysis.eos import EOS, PolynomialEOS
+from pymatgen.phonon.dos import get_thermal_properties
 
 __author__ = "Kiran Mathew, Brandon Bocklund"
 __credits__ = "Cormac Toher"
@@ -36,7 +37,8 @@ class QuasiharmonicDebyeApprox:
 
     def __init__(self, energies, volumes, structure, t_min=300.0, t_step=100,
                  t_max=300.0, eos="vinet", pressure=0.0, poisson=0.25,
-                 use_mie_gruneisen=False, anharmonic_contribution=False):
+                 use_mie_gruneisen=False, anharmonic_contribution=False,
+                 phonon_doses=None):
         """
         Args:
             energies (list): list of DFT energies in eV
@@ -58,6 +60,10 @@ class QuasiharmonicDebyeApprox:
             anharmonic_contribution (bool): whether or not to consider the anharmonic
                 contribution to the Debye temperature. Cannot be used with
                 use_mie_gruneisen. Defaults to False.
+            phonon_doses (list): optional list of PhononDos, one for each
+                volume. If given, the vibrational free energy used to
+                minimize the gibbs free energy is obtained from the phonon
+                densities of states instead of the Debye model.
         """
         self.energies = energies
         self.volumes = volumes
@@ -70,9 +76,13 @@ class QuasiharmonicDebyeApprox:
         self.poisson = poisson
         self.use_mie_gruneisen = use_mie_gruneisen
         self.anharmonic_contribution = anharmonic_contribution
+        self.phonon_doses = phonon_doses
         if self.use_mie_gruneisen and self.anharmonic_contribution:
             raise ValueError('The Mie-Gruneisen formulation and anharmonic contribution are circular referenced and '
                              'cannot be used together.')
+        if self.phonon_doses is not None and len(self.phonon_doses) != len(self.volumes):
+            raise ValueError("phonon_doses must contain one PhononDos per volume, got {} for {} volumes."
+                             .format(len(self.phonon_doses), len(self.volumes)))
         self.mass = sum([e.atomic_mass for e in self.structure.species])
         self.natoms = self.structure.composition.num_atoms
         self.avg_mass = physical_constants["atomic mass constant"][0] * self.mass / self.natoms  # kg
@@ -104,9 +114,17 @@ class QuasiharmonicDebyeApprox:
             self.temperature_min,  self.temperature_max,
             int(np.ceil((self.temperature_max - self.temperature_min) / self.temperature_step) + 1))
 
-        for t in temperatures:
+        vib_free_energies = [None] * len(temperatures)
+        if self.phonon_doses is not None:
+            # A_vib(V, T) for all temperatures and volumes at once, J/mol-c to eV
+            vib_free_energies = get_thermal_properties(
+                self.phonon_doses, temperatures, "helmholtz_free_energy") * \
+                physical_constants["joule-electron volt relationship"][0] / \
+                physical_constants["Avogadro constant"][0]
+
+        for t, vib_free_energy in zip(temperatures, vib_free_energies):
             try:
-                G_opt, V_opt = self.optimizer(t)
+                G_opt, V_opt = self.optimizer(t, vib_free_energy)
             except Exception:
                 if len(temperatures) > 1:
                     print("EOS fitting failed, so skipping this data point, {}".format(t))
@@ -117,7 +135,7 @@ class QuasiharmonicDebyeApprox:
             self.temperatures.append(t)
             self.optimum_volumes.append(V_opt)
 
-    def optimizer(self, temperature):
+    def optimizer(self, temperature, vib_free_energies=None):
         """
         Evaluate G(V, T, P) at the given temperature(and pressure) and
         minimize it wrt V.
@@ -131,16 +149,20 @@ class QuasiharmonicDebyeApprox:
 
         Args:
             temperature (float): temperature in K
+            vib_free_energies (list): A_vib(V, T) in eV for each volume at
+                the given temperature. If None, it is computed with the
+                Debye model.
 
         Returns:
             float, float: G_opt(V_opt, T, P) in eV and V_opt in Ang^3.
         """
-        G_V = []  # G for each volume
-        # G = E(V) + PV + A_vib(V, T)
-        for i, v in enumerate(self.volumes):
-            G_V.append(self.energies[i] +
-                       self.pressure * v * self.gpa_to_ev_ang +
-                       self.vibrational_free_energy(temperature, v))
+        if vib_free_energies is None:
+            vib_free_energies = [self.vibrational_free_energy(temperature, v)
+                                 for v in self.volumes]
+        # G = E(V) + PV + A_vib(V, T) for each volume
+        G_V = np.array(self.energies) + \
+            self.pressure * np.array(self.volumes) * self.gpa_to_ev_ang + \
+            np.array(vib_free_energies)
 
         # fit equation of state, G(V, T, P)
         eos_fit = self.eos.fit(self.volumes, G_V)
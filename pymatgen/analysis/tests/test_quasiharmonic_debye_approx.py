@@ -1,12 +1,17 @@
+import os
+import json
 import unittest
 import numpy as np
 from pymatgen import Structure
 from pymatgen.analysis.eos import EOS
+from pymatgen.phonon.dos import PhononDos
 
 from pymatgen.analysis.quasiharmonic import QuasiharmonicDebyeApprox
 
 __author__ = 'Kiran Mathew'
 
+test_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..", 'test_files')
+
 
 class TestQuasiharmociDebyeApprox(unittest.TestCase):
 
@@ -80,6 +85,22 @@ class TestQuasiharmociDebyeApprox(unittest.TestCase):
         A = self.qhda.vibrational_free_energy(self.T, self.opt_vol)
         np.testing.assert_almost_equal(A, 0.494687, 3)
 
+    def test_phonon_doses(self):
+        with open(os.path.join(test_dir, "NaCl_ph_dos.json"), "r") as f:
+            dos = PhononDos.from_dict(json.load(f))
+        # a volume independent dos shifts G(V) rigidly, so the optimum
+        # volume is the one of the static equation of state
+        qhda = QuasiharmonicDebyeApprox(self.energies, self.volumes, self.qhda.structure,
+                                        t_min=100, t_step=200, t_max=500, eos=self.eos,
+                                        phonon_doses=[dos] * len(self.volumes))
+        self.assertEqual(qhda.temperatures, [100, 300, 500])
+        a_vib = dos.helmholtz_free_energy(np.array(qhda.temperatures)) / 96485.33212
+        np.testing.assert_allclose(qhda.optimum_volumes, qhda.ev_eos_fit.v0, rtol=1e-4)
+        np.testing.assert_allclose(qhda.gibbs_free_energy, qhda.ev_eos_fit.e0 + a_vib, atol=1e-4)
+        for doses in ([dos], [dos] * (len(self.volumes) - 1)):
+            self.assertRaises(ValueError, QuasiharmonicDebyeApprox, self.energies, self.volumes,
+                              self.qhda.structure, eos=self.eos, phonon_doses=doses)
+
 
 class TestAnharmonicQuasiharmociDebyeApprox(unittest.TestCase):
 
@@ -10,12 +10,13 @@ and a ChemicalPotential class to represent potentials.
 import collections
 import numbers
 import string
-from itertools import combinations_with_replacement, product
+from itertools import product
 import os
 import re
-from typing import Tuple, List
-from functools import total_ordering
+from typing import Tuple, List, Optional, Sequence
+from functools import total_ordering, lru_cache
 
+import numpy as np
 from monty.serialization import loadfn
 from monty.fractions import gcd, gcd_float
 from monty.json import MSONable
@@ -32,6 +33,11 @@ __email__ = "shyuep@gmail.com"
 __status__ = "Production"
 __date__ = "Nov 10, 2012"
 
+# Maximum number of distinct formula strings kept in the parsing cache.
+_FORMULA_CACHE_SIZE = 100000
+# Maximum number of distinct oxidation state guesses kept in the cache.
+_OXI_GUESS_CACHE_SIZE = 10000
+
 
 @total_ordering
 class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
@@ -87,6 +93,13 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
 
     oxi_prob = None  # prior probability of oxidation used by oxi_state_guesses
 
+    # Memoized derived properties. Composition is immutable, so these are
+    # computed at most once per instance and stored on first access.
+    _hash = None
+    _weight = None
+    _anonymized_formula = None
+    _reduced_formula_and_factor = None
+
     def __init__(self, *args, strict=False, **kwargs):  # allow_negative=False
         r"""
         Very flexible Composition construction, similar to the built-in Python
@@ -119,7 +132,10 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
         if len(args) == 1 and isinstance(args[0], Composition):
             elmap = args[0]
         elif len(args) == 1 and isinstance(args[0], str):
-            elmap = self._parse_formula(args[0])
+            # Parsed formulas are interned, so that repeated construction
+            # from the same string skips the regex parsing and get_el_sp
+            # lookups.
+            elmap = dict(_parse_formula_cached(args[0]))
         else:
             elmap = dict(*args, **kwargs)
         elamt = {}
@@ -238,11 +254,13 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
         Minimally effective hash function that just distinguishes between
         Compositions with different elements.
         """
-        hashcode = 0
-        for el, amt in self.items():
-            if abs(amt) > Composition.amount_tolerance:
-                hashcode += el.Z
-        return hashcode
+        if self._hash is None:
+            hashcode = 0
+            for el, amt in self.items():
+                if abs(amt) > Composition.amount_tolerance:
+                    hashcode += el.Z
+            self._hash = hashcode
+        return self._hash
 
     @property
     def average_electroneg(self) -> float:
@@ -386,19 +404,26 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             A pretty normalized formula and a multiplicative factor, i.e.,
             Li4Fe4P4O16 returns (LiFePO4, 4).
         """
+        if self._reduced_formula_and_factor is None:
+            self._reduced_formula_and_factor = {}
+        elif iupac_ordering in self._reduced_formula_and_factor:
+            return self._reduced_formula_and_factor[iupac_ordering]
         all_int = all(abs(x - round(x)) < Composition.amount_tolerance
                       for x in self.values())
         if not all_int:
-            return self.formula.replace(" ", ""), 1
-        d = {k: int(round(v)) for k, v in self.get_el_amt_dict().items()}
-        (formula, factor) = reduce_formula(
-            d, iupac_ordering=iupac_ordering)
+            result = self.formula.replace(" ", ""), 1
+        else:
+            d = {k: int(round(v)) for k, v in self.get_el_amt_dict().items()}
+            (formula, factor) = _reduce_formula_cached(
+                tuple(sorted(d.items())), iupac_ordering)
 
-        if formula in Composition.special_formulas:
-            formula = Composition.special_formulas[formula]
-            factor /= 2
+            if formula in Composition.special_formulas:
+                formula = Composition.special_formulas[formula]
+                factor /= 2
+            result = formula, factor
 
-        return formula, factor
+        self._reduced_formula_and_factor[iupac_ordering] = result
+        return result
 
     def get_integer_formula_and_factor(self, max_denominator=10000,
                                        iupac_ordering=False):
@@ -486,7 +511,11 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
         """
         Total molecular weight of Composition
         """
-        return Mass(sum([amount * el.atomic_mass for el, amount in self.items()]), "amu")
+        if self._weight is None:
+            # Summing plain floats avoids a unit check per element.
+            self._weight = Mass(sum([amount * float(el.atomic_mass)
+                                     for el, amount in self.items()]), "amu")
+        return self._weight
 
     def get_atomic_fraction(self, el):
         """
@@ -541,7 +570,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             return any([category[0] in el.block for el in self.elements])
         return any([getattr(el, "is_{}".format(category)) for el in self.elements])
 
-    def _parse_formula(self, formula):
+    @staticmethod
+    def _parse_formula(formula):
         """
         Args:
             formula (str): A string formula, e.g. Fe2O3, Li3Fe2(PO4)3
@@ -578,7 +608,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             expanded_sym = "".join(["{}{}".format(el, amt)
                                     for el, amt in unit_sym_dict.items()])
             expanded_formula = formula.replace(m.group(), expanded_sym)
-            return self._parse_formula(expanded_formula)
+            return Composition._parse_formula(expanded_formula)
         return get_sym_dict(formula, 1)
 
     @property
@@ -589,6 +619,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
         prototyping formulas. For example, all stoichiometric perovskites have
         anonymized_formula ABC3.
         """
+        if self._anonymized_formula is not None:
+            return self._anonymized_formula
         reduced = self.element_composition
         if all(x == int(x) for x in self.values()):
             reduced /= gcd(*(int(i) for i in self.values()))
@@ -602,6 +634,7 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             else:
                 amt_str = str(amt)
             anon += ("{}{}".format(e, amt_str))
+        self._anonymized_formula = anon
         return anon
 
     @property
@@ -861,75 +894,25 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             raise ValueError("Charge balance analysis requires integer "
                              "values in Composition!")
 
-        # for each element, determine all possible sum of oxidations
-        # (taking into account nsites for that particular element)
         el_amt = comp.get_el_amt_dict()
-        els = el_amt.keys()
-        el_sums = []  # matrix: dim1= el_idx, dim2=possible sums
-        el_sum_scores = collections.defaultdict(set)  # dict of el_idx, sum -> score
-        el_best_oxid_combo = {}  # dict of el_idx, sum -> oxid combo with best score
-        for idx, el in enumerate(els):
-            el_sum_scores[idx] = {}
-            el_best_oxid_combo[idx] = {}
-            el_sums.append([])
+        oxids = []
+        for el in el_amt:
             if oxi_states_override.get(el):
-                oxids = oxi_states_override[el]
+                oxids.append(tuple(oxi_states_override[el]))
             elif all_oxi_states:
-                oxids = Element(el).oxidation_states
+                oxids.append(Element(el).oxidation_states)
             else:
-                oxids = Element(el).icsd_oxidation_states or \
-                        Element(el).oxidation_states
-
-            # get all possible combinations of oxidation states
-            # and sum each combination
-            for oxid_combo in combinations_with_replacement(oxids,
-                                                            int(el_amt[el])):
-
-                # List this sum as a possible option
-                oxid_sum = sum(oxid_combo)
-                if oxid_sum not in el_sums[idx]:
-                    el_sums[idx].append(oxid_sum)
-
-                # Determine how probable is this combo?
-                score = sum([Composition.oxi_prob.get(Specie(el, o), 0) for
-                             o in oxid_combo])
-
-                # If it is the most probable combo for a certain sum,
-                #   store the combination
-                if oxid_sum not in el_sum_scores[idx] or score > el_sum_scores[idx].get(oxid_sum, 0):
-                    el_sum_scores[idx][oxid_sum] = score
-                    el_best_oxid_combo[idx][oxid_sum] = oxid_combo
-
-        # Determine which combination of oxidation states for each element
-        #    is the most probable
-        all_sols = []  # will contain all solutions
-        all_oxid_combo = []  # will contain the best combination of oxidation states for each site
-        all_scores = []  # will contain a score for each solution
-        for x in product(*el_sums):
-            # each x is a trial of one possible oxidation sum for each element
-            if sum(x) == target_charge:  # charge balance condition
-                el_sum_sol = dict(zip(els, x))  # element->oxid_sum
-                # normalize oxid_sum by amount to get avg oxid state
-                sol = {el: v / el_amt[el] for el, v in el_sum_sol.items()}
-                # add the solution to the list of solutions
-                all_sols.append(sol)
-
-                # determine the score for this solution
-                score = 0
-                for idx, v in enumerate(x):
-                    score += el_sum_scores[idx][v]
-                all_scores.append(score)
-
-                # collect the combination of oxidation states for each site
-                all_oxid_combo.append(
-                    dict((e, el_best_oxid_combo[idx][v]) for idx, (e, v) in enumerate(zip(els, x))))
-
-        # sort the solutions by highest to lowest score
-        if all_scores:
-            all_sols, all_oxid_combo = zip(*[(y, x) for (z, y, x) in sorted(zip(all_scores, all_sols, all_oxid_combo),
-                                                                            key=lambda pair: pair[0],
-                                                                            reverse=True)])
-        return all_sols, all_oxid_combo
+                oxids.append(Element(el).icsd_oxidation_states or
+                             Element(el).oxidation_states)
+
+        # Guesses only depend on the analyzed stoichiometry and the allowed
+        # oxidation states, so repeated calls hit a bounded cache. Copies are
+        # returned since the solution dicts are mutable.
+        all_sols, all_oxid_combo = _get_oxid_state_guesses_cached(
+            tuple((el, int(amt)) for el, amt in el_amt.items()),
+            tuple(oxids), target_charge)
+        return (type(all_sols)(dict(d) for d in all_sols),
+                type(all_oxid_combo)(dict(d) for d in all_oxid_combo))
 
     @staticmethod
     def ranked_compositions_from_indeterminate_formula(fuzzy_formula,
@@ -1184,6 +1167,192 @@ def reduce_formula(sym_amt, iupac_ordering=False):
     return reduced_form, factor
 
 
+@lru_cache(maxsize=_FORMULA_CACHE_SIZE)
+def _parse_formula_cached(formula):
+    """
+    Interning cache for formula strings. Parses a formula and resolves the
+    symbols to Element/Specie objects once per distinct formula string.
+
+    Args:
+        formula (str): A string formula, e.g. Fe2O3, Li3Fe2(PO4)3
+
+    Returns:
+        Tuple of (Element/Specie, amount) pairs.
+    """
+    return tuple((get_el_sp(sym), amt)
+                 for sym, amt in Composition._parse_formula(formula).items())
+
+
+@lru_cache(maxsize=_FORMULA_CACHE_SIZE)
+def _reduce_formula_cached(sym_amt, iupac_ordering):
+    """
+    Cached version of reduce_formula for integer amounts, shared by all
+    Compositions with the same element amounts.
+
+    Args:
+        sym_amt (tuple): Sorted tuple of (symbol, amount) pairs.
+        iupac_ordering (bool): See reduce_formula.
+
+    Returns:
+        (reduced_formula, factor).
+    """
+    return reduce_formula(dict(sym_amt), iupac_ordering=iupac_ordering)
+
+
+def _get_oxi_sum_combos(oxids, probs, nsites):
+    """
+    Dynamic programming over the possible oxidation state sums of nsites
+    sites of one element. This replaces the enumeration of all
+    combinations_with_replacement(oxids, nsites), which grows
+    combinatorially with nsites, while giving the same results: for each
+    sum, the most probable combination (ties resolved in favor of the
+    combination enumerated first) and the order in which sums are first
+    encountered.
+
+    Combinations are represented as count vectors over oxids. Enumeration
+    order of combinations_with_replacement corresponds to descending
+    lexicographic order of the count vectors.
+
+    Args:
+        oxids ([int]): Allowed oxidation states.
+        probs ([float]): Score of each oxidation state.
+        nsites (int): Number of sites.
+
+    Returns:
+        (sums, {sum: oxid_combo}, {sum: score}), with sums in order of first
+        appearance.
+    """
+    # best[m][s] -> (score, counts) of the best combination of m sites with
+    # oxidation sum s, first[m][s] -> counts of the first one enumerated.
+    best = [{0: (0, ())}] + [{} for _ in range(nsites)]
+    first = [{0: ()}] + [{} for _ in range(nsites)]
+    for oxid, prob in zip(oxids, probs):
+        best = [{s: (score, counts + (0,))
+                 for s, (score, counts) in b.items()} for b in best]
+        first = [{s: counts + (0,) for s, counts in f.items()}
+                 for f in first]
+        for m in range(1, nsites + 1):
+            b, f = best[m], first[m]
+            for s, (score, counts) in best[m - 1].items():
+                cand = (score + prob, counts[:-1] + (counts[-1] + 1,))
+                old = b.get(s + oxid)
+                if old is None or cand[0] > old[0] or \
+                        (cand[0] == old[0] and cand[1] > old[1]):
+                    b[s + oxid] = cand
+            for s, counts in first[m - 1].items():
+                cand = counts[:-1] + (counts[-1] + 1,)
+                if cand > f.get(s + oxid, ()):
+                    f[s + oxid] = cand
+
+    sums = sorted(first[nsites], key=first[nsites].get, reverse=True)
+    prob_map = dict(zip(oxids, probs))
+    best_combos = {}
+    scores = {}
+    for s in sums:
+        combo = tuple(o for o, c in zip(oxids, best[nsites][s][1])
+                      for _ in range(c))
+        best_combos[s] = combo
+        # Rescored in enumeration order to match the summation exactly.
+        scores[s] = sum([prob_map[o] for o in combo])
+    return sums, best_combos, scores
+
+
+@lru_cache(maxsize=_OXI_GUESS_CACHE_SIZE)
+def _get_oxid_state_guesses_cached(el_amt, oxids, target_charge):
+    """
+    Bounded cache for Composition._get_oxid_state_guesses.
+
+    Args:
+        el_amt (tuple): ((symbol, integer amount), ...) of the composition
+            being analyzed.
+        oxids (tuple): Allowed oxidation states for each element in el_amt.
+        target_charge (int): The desired total charge.
+
+    Returns:
+        (all_sols, all_oxid_combo). See Composition._get_oxid_state_guesses.
+    """
+    els = [el for el, _ in el_amt]
+    amts = dict(el_amt)
+    el_sums = []  # matrix: dim1= el_idx, dim2=possible sums
+    el_sum_scores = []  # list of el_idx -> {sum: score}
+    el_best_oxid_combo = []  # list of el_idx -> {sum: best oxid combo}
+    for el, el_oxids in zip(els, oxids):
+        probs = [Composition.oxi_prob.get(Specie(el, o), 0) for o in el_oxids]
+        sums, combos, scores = _get_oxi_sum_combos(el_oxids, probs, amts[el])
+        el_sums.append(sums)
+        el_best_oxid_combo.append(combos)
+        el_sum_scores.append(scores)
+
+    # Determine which combination of oxidation states for each element
+    # is the most probable. The sum for the last element is fixed by the
+    # charge balance condition, so only the other elements are enumerated.
+    all_sols = []  # will contain all solutions
+    all_oxid_combo = []  # will contain the best combination of oxidation states for each site
+    all_scores = []  # will contain a score for each solution
+    if els:
+        for x in product(*el_sums[:-1]):
+            last = target_charge - sum(x)
+            if last not in el_sum_scores[-1]:
+                continue
+            x = x + (last,)
+            # normalize oxid_sum by amount to get avg oxid state
+            all_sols.append({el: v / amts[el] for el, v in zip(els, x)})
+            # determine the score for this solution
+            score = 0
+            for idx, v in enumerate(x):
+                score += el_sum_scores[idx][v]
+            all_scores.append(score)
+            # collect the combination of oxidation states for each site
+            all_oxid_combo.append(
+                {e: el_best_oxid_combo[idx][v] for idx, (e, v) in enumerate(zip(els, x))})
+
+    # sort the solutions by highest to lowest score
+    if all_scores:
+        all_sols, all_oxid_combo = zip(*[(y, x) for (z, y, x) in sorted(zip(all_scores, all_sols, all_oxid_combo),
+                                                                        key=lambda pair: pair[0],
+                                                                        reverse=True)])
+    return all_sols, all_oxid_combo
+
+
+def get_composition_matrix(compositions: Sequence[Composition],
+                           elements: Optional[Sequence] = None,
+                           fractional: bool = False):
+    """
+    Vectorized representation of a list of compositions, useful for bulk
+    operations (e.g., computing formation energies or hull coordinates for
+    many entries at once).
+
+    Args:
+        compositions ([Composition]): Compositions to tabulate.
+        elements ([Element/Specie]): Column ordering of the matrix. Species
+            not in elements are ignored. Defaults to all species present in
+            compositions, sorted by electronegativity.
+        fractional (bool): If True, rows are atomic fractions, i.e., the
+            values returned by Composition.get_atomic_fraction. Otherwise,
+            the (unreduced) amounts are returned.
+
+    Returns:
+        (elements, matrix), where matrix is a (len(compositions),
+        len(elements)) float array.
+    """
+    if elements is None:
+        elements = sorted(set(sp for comp in compositions for sp in comp),
+                          key=lambda sp: (sp.X, str(sp)))
+    else:
+        elements = [get_el_sp(el) for el in elements]
+    index = {el: i for i, el in enumerate(elements)}
+    matrix = np.zeros((len(compositions), len(elements)))
+    for i, comp in enumerate(compositions):
+        for sp, amt in comp.items():
+            j = index.get(sp)
+            if j is not None:
+                matrix[i, j] = amt
+    if fractional and len(compositions):
+        natoms = np.array([comp.num_atoms for comp in compositions])
+        matrix = np.abs(matrix) / natoms[:, None]
+    return elements, matrix
+
+
 class CompositionError(Exception):
     """Exception class for composition errors"""
 
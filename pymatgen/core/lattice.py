@@ -9,7 +9,7 @@ Defines the classes relating to 3D lattices.
 import math
 import itertools
 import warnings
-from functools import reduce
+from functools import reduce, lru_cache
 import collections
 
 from fractions import Fraction
@@ -487,9 +487,7 @@ class Lattice(MSONable):
         """
         :return: The matrix for LLL reduction
         """
-        if 0.75 not in self._lll_matrix_mappings:
-            self._lll_matrix_mappings[0.75] = self._calculate_lll()
-        return self._lll_matrix_mappings[0.75][0]
+        return self._get_lll(0.75)[0]
 
     @property
     def lll_mapping(self) -> np.ndarray:
@@ -497,16 +495,16 @@ class Lattice(MSONable):
         :return: The mapping between the LLL reduced lattice and the original
             lattice.
         """
-        if 0.75 not in self._lll_matrix_mappings:
-            self._lll_matrix_mappings[0.75] = self._calculate_lll()
-        return self._lll_matrix_mappings[0.75][1]
+        return self._get_lll(0.75)[1]
 
     @property
     def lll_inverse(self) -> np.ndarray:
         """
         :return: Inverse of self.lll_mapping.
         """
-        return np.linalg.inv(self.lll_mapping)
+        if self._lll_inverse is None:
+            self._lll_inverse = np.linalg.inv(self.lll_mapping)
+        return self._lll_inverse
 
     def __repr__(self):
         outs = [
@@ -576,6 +574,8 @@ class Lattice(MSONable):
             ltol: float = 1e-5,
             atol: float = 1,
             skip_rotation_matrix: bool = False,
+            sort_by_distortion: bool = False,
+            chunk_size: int = 2 ** 16,
     ) -> Iterator[Tuple["Lattice", Optional[np.ndarray], np.ndarray]]:
         """
         Finds all mappings between current lattice and another lattice.
@@ -587,6 +587,14 @@ class Lattice(MSONable):
             atol (float): Tolerance for matching angles. Defaults to 1.
             skip_rotation_matrix (bool): Whether to skip calculation of the
                 rotation matrix
+            sort_by_distortion (bool): Whether to yield the mappings in order
+                of increasing distortion, i.e. the relative Frobenius norm of
+                the difference between the metric tensors of the aligned and
+                the other lattice. This requires all candidates to be found
+                before the first one is yielded. Defaults to False, which
+                yields the mappings in order of the candidate vectors.
+            chunk_size (int): Maximum number of candidate (a, b, c)
+                combinations that are checked at once, to bound memory.
 
         Yields:
             (aligned_lattice, rotation_matrix, scale_matrix) if a mapping is
@@ -631,22 +639,42 @@ class Lattice(MSONable):
         betab = np.abs(get_angles(c_a, c_c, l_a, l_c) - beta) < atol
         gammab = np.abs(get_angles(c_a, c_b, l_a, l_b) - gamma) < atol
 
-        for i, all_j in enumerate(gammab):
-            inds = np.logical_and(
-                all_j[:, None], np.logical_and(alphab, betab[i][None, :])
-            )
-            for j, k in np.argwhere(inds):
-                scale_m = np.array((f_a[i], f_b[j], f_c[k]), dtype=np.int)  # type: ignore
-                if abs(np.linalg.det(scale_m)) < 1e-8:
-                    continue
-
-                aligned_m = np.array((c_a[i], c_b[j], c_c[k]))
-
-                if skip_rotation_matrix:
-                    rotation_m = None
-                else:
-                    rotation_m = np.linalg.solve(aligned_m, other_lattice.matrix)
-
+        def get_mappings():
+            # prune (a, b) pairs by gamma before forming the triples, and
+            # check the c vectors of a chunk of pairs at once. The chunks
+            # start small since often only the first mapping is needed
+            pairs = np.argwhere(gammab)
+            max_step = max(1, chunk_size // max(len(c_c), 1))
+            n, step = 0, 1
+            while n < len(pairs):
+                p, k = np.nonzero(np.logical_and(betab[pairs[n:n + step, 0]],
+                                                 alphab[pairs[n:n + step, 1]]))
+                i, j = pairs[n:n + step][p].T
+                n, step = n + step, min(2 * step, max_step)
+                scale_ms = np.stack((f_a[i], f_b[j], f_c[k]), axis=1).astype(int)
+                inds = np.abs(np.linalg.det(scale_ms)) >= 1e-8
+                i, j, k = i[inds], j[inds], k[inds]
+                yield np.stack((c_a[i], c_b[j], c_c[k]), axis=1), scale_ms[inds]
+
+        mappings = get_mappings()
+        if sort_by_distortion:
+            chunks = list(mappings)
+            aligned_ms = np.concatenate([np.zeros((0, 3, 3))] + [m[0] for m in chunks])
+            scale_ms = np.concatenate([np.zeros((0, 3, 3), dtype=int)] + [m[1] for m in chunks])
+            g = other_lattice.metric_tensor
+            distortion = np.linalg.norm(
+                np.matmul(aligned_ms, aligned_ms.transpose((0, 2, 1))) - g,
+                axis=(1, 2)) / np.linalg.norm(g)
+            order = np.argsort(distortion, kind="stable")
+            mappings = iter([(aligned_ms[order], scale_ms[order])])
+
+        for aligned_ms, scale_ms in mappings:
+            if skip_rotation_matrix or len(aligned_ms) == 0:
+                rotation_ms = [None] * len(aligned_ms)
+            else:
+                rotation_ms = np.linalg.solve(
+                    aligned_ms, np.broadcast_to(other_lattice.matrix, aligned_ms.shape))
+            for aligned_m, rotation_m, scale_m in zip(aligned_ms, rotation_ms, scale_ms):
                 yield Lattice(aligned_m), rotation_m, scale_m
 
     def find_mapping(
@@ -695,9 +723,18 @@ class Lattice(MSONable):
         :param delta: Delta parameter.
         :return: LLL reduced Lattice.
         """
+        return Lattice(self._get_lll(delta)[0])
+
+    def _get_lll(self, delta: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the memoized LLL reduced matrix and mapping for a delta. The
+        reduction is shared between all lattices with the same matrix, each
+        lattice keeps its own (writable) copy.
+        """
         if delta not in self._lll_matrix_mappings:
-            self._lll_matrix_mappings[delta] = self._calculate_lll()
-        return Lattice(self._lll_matrix_mappings[delta][0])
+            lll_matrix, mapping = _get_lll_reduction(self._matrix.tobytes(), delta)
+            self._lll_matrix_mappings[delta] = (lll_matrix.copy(), mapping.copy())
+        return self._lll_matrix_mappings[delta]
 
     def _calculate_lll(self, delta: float = 0.75) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -811,6 +848,13 @@ class Lattice(MSONable):
         Returns:
             Niggli-reduced lattice.
         """
+        return Lattice(_get_niggli_reduction(self._matrix.tobytes(), tol))
+
+    def _calculate_niggli(self, tol: float = 1e-5) -> "Lattice":
+        """
+        Performs the Niggli reduction without memoization. See
+        get_niggli_reduced_lattice.
+        """
         # lll reduction is more stable for skewed cells
         matrix = self.lll_matrix
         e = tol * self.volume ** (1 / 3)
@@ -1433,6 +1477,63 @@ class Lattice(MSONable):
         return recp_symmops
 
 
+@lru_cache(maxsize=1024)
+def _get_lll_reduction(matrix: bytes, delta: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memoized LLL reduction of a lattice matrix, which is passed as bytes to
+    be hashable. The returned arrays are read-only since they are shared by
+    all lattices with the same matrix.
+    """
+    lll_matrix, mapping = Lattice(np.frombuffer(matrix).reshape((3, 3)))._calculate_lll(delta)
+    lll_matrix.setflags(write=False)
+    mapping.setflags(write=False)
+    return lll_matrix, mapping
+
+
+@lru_cache(maxsize=1024)
+def _get_niggli_reduction(matrix: bytes, tol: float) -> np.ndarray:
+    """
+    Memoized Niggli reduction of a lattice matrix, which is passed as bytes
+    to be hashable.
+    """
+    niggli_matrix = Lattice(np.frombuffer(matrix).reshape((3, 3)))._calculate_niggli(tol).matrix
+    niggli_matrix.setflags(write=False)
+    return niggli_matrix
+
+
+def get_reduced_lattices(
+        lattices: Sequence[Union[Lattice, Sequence[Sequence[float]], np.ndarray]],
+        reduction_algo: str = "niggli", tol: float = 1e-5, delta: float = 0.75
+) -> List[Lattice]:
+    """
+    Reduces many lattices at once. Reductions are memoized by matrix, so
+    repeated lattices (e.g. the lattices of many copies or supercells of the
+    same structure) are only reduced once.
+
+    Args:
+        lattices: Sequence of Lattice objects or 3x3 matrices, e.g. a
+            (n, 3, 3) array.
+        reduction_algo (str): The lattice reduction algorithm to use.
+            Currently supported options are "niggli" or "LLL".
+        tol (float): The numerical tolerance for the Niggli reduction.
+        delta (float): Reduction parameter for the LLL reduction.
+
+    Returns:
+        List of reduced Lattice objects in the same order.
+    """
+    if reduction_algo not in ("niggli", "LLL"):
+        raise ValueError("Invalid reduction algo : {}".format(reduction_algo))
+    reduced = []
+    for latt in lattices:
+        matrix = np.array(latt.matrix if isinstance(latt, Lattice) else latt,
+                          dtype=np.float64).reshape((3, 3))
+        if reduction_algo == "niggli":
+            reduced.append(Lattice(_get_niggli_reduction(matrix.tobytes(), tol)))
+        else:
+            reduced.append(Lattice(_get_lll_reduction(matrix.tobytes(), delta)[0]))
+    return reduced
+
+
 def get_integer_index(miller_index: Sequence[float], round_dp: int = 4, verbose: bool = True) -> Tuple[int, int, int]:
     """
     Attempt to convert a vector of floats to whole numbers.
@@ -10,7 +10,8 @@ import warnings
 from io import open
 from pathlib import Path
 from enum import Enum
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict
+from functools import lru_cache
 from itertools import product, \
     combinations
 from collections import Counter
@@ -28,6 +29,13 @@ with open(str(Path(__file__).absolute().parent / "periodic_table.json"), "rt") a
 
 _pt_row_sizes = (2, 8, 8, 18, 18, 32, 32)
 
+# Numeric element property columns indexed by Z, built on first use.
+_pt_columns = {}  # type: Dict[str, np.ndarray]
+
+# Interned Specie/DummySpecie instances keyed by constructor arguments.
+_specie_cache = {}  # type: Dict[tuple, Specie]
+_CACHE_SIZE = 10000  # Max. number of interned species / parsed species strings
+
 
 class Element(Enum):
     """Enum representing an element in the periodic table."""
@@ -506,6 +514,9 @@ class Element(Enum):
                         except ValueError:
                             # Ignore error. val will just remain a string.
                             pass
+            # Elements are singletons, so the parsed value is stored as a
+            # regular attribute and __getattr__ is bypassed from now on.
+            setattr(self, item, val)
             return val
         raise AttributeError("Element has no attribute %s!" % item)
 
@@ -780,6 +791,7 @@ class Element(Enum):
         return self.symbol < other.symbol
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_Z(z: int):
         """
         Get an element from an atomic number.
@@ -1065,6 +1077,8 @@ class Specie(MSONable):
 
     supported_properties = ("spin",)
 
+    _str = None  # memoized string representation
+
     def __init__(self, symbol: str,
                  oxidation_state: float = 0.0,
                  properties: dict = None):
@@ -1206,22 +1220,26 @@ class Specie(MSONable):
             if m.group(4):
                 toks = m.group(4).replace(",", "").split("=")
                 properties = {toks[0]: float(toks[1])}
-            return Specie(sym, oxi, properties)
+            return _get_interned_specie(Specie, sym, oxi, properties)
         raise ValueError("Invalid Species String")
 
     def __repr__(self):
         return "Specie " + self.__str__()
 
     def __str__(self):
-        output = self.symbol
-        if self.oxi_state is not None:
-            if self.oxi_state >= 0:
-                output += formula_double_format(self.oxi_state) + "+"
-            else:
-                output += formula_double_format(-self.oxi_state) + "-"
-        for p, v in self._properties.items():
-            output += ",%s=%s" % (p, v)
-        return output
+        # Specie is immutable and __hash__ goes through __str__, so the
+        # string representation is only built once.
+        if self._str is None:
+            output = self.symbol
+            if self.oxi_state is not None:
+                if self.oxi_state >= 0:
+                    output += formula_double_format(self.oxi_state) + "+"
+                else:
+                    output += formula_double_format(-self.oxi_state) + "-"
+            for p, v in self._properties.items():
+                output += ",%s=%s" % (p, v)
+            self._str = output
+        return self._str
 
     def get_nmr_quadrupole_moment(self, isotope=None):
         """
@@ -1352,8 +1370,8 @@ class Specie(MSONable):
         :param d: Dict representation.
         :return: Specie.
         """
-        return cls(d["element"], d["oxidation_state"],
-                   d.get("properties", None))
+        return _get_interned_specie(cls, d["element"], d["oxidation_state"],
+                                    d.get("properties", None))
 
 
 class DummySpecie(Specie):
@@ -1513,7 +1531,7 @@ class DummySpecie(Specie):
             if m.group(4):
                 toks = m.group(4).split("=")
                 properties = {toks[0]: float(toks[1])}
-            return DummySpecie(sym, oxi, properties)
+            return _get_interned_specie(DummySpecie, sym, oxi, properties)
         raise ValueError("Invalid DummySpecies String")
 
     def as_dict(self):
@@ -1534,8 +1552,8 @@ class DummySpecie(Specie):
         :param d: Dict representation
         :return: DummySpecie
         """
-        return cls(d["element"], d["oxidation_state"],
-                   d.get("properties", None))
+        return _get_interned_specie(cls, d["element"], d["oxidation_state"],
+                                    d.get("properties", None))
 
     def __repr__(self):
         return "DummySpecie " + self.__str__()
@@ -1580,6 +1598,17 @@ def get_el_sp(obj):
     if isinstance(obj, (list, tuple)):
         return [get_el_sp(o) for o in obj]
 
+    # Unhashable objects raise a TypeError here, as they did in the parsing.
+    return _get_el_sp_cached(obj)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _get_el_sp_cached(obj):
+    """
+    Parses a hashable, non Element/Specie input of get_el_sp. Results are
+    cached, so that the species of e.g. a structure built from strings are
+    only parsed once per distinct string.
+    """
     try:
         c = float(obj)
         i = int(c)
@@ -1601,3 +1630,62 @@ def get_el_sp(obj):
             except Exception:
                 raise ValueError("Can't parse Element or String from type"
                                  " %s: %s." % (type(obj), obj))
+
+
+def _get_interned_specie(cls, symbol, oxidation_state, properties):
+    """
+    Returns a shared cls(symbol, oxidation_state, properties) instance.
+    Specie objects are immutable, so the many sites of a structure can share
+    the same object (and its memoized string representation and hash).
+
+    Args:
+        cls: Specie or DummySpecie.
+        symbol (str): Element or dummy symbol.
+        oxidation_state (float): Oxidation state.
+        properties (dict): Properties of the Specie. May be None.
+
+    Returns:
+        Interned instance of cls.
+    """
+    props = tuple(sorted(properties.items())) if properties else ()
+    key = (cls, symbol, type(oxidation_state), oxidation_state, props)
+    try:
+        sp = _specie_cache.get(key)
+    except TypeError:
+        # Unhashable property values cannot be interned.
+        return cls(symbol, oxidation_state, properties)
+    if sp is None:
+        if len(_specie_cache) >= _CACHE_SIZE:
+            _specie_cache.clear()
+        sp = cls(symbol, oxidation_state, dict(props) if props else None)
+        _specie_cache[key] = sp
+    return sp
+
+
+def get_el_property_array(prop: str) -> np.ndarray:
+    """
+    Returns a numeric element property as an array indexed by atomic number,
+    for vectorized lookups over many sites, e.g.,
+    get_el_property_array("atomic_mass")[structure.atomic_numbers]. Arrays
+    are built on first use and are read-only.
+
+    Args:
+        prop (str): Name of an Element attribute, e.g., "X", "atomic_mass",
+            "atomic_radius" or "mendeleev_no".
+
+    Returns:
+        Float array of length 119. Index 0 and elements without (numeric)
+        data for prop are NaN.
+    """
+    if prop not in _pt_columns:
+        col = np.full(len(Element) + 1, np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for el in Element:
+                try:
+                    col[el.Z] = float(getattr(el, prop))
+                except (TypeError, ValueError):
+                    pass
+        col.flags.writeable = False
+        _pt_columns[prop] = col
+    return _pt_columns[prop]
@@ -25,7 +25,7 @@ from tabulate import tabulate
 
 from monty.dev import deprecated
 from monty.io import zopen
-from monty.json import MSONable
+from monty.json import MSONable, MontyDecoder
 
 from pymatgen.core.operations import SymmOp
 from pymatgen.core.lattice import Lattice, get_points_in_spheres
@@ -35,6 +35,8 @@ from pymatgen.core.bonds import CovalentBond, get_bond_length
 from pymatgen.core.composition import Composition
 from pymatgen.util.coord import get_angle, all_distances, \
     lattice_points_in_supercell
+from pymatgen.util.coord_cython import is_coord_subset_pbc  # type: ignore
+from pymatgen.util.serialization import decode_array
 from pymatgen.core.units import Mass, Length
 
 
@@ -825,8 +827,8 @@ class IStructure(SiteCollection, MSONable):
         all_sp = []  # type: List[Union[str, Element, Specie, DummySpecie, Composition]]
         all_coords = []  # type: List[List[float]]
         all_site_properties = collections.defaultdict(list)  # type: Dict[str, List]
-        for i, (sp, c) in enumerate(zip(species, frac_coords)):
-            cc = sgp.get_orbit(c, tol=tol)
+        orbits = sgp.get_orbits(frac_coords, tol=tol)
+        for i, (sp, cc) in enumerate(zip(species, orbits)):
             all_sp.extend([sp] * len(cc))
             all_coords.extend(cc)
             for k, v in props.items():
@@ -1069,6 +1071,14 @@ class IStructure(SiteCollection, MSONable):
             you prefer a subclass to return its own type, you need to override
             this method in the subclass.
         """
+        return self._get_supercell(scaling_matrix)
+
+    def _get_supercell(self, scaling_matrix, to_unit_cell=False):
+        """
+        Builds a supercell (see __mul__) by broadcasting the site coordinates
+        over all lattice points at once and repeating the species and site
+        properties, so that each new site is only created once.
+        """
         scale_matrix = np.array(scaling_matrix, np.int16)
         if scale_matrix.shape != (3, 3):
             scale_matrix = np.array(scale_matrix * np.eye(3), np.int16)
@@ -1076,19 +1086,22 @@ class IStructure(SiteCollection, MSONable):
 
         f_lat = lattice_points_in_supercell(scale_matrix)
         c_lat = new_lattice.get_cartesian_coords(f_lat)
-
-        new_sites = []
-        for site in self:
-            for v in c_lat:
-                s = PeriodicSite(
-                    site.species, site.coords + v,
-                    new_lattice, properties=site.properties,
-                    coords_are_cartesian=True, to_unit_cell=False,
-                    skip_checks=True)
-                new_sites.append(s)
+        n_lat = len(c_lat)
+
+        cart_coords = self._lattice.get_cartesian_coords(np.reshape(self.frac_coords, (-1, 3)))
+        new_coords = new_lattice.get_fractional_coords(
+            (cart_coords[:, None, :] + c_lat[None, :, :]).reshape((-1, 3)))
+        new_species = [sp for sp in self.species_and_occu for _ in range(n_lat)]
+        new_props = {}
+        for k, v in self.site_properties.items():
+            if any(vv is None for vv in v):
+                warnings.warn("Not all sites have property %s. Missing values "
+                              "are set to None." % k)
+            new_props[k] = [vv for vv in v for _ in range(n_lat)]
 
         new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge)
+        return Structure(new_lattice, new_species, new_coords, charge=new_charge,
+                         to_unit_cell=to_unit_cell, site_properties=new_props)
 
     def __rmul__(self, scaling_matrix):
         """
@@ -1864,6 +1877,27 @@ class IStructure(SiteCollection, MSONable):
             np.abs(d, d)
             return fc1[np.any(np.all(d < tol, axis=-1), axis=-1)]
 
+        def pbc_coord_translations(vecs, fcoords, tol):
+            """
+            Returns the vectors in vecs that map every coordinate in fcoords
+            to within tolerance of some coordinate in fcoords
+            """
+            fcoords = np.array(fcoords, dtype=np.float64)
+            atol = np.full(3, tol)
+            mask = np.zeros((len(fcoords), len(fcoords)), dtype=np.int_)
+            return vecs[[is_coord_subset_pbc(fcoords + v, fcoords, atol, mask)
+                         for v in vecs]]
+
+        def in_min_vecs(vecs):
+            """
+            Returns whether each of the vectors is within tolerance of some
+            vector in min_vecs
+            """
+            dist = vecs[..., None, :] - min_vecs
+            dist -= np.round(dist)
+            np.abs(dist, dist)
+            return np.any(np.all(dist < super_ftol, axis=-1), axis=-1)
+
         # here we reduce the number of min_vecs by enforcing that every
         # vector in min_vecs approximately maps each site onto a similar site.
         # The subsequent processing is O(fu^3 * min_vecs) = O(n^4) if we do no
@@ -1871,35 +1905,41 @@ class IStructure(SiteCollection, MSONable):
         # This reduction is O(n^3) so usually is an improvement. Using double
         # the tolerance because both vectors are approximate
         for g in sorted(grouped_fcoords, key=lambda x: len(x)):
-            for f in g:
-                min_vecs = pbc_coord_intersection(min_vecs, g - f, super_ftol_2)
+            min_vecs = pbc_coord_translations(min_vecs, g, super_ftol_2)
 
         def get_hnf(fu):
             """
             Returns all possible distinct supercell matrices given a
-            number of formula units in the supercell. Batches the matrices
-            by the values in the diagonal (for less numpy overhead).
-            Computational complexity is O(n^3), and difficult to improve.
-            Might be able to do something smart with checking combinations of a
-            and b first, though unlikely to reduce to O(n^2).
+            number of formula units in the supercell, whose inverse rows
+            (the lattice vectors of the smaller cell) are all present in
+            min_vecs. Batches the matrices by the values in the diagonal (for
+            less numpy overhead). The rows of the inverse of the upper
+            triangular matrices depend on (g), (e, f, g) and (a, b, c, e, f, g)
+            respectively, so candidates are pruned row by row before the
+            full set of matrices is built.
             """
-
-            def factors(n):
-                for i in range(1, n + 1):
-                    if n % i == 0:
-                        yield i
-
-            for det in factors(fu):
-                if det == 1:
+            for det in range(2, fu + 1):
+                if fu % det:
                     continue
-                for a in factors(det):
-                    for e in factors(det // a):
+                for a in range(1, det + 1):
+                    if det % a:
+                        continue
+                    for e in range(1, det // a + 1):
+                        if (det // a) % e:
+                            continue
                         g = det // a // e
-                        yield det, np.array(
+                        if not in_min_vecs(np.array([0, 0, 1 / g])):
+                            continue
+                        fs = np.arange(e)
+                        fs = fs[in_min_vecs(np.stack([np.zeros(e), np.full(e, 1 / e),
+                                                      -fs / (e * g)], axis=1))]
+                        if len(fs) == 0:
+                            continue
+                        ms = np.array(
                             [[[a, b, c], [0, e, f], [0, 0, g]]
                              for b, c, f in
-                             itertools.product(range(a), range(a),
-                                               range(e))])
+                             itertools.product(range(a), range(a), fs)])
+                        yield det, ms
 
         # we cant let sites match to their neighbors in the supercell
         grouped_non_nbrs = []
@@ -1917,12 +1957,7 @@ class IStructure(SiteCollection, MSONable):
             inv_ms = np.linalg.inv(ms)
 
             # find sets of lattice vectors that are are present in min_vecs
-            dist = inv_ms[:, :, None, :] - min_vecs[None, None, :, :]
-            dist -= np.round(dist)
-            np.abs(dist, dist)
-            is_close = np.all(dist < super_ftol, axis=-1)
-            any_close = np.any(is_close, axis=-1)
-            inds = np.all(any_close, axis=-1)
+            inds = np.all(in_min_vecs(inv_ms), axis=-1)
 
             for inv_m, m in zip(inv_ms[inds], ms[inds]):
                 new_m = np.dot(inv_m, self.lattice.matrix)
@@ -1949,29 +1984,27 @@ class IStructure(SiteCollection, MSONable):
                         valid = False
                         break
 
-                    # check that groups are all cliques
-                    for g in groups:
-                        if not np.all(groups[g][:, g]):
-                            valid = False
-                            break
-                    if not valid:
+                    # check that groups are all cliques. groups is symmetric
+                    # and every site has the same number of neighbours, so
+                    # this is the case if neighbouring sites share all of
+                    # their neighbours
+                    shared = np.dot(groups.astype(np.float64), groups)
+                    if not np.all(shared[groups] == size):
+                        valid = False
                         break
 
                     # add the new sites, averaging positions
-                    added = np.zeros(len(gsites))
                     new_fcoords = all_frac % 1
-                    for i, group in enumerate(groups):
-                        if not added[i]:
-                            added[group] = True
-                            inds = np.where(group)[0]
-                            coords = new_fcoords[inds[0]]
-                            for n, j in enumerate(inds[1:]):
-                                offset = new_fcoords[j] - coords
-                                coords += (offset - np.round(offset)) / (n + 2)
-                            new_sp.append(gsites[inds[0]].species)
-                            for k in gsites[inds[0]].properties:
-                                new_props[k].append(gsites[inds[0]].properties[k])
-                            new_coords.append(coords)
+                    first = np.argmax(groups, axis=1)
+                    offsets = new_fcoords - new_fcoords[first]
+                    offsets -= np.round(offsets)
+                    mean_offsets = np.zeros_like(new_fcoords)
+                    np.add.at(mean_offsets, first, offsets / size)
+                    for i in np.unique(first):
+                        new_sp.append(gsites[i].species)
+                        for k in gsites[i].properties:
+                            new_props[k].append(gsites[i].properties[k])
+                        new_coords.append(new_fcoords[i] + mean_offsets[i])
 
                 if valid:
                     inv_m = np.linalg.inv(m)
@@ -2053,7 +2086,11 @@ class IStructure(SiteCollection, MSONable):
                 object.
             fmt (str): Specifies a format for the dict. Defaults to None,
                 which is the default format used in pymatgen. Other options
-                include "abivars".
+                include "abivars" and "columnar". The "columnar" format
+                stores the unique species once, together with an array of
+                species indices, an array of fractional coordinates and the
+                site properties, which is much faster to create and parse
+                than the per-site dicts. Arrays are kept as numpy arrays.
             **kwargs: Allow passing of other kwargs needed for certain
             formats, e.g., "abivars".
 
@@ -2069,6 +2106,33 @@ class IStructure(SiteCollection, MSONable):
         del latt_dict["@module"]
         del latt_dict["@class"]
 
+        if fmt == "columnar":
+            species = []
+            species_indices = []
+            unique_species = {}  # type: Dict[tuple, int]
+            for site in self:
+                key = tuple(site.species.items())
+                if key not in unique_species:
+                    unique_species[key] = len(species)
+                    species_list = []
+                    for spec, occu in key:
+                        sp_dict = spec.as_dict()
+                        del sp_dict["@module"]
+                        del sp_dict["@class"]
+                        sp_dict["occu"] = occu
+                        species_list.append(sp_dict)
+                    species.append(species_list)
+                species_indices.append(unique_species[key])
+            return {"@module": self.__class__.__module__,
+                    "@class": self.__class__.__name__,
+                    "fmt": "columnar",
+                    "charge": self._charge,
+                    "lattice": latt_dict,
+                    "species": species,
+                    "species_indices": np.array(species_indices, dtype=int),
+                    "frac_coords": self.frac_coords,
+                    "properties": self.site_properties}
+
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__,
              "charge": self._charge,
@@ -2089,6 +2153,9 @@ class IStructure(SiteCollection, MSONable):
 
         Args:
             d (dict): Dict representation of structure.
+            fmt (str): Format of the dict. Defaults to None, the default
+                pymatgen format, or "columnar" if the dict says so. Other
+                options include "abivars".
 
         Returns:
             Structure object
@@ -2097,11 +2164,42 @@ class IStructure(SiteCollection, MSONable):
             from pymatgen.io.abinit.abiobjects import structure_from_abivars
             return structure_from_abivars(cls=cls, **d)
 
+        if (fmt or d.get("fmt")) == "columnar":
+            return cls._from_columnar_dict(d)
+
         lattice = Lattice.from_dict(d["lattice"])
         sites = [PeriodicSite.from_dict(sd, lattice) for sd in d["sites"]]
         charge = d.get("charge", None)
         return cls.from_sites(sites, charge=charge)
 
+    @classmethod
+    def _from_columnar_dict(cls, d):
+        """
+        Reconstitute a Structure from the dict created by
+        as_dict(fmt="columnar").
+        """
+        unique_species = []
+        for species_list in d["species"]:
+            species = {}
+            for sp_occu in species_list:
+                if "oxidation_state" in sp_occu and Element.is_valid_symbol(
+                        sp_occu["element"]):
+                    sp = Specie.from_dict(sp_occu)
+                elif "oxidation_state" in sp_occu:
+                    sp = DummySpecie.from_dict(sp_occu)
+                else:
+                    sp = Element(sp_occu["element"])
+                species[sp] = sp_occu["occu"]
+            unique_species.append(Composition(species))
+        species_indices = decode_array(d["species_indices"], dtype=int)
+        dec = MontyDecoder()
+        props = {k: dec.process_decoded(v)
+                 for k, v in (d.get("properties") or {}).items()}
+        return cls(Lattice.from_dict(d["lattice"]),
+                   [unique_species[i] for i in species_indices],
+                   decode_array(d["frac_coords"], dtype=float),
+                   charge=d.get("charge", None), site_properties=props)
+
     def to(self, fmt=None, filename=None, **kwargs):
         r"""
         Outputs the structure to a file or string.
@@ -3465,10 +3563,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                    same factor.
             to_unit_cell: Whether or not to fall back sites into the unit cell
         """
-        s = self * scaling_matrix
-        if to_unit_cell:
-            for site in s:
-                site.to_unit_cell(in_place=True)
+        s = self._get_supercell(scaling_matrix, to_unit_cell=to_unit_cell)
         self._sites = s.sites
         self._lattice = s.lattice
 
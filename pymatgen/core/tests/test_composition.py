@@ -22,7 +22,7 @@ import unittest
 
 from pymatgen.core.periodic_table import Element, Specie
 from pymatgen.core.composition import Composition, CompositionError, \
-    ChemicalPotential
+    ChemicalPotential, get_composition_matrix
 
 import random
 
@@ -251,6 +251,32 @@ class CompositionTest(PymatgenTest):
             self.assertEqual(self.comp[i].anonymized_formula,
                              expected_formulas[i])
 
+    def test_memoization(self):
+        c = Composition("Li4Fe4P4O16")
+        self.assertEqual(c.reduced_formula, "LiFePO4")
+        self.assertIs(c.get_reduced_formula_and_factor(),
+                      c.get_reduced_formula_and_factor())
+        self.assertEqual(c.get_reduced_formula_and_factor(
+            iupac_ordering=True), ("LiFePO4", 4))
+        self.assertIs(c.weight, c.weight)
+        self.assertEqual(c.anonymized_formula, "ABCD4")
+        self.assertEqual(hash(c), hash(Composition("LiFePO4")))
+        # Interned formulas give equal but independent compositions.
+        c2 = Composition("Li4Fe4P4O16")
+        self.assertEqual(c, c2)
+        self.assertIsNot(c._data, c2._data)
+        self.assertRaises(CompositionError, Composition, "Li4Fe4P4O16)")
+
+    def test_get_composition_matrix(self):
+        comps = [Composition("Fe2O3"), Composition("Li2O"), Composition("O2")]
+        els, m = get_composition_matrix(comps)
+        self.assertEqual(els, [Element("Li"), Element("Fe"), Element("O")])
+        self.assertArrayAlmostEqual(m, [[0, 2, 3], [2, 0, 1], [0, 0, 2]])
+        els, m = get_composition_matrix(comps, ["O", "Fe"], fractional=True)
+        self.assertEqual(els, [Element("O"), Element("Fe")])
+        self.assertArrayAlmostEqual(
+            m, [[c.get_atomic_fraction(el) for el in els] for c in comps])
+
     def test_get_wt_fraction(self):
         correct_wt_frac = {"Li": 0.0498841610868, "Fe": 0.267567687258,
                            "P": 0.222604831158, "O": 0.459943320496}
@@ -474,6 +500,21 @@ class CompositionTest(PymatgenTest):
         self.assertRaises(ValueError, Composition("V2O3").
                           oxi_state_guesses, max_sites=1)
 
+    def test_oxi_state_guesses_large_and_cached(self):
+        # Many sites per element used to blow up the enumeration of
+        # oxidation state combinations.
+        guesses = Composition("Fe60O80").oxi_state_guesses()
+        self.assertEqual(len(guesses), 1)
+        self.assertAlmostEqual(guesses[0]["Fe"], 8 / 3)
+        decorated = Composition("Fe60O80").add_charges_from_oxi_state_guesses()
+        self.assertEqual(decorated[Specie("Fe", 2)], 20)
+        self.assertEqual(decorated[Specie("Fe", 3)], 40)
+
+        # Cached results are copies, so mutating them is safe.
+        guesses[0]["Fe"] = 0
+        self.assertAlmostEqual(
+            Composition("Fe60O80").oxi_state_guesses()[0]["Fe"], 8 / 3)
+
     def test_oxi_state_decoration(self):
         # Basic test: Get compositions where each element is in a single charge state
         decorated = Composition("H2O").add_charges_from_oxi_state_guesses()
@@ -4,7 +4,8 @@
 
 
 import itertools
-from pymatgen.core.lattice import Lattice, get_points_in_spheres
+from pymatgen.core.lattice import Lattice, get_points_in_spheres, \
+    get_reduced_lattices
 import numpy as np
 from pymatgen.util.testing import PymatgenTest
 from pymatgen.core.operations import SymmOp
@@ -245,6 +246,35 @@ class LatticeTestCase(PymatgenTest):
         self.assertArrayAlmostEqual(latt.get_niggli_reduced_lattice().matrix,
                                     np.array(ans), 5)
 
+    def test_get_reduced_lattices(self):
+        latt = Lattice.from_parameters(7.365450, 6.199506, 5.353878,
+                                       75.542191, 81.181757, 156.396627)
+        skewed = Lattice([1.0, 1, 1, -1.0, 0, 2, 3.0, 5, 6])
+        niggli = get_reduced_lattices([latt, skewed.matrix, latt])
+        self.assertEqual(len(niggli), 3)
+        self.assertArrayAlmostEqual(niggli[0].matrix,
+                                    latt.get_niggli_reduced_lattice().matrix)
+        self.assertArrayAlmostEqual(niggli[1].matrix,
+                                    skewed.get_niggli_reduced_lattice().matrix)
+        self.assertArrayAlmostEqual(niggli[2].matrix, niggli[0].matrix)
+        lll = get_reduced_lattices(np.array([skewed.matrix]),
+                                   reduction_algo="LLL")
+        self.assertArrayAlmostEqual(lll[0].matrix, skewed.lll_matrix)
+        self.assertRaises(ValueError, get_reduced_lattices, [latt],
+                          reduction_algo="foo")
+
+        # reductions are shared by lattices with the same matrix and
+        # respect the delta parameter
+        copy = Lattice(skewed.matrix)
+        self.assertArrayEqual(copy.lll_matrix, skewed.lll_matrix)
+        copy.lll_matrix[0] = 0
+        self.assertArrayEqual(Lattice(skewed.matrix).lll_matrix,
+                              skewed.lll_matrix)
+        self.assertArrayAlmostEqual(copy.lll_inverse,
+                                    np.linalg.inv(copy.lll_mapping))
+        self.assertAlmostEqual(skewed.get_lll_reduced_lattice(0.99).volume,
+                               skewed.volume)
+
     def test_find_mapping(self):
         m = np.array([[0.1, 0.2, 0.3], [-0.1, 0.2, 0.7], [0.6, 0.9, 0.2]])
         latt = Lattice(m)
@@ -290,6 +320,35 @@ class LatticeTestCase(PymatgenTest):
         for l, _, _ in latt.find_all_mappings(latt, ltol=0.05, atol=11):
             self.assertTrue(isinstance(l, Lattice))
 
+    def test_find_all_mappings_sort_by_distortion(self):
+        latt = Lattice.cubic(4)
+        latt2 = Lattice.orthorhombic(4.05, 4, 3.95)
+        mappings = list(latt.find_all_mappings(latt2, ltol=0.05, atol=5))
+        # small chunks give the same mappings in the same order
+        chunked = list(latt.find_all_mappings(latt2, ltol=0.05, atol=5,
+                                              chunk_size=1))
+        self.assertEqual(len(chunked), len(mappings))
+        for m1, m2 in zip(mappings, chunked):
+            self.assertArrayAlmostEqual(m1[0].matrix, m2[0].matrix)
+            self.assertArrayAlmostEqual(m1[1], m2[1])
+            self.assertArrayEqual(m1[2], m2[2])
+
+        sorted_mappings = list(latt.find_all_mappings(
+            latt2, ltol=0.05, atol=5, sort_by_distortion=True,
+            skip_rotation_matrix=True))
+        self.assertEqual(len(sorted_mappings), len(mappings))
+        distortion = [np.linalg.norm(l.metric_tensor - latt2.metric_tensor)
+                      for l, _, _ in sorted_mappings]
+        self.assertTrue(np.all(np.diff(distortion) >= -1e-8))
+        self.assertIsNone(sorted_mappings[0][1])
+        # the lattice vectors closest in length are assigned first
+        self.assertArrayAlmostEqual(sorted_mappings[0][0].abc, [4, 4, 4])
+        self.assertEqual(abs(np.linalg.det(sorted_mappings[0][2])), 1)
+
+        latt = Lattice.cubic(1)
+        self.assertEqual(list(latt.find_all_mappings(
+            Lattice.orthorhombic(1, 1.5, 1.2), sort_by_distortion=True)), [])
+
     def test_mapping_symmetry(self):
         l = Lattice.cubic(1)
         l2 = Lattice.orthorhombic(1.1001, 1, 1)
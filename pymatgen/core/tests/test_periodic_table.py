@@ -10,7 +10,8 @@ import math
 import numpy as np
 
 from pymatgen.util.testing import PymatgenTest
-from pymatgen.core.periodic_table import Element, Specie, DummySpecie, get_el_sp
+from pymatgen.core.periodic_table import Element, Specie, DummySpecie, \
+    get_el_sp, get_el_property_array
 from pymatgen.core.composition import Composition
 from copy import deepcopy
 
@@ -393,7 +394,7 @@ class DummySpecieTestCase(unittest.TestCase):
         self.assertTrue(DummySpecie("X", 3) < DummySpecie("X", 4))
 
 
-class FuncTest(unittest.TestCase):
+class FuncTest(PymatgenTest):
 
     def test_get_el_sp(self):
         self.assertEqual(get_el_sp("Fe2+"), Specie("Fe", 2))
@@ -405,6 +406,40 @@ class FuncTest(unittest.TestCase):
         self.assertEqual(get_el_sp(["Li+", "Mn3+"]),
                          [Specie("Li", 1), Specie("Mn", 3)])
 
+    def test_interning(self):
+        # Parsed species are shared instances.
+        self.assertIs(get_el_sp("Fe2+"), get_el_sp("Fe2+"))
+        self.assertIs(Specie.from_string("Fe2+,spin=4"),
+                      Specie.from_string("Fe2+,spin=4"))
+        self.assertIs(Specie.from_dict(Specie("O", -2).as_dict()),
+                      Specie.from_dict(Specie("O", -2).as_dict()))
+        self.assertIs(DummySpecie.from_string("X2+"),
+                      DummySpecie.from_string("X2+"))
+        self.assertIsNot(Specie.from_string("Fe2+"),
+                         Specie.from_string("Fe3+"))
+        self.assertEqual(str(Specie.from_dict({"element": "Fe",
+                                               "oxidation_state": 2.5})),
+                         "Fe2.5+")
+        # Unhashable inputs still raise a TypeError.
+        self.assertRaises(TypeError, get_el_sp, {"Fe": 1})
+        self.assertRaises(ValueError, get_el_sp, "Fe2+,foo=1")
+        self.assertEqual(Element.from_Z(26), Element.Fe)
+        self.assertRaises(ValueError, Element.from_Z, 200)
+
+    def test_get_el_property_array(self):
+        masses = get_el_property_array("atomic_mass")
+        self.assertEqual(len(masses), 119)
+        self.assertTrue(np.isnan(masses[0]))
+        self.assertAlmostEqual(masses[26], Element.Fe.atomic_mass)
+        self.assertArrayAlmostEqual(
+            get_el_property_array("X")[[3, 8]],
+            [Element.Li.X, Element.O.X])
+        self.assertTrue(np.isnan(get_el_property_array("X")[2]))
+        self.assertAlmostEqual(get_el_property_array("mendeleev_no")[1],
+                               Element.H.mendeleev_no)
+        self.assertRaises(ValueError, masses.__setitem__, 1, 0)
+        self.assertRaises(AttributeError, get_el_property_array, "foo")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,7 +7,9 @@ from pathlib import Path
 import warnings
 import random
 import os
+import json
 import numpy as np
+from monty.json import MontyEncoder, MontyDecoder
 
 from pymatgen.util.testing import PymatgenTest
 from pymatgen.core.periodic_table import Element, Specie
@@ -133,6 +135,25 @@ class IStructureTest(PymatgenTest):
         self.assertNotIn("volume", d['lattice'])
         self.assertNotIn("xyz", d['sites'][0])
 
+    def test_to_from_dict_columnar(self):
+        s = IStructure(self.lattice, [{Specie('O', -2, properties={"spin": 3}): 1.0},
+                                      {Specie('Mg', 2): 0.8},
+                                      {Specie('O', -2, properties={"spin": 3}): 1.0}],
+                       [[0, 0, 0], [0.75, 0.5, 0.75], [0.5, 0.5, 0.5]],
+                       site_properties={'magmom': [5, -5, 0]})
+        d = s.as_dict(fmt="columnar")
+        self.assertEqual(len(d["species"]), 2)
+        self.assertArrayEqual(d["species_indices"], [0, 1, 0])
+        self.assertIsInstance(d["frac_coords"], np.ndarray)
+        s3 = json.loads(json.dumps(d, cls=MontyEncoder), cls=MontyDecoder)
+        self.assertEqual(s3, s)
+        for d in [d, json.loads(json.dumps(d, cls=MontyEncoder))]:
+            s2 = IStructure.from_dict(d)
+            self.assertEqual(s2, s)
+            self.assertEqual(s2.site_properties, s.site_properties)
+            self.assertEqual(s2[0].specie.spin, 3)
+            self.assertAlmostEqual(s2[1].species["Mg2+"], 0.8)
+
     def test_from_dict(self):
 
         d = self.propertied_structure.as_dict()
@@ -342,6 +363,18 @@ class IStructureTest(PymatgenTest):
         self.assertEqual(len(fcc_ag_prim), 1)
         self.assertAlmostEqual(fcc_ag_prim.volume, 17.10448225)
 
+        s = Structure(Lattice.from_parameters(3, 4, 5, 80, 85, 95),
+                      ["Fe", "Co"], [[0, 0, 0], [0.3, 0.4, 0.6]],
+                      site_properties={"magmom": [1, -1]})
+        sc = s * (3, 5, 4)
+        sc.perturb(0.001)
+        prim = sc.get_primitive_structure(tolerance=0.01)
+        self.assertEqual(len(prim), 2)
+        self.assertAlmostEqual(prim.volume, s.volume)
+        self.assertEqual(sorted(prim.site_properties["magmom"]), [-1, 1])
+        self.assertAlmostEqual(prim.get_distance(0, 1), s.get_distance(0, 1),
+                               2)
+
     def test_primitive_positions(self):
         coords = [[0, 0, 0], [0.3, 0.35, 0.45]]
         s = Structure(Lattice.from_parameters(1, 2, 3, 50, 66, 88), ["Ag"] * 2,
@@ -830,6 +863,25 @@ class StructureTest(PymatgenTest):
         self.assertArrayAlmostEqual(self.structure.lattice.abc,
                                     [15.360792, 35.195996, 7.680396], 5)
 
+    def test_make_supercell_site_properties(self):
+        s = Structure(Lattice.cubic(3), ["Fe", "O"],
+                      [[0, 0, 0], [0.5, 0.5, 1.5]],
+                      site_properties={"magmom": [5, [0, 0, 1]]}, charge=1)
+        sc = s * [2, 1, 1]
+        self.assertEqual(sc.site_properties["magmom"],
+                         [5, 5, [0, 0, 1], [0, 0, 1]])
+        self.assertEqual(sc.charge, 2)
+        self.assertArrayAlmostEqual(sc.frac_coords, [[0, 0, 0], [0.5, 0, 0],
+                                                     [0.25, 0.5, 1.5],
+                                                     [0.75, 0.5, 1.5]])
+        s.make_supercell([[1, 1, 0], [0, 1, 0], [0, 0, 2]])
+        self.assertEqual(s.formula, "Fe2 O2")
+        self.assertEqual(s.site_properties["magmom"],
+                         [5, 5, [0, 0, 1], [0, 0, 1]])
+        self.assertTrue(np.all((s.frac_coords >= 0) & (s.frac_coords < 1)))
+        self.assertArrayAlmostEqual(s.cart_coords[2:], [[1.5, 1.5, 4.5],
+                                                        [1.5, 1.5, 1.5]])
+
     def test_disordered_supercell_primitive_cell(self):
         l = Lattice.cubic(2)
         f = [[0.5, 0.5, 0.5]]
@@ -20,6 +20,7 @@ from pymatgen.core.lattice import Lattice
 from pymatgen.electronic_structure.core import Spin, Orbital
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.util.coord import pbc_diff
+from pymatgen.util.serialization import decode_array
 
 __author__ = "Geoffroy Hautier, Shyue Ping Ong, Michael Kocher"
 __copyright__ = "Copyright 2012, The Materials Project"
@@ -538,18 +539,20 @@ class BandStructure:
         if all_kpts is not None:
             return len(all_kpts)
 
-    def as_dict(self):
+    def as_dict(self, fmt=None):
         """
-        Json-serializable dict representation of BandStructureSymmLine.
+        Json-serializable dict representation of BandStructure.
+
+        Args:
+            fmt (str): None (default) for the standard format or "columnar"
+                for a compact format in which the k-points, eigenvalues and
+                projections are kept as numpy arrays and the structure is
+                written with Structure.as_dict(fmt="columnar").
         """
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__,
-             "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi,
-             "kpoints": []}
-        # kpoints are not kpoint objects dicts but are frac coords (this makes
-        # the dict smaller and avoids the repetition of the lattice
-        for k in self.kpoints:
-            d["kpoints"].append(k.as_dict()["fcoords"])
+             "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi}
+        d["kpoints"] = self._kpoints_as_list(fmt)
         d["bands"] = {str(int(spin)): self.bands[spin]
                       for spin in self.bands}
         d["is_metal"] = self.is_metal()
@@ -574,11 +577,24 @@ class BandStructure:
             d['labels_dict'][c] = self.labels_dict[c].as_dict()['fcoords']
         d['projections'] = {}
         if len(self.projections) != 0:
-            d['structure'] = self.structure.as_dict()
-            d['projections'] = {str(int(spin)): np.array(v).tolist()
-                                for spin, v in self.projections.items()}
+            d['structure'] = self.structure.as_dict(fmt=fmt)
+            d['projections'] = self._projections_as_list(fmt)
         return d
 
+    def _kpoints_as_list(self, fmt=None):
+        # kpoints are not kpoint objects dicts but are frac coords (this makes
+        # the dict smaller and avoids the repetition of the lattice
+        if fmt == "columnar":
+            return np.array([k.frac_coords for k in self.kpoints])
+        return [k.as_dict()["fcoords"] for k in self.kpoints]
+
+    def _projections_as_list(self, fmt=None):
+        if fmt == "columnar":
+            return {str(int(spin)): np.asarray(v)
+                    for spin, v in self.projections.items()}
+        return {str(int(spin)): np.array(v).tolist()
+                for spin, v in self.projections.items()}
+
     @classmethod
     def from_dict(cls, d):
         """
@@ -593,19 +609,16 @@ class BandStructure:
         labels_dict = d['labels_dict']
         projections = {}
         structure = None
-        if isinstance(list(d['bands'].values())[0], dict):
-            eigenvals = {Spin(int(k)): np.array(d['bands'][k]['data'])
-                         for k in d['bands']}
-        else:
-            eigenvals = {Spin(int(k)): d['bands'][k] for k in d['bands']}
+        eigenvals = {Spin(int(k)): decode_array(d['bands'][k])
+                     for k in d['bands']}
         if 'structure' in d:
             structure = Structure.from_dict(d['structure'])
         if d.get('projections'):
-            projections = {Spin(int(spin)): np.array(v)
+            projections = {Spin(int(spin)): decode_array(v)
                            for spin, v in d["projections"].items()}
 
         return BandStructure(
-            d['kpoints'], eigenvals,
+            decode_array(d['kpoints']), eigenvals,
             Lattice(d['lattice_rec']['matrix']), d['efermi'],
             labels_dict, structure=structure, projections=projections)
 
@@ -840,21 +853,24 @@ class BandStructureSymmLine(BandStructure, MSONable):
             old_dict['efermi'] = old_dict['efermi'] + shift
         return self.from_dict(old_dict)
 
-    def as_dict(self):
+    def as_dict(self, fmt=None):
         """
         Json-serializable dict representation of BandStructureSymmLine.
+
+        Args:
+            fmt (str): None (default) for the standard format or "columnar"
+                for a compact format in which the k-points, eigenvalues and
+                projections are kept as numpy arrays and the structure is
+                written with Structure.as_dict(fmt="columnar").
         """
 
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__,
-             "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi,
-             "kpoints": []}
-        # kpoints are not kpoint objects dicts but are frac coords (this makes
-        # the dict smaller and avoids the repetition of the lattice
-        for k in self.kpoints:
-            d["kpoints"].append(k.as_dict()["fcoords"])
+             "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi}
+        d["kpoints"] = self._kpoints_as_list(fmt)
         d["branches"] = self.branches
-        d["bands"] = {str(int(spin)): self.bands[spin].tolist()
+        d["bands"] = {str(int(spin)): self.bands[spin] if fmt == "columnar"
+                      else self.bands[spin].tolist()
                       for spin in self.bands}
         d["is_metal"] = self.is_metal()
         vbm = self.get_vbm()
@@ -880,9 +896,8 @@ class BandStructureSymmLine(BandStructure, MSONable):
             d['labels_dict'][mongo_key] = self.labels_dict[c].as_dict()[
                 'fcoords']
         if len(self.projections) != 0:
-            d['structure'] = self.structure.as_dict()
-            d['projections'] = {str(int(spin)): np.array(v).tolist()
-                                for spin, v in self.projections.items()}
+            d['structure'] = self.structure.as_dict(fmt=fmt)
+            d['projections'] = self._projections_as_list(fmt)
         return d
 
     @classmethod
@@ -901,15 +916,16 @@ class BandStructureSymmLine(BandStructure, MSONable):
             projections = {}
             structure = None
             if d.get('projections'):
-                if isinstance(d["projections"]['1'][0][0], dict):
+                if isinstance(d["projections"]['1'], list) and \
+                        isinstance(d["projections"]['1'][0][0], dict):
                     raise ValueError("Old band structure dict format detected!")
                 structure = Structure.from_dict(d['structure'])
-                projections = {Spin(int(spin)): np.array(v)
+                projections = {Spin(int(spin)): decode_array(v)
                                for spin, v in d["projections"].items()}
 
             return BandStructureSymmLine(
-                d['kpoints'], {Spin(int(k)): d['bands'][k]
-                               for k in d['bands']},
+                decode_array(d['kpoints']), {Spin(int(k)): decode_array(d['bands'][k])
+                                             for k in d['bands']},
                 Lattice(d['lattice_rec']['matrix']), d['efermi'],
                 labels_dict, structure=structure, projections=projections)
         except Exception:
@@ -965,21 +981,24 @@ class LobsterBandStructureSymmLine(BandStructureSymmLine):
     Lobster subclass of BandStructure with customized functions.
     """
 
-    def as_dict(self):
+    def as_dict(self, fmt=None):
         """
         Json-serializable dict representation of BandStructureSymmLine.
+
+        Args:
+            fmt (str): None (default) for the standard format or "columnar"
+                for a compact format in which the k-points, eigenvalues and
+                projections are kept as numpy arrays and the structure is
+                written with Structure.as_dict(fmt="columnar").
         """
 
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__,
-             "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi,
-             "kpoints": []}
-        # kpoints are not kpoint objects dicts but are frac coords (this makes
-        # the dict smaller and avoids the repetition of the lattice
-        for k in self.kpoints:
-            d["kpoints"].append(k.as_dict()["fcoords"])
+             "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi}
+        d["kpoints"] = self._kpoints_as_list(fmt)
         d["branches"] = self.branches
-        d["bands"] = {str(int(spin)): self.bands[spin].tolist()
+        d["bands"] = {str(int(spin)): self.bands[spin] if fmt == "columnar"
+                      else self.bands[spin].tolist()
                       for spin in self.bands}
         d["is_metal"] = self.is_metal()
         vbm = self.get_vbm()
@@ -1005,9 +1024,8 @@ class LobsterBandStructureSymmLine(BandStructureSymmLine):
             d['labels_dict'][mongo_key] = self.labels_dict[c].as_dict()[
                 'fcoords']
         if len(self.projections) != 0:
-            d['structure'] = self.structure.as_dict()
-            d['projections'] = {str(int(spin)): np.array(v).tolist()
-                                for spin, v in self.projections.items()}
+            d['structure'] = self.structure.as_dict(fmt=fmt)
+            d['projections'] = self._projections_as_list(fmt)
         return d
 
     @classmethod
@@ -1026,15 +1044,16 @@ class LobsterBandStructureSymmLine(BandStructureSymmLine):
             projections = {}
             structure = None
             if d.get('projections'):
-                if isinstance(d["projections"]['1'][0][0], dict):
+                if isinstance(d["projections"]['1'], list) and \
+                        isinstance(d["projections"]['1'][0][0], dict):
                     raise ValueError("Old band structure dict format detected!")
                 structure = Structure.from_dict(d['structure'])
-                projections = {Spin(int(spin)): np.array(v)
+                projections = {Spin(int(spin)): decode_array(v)
                                for spin, v in d["projections"].items()}
 
             return LobsterBandStructureSymmLine(
-                d['kpoints'], {Spin(int(k)): d['bands'][k]
-                               for k in d['bands']},
+                decode_array(d['kpoints']), {Spin(int(k)): decode_array(d['bands'][k])
+                                             for k in d['bands']},
                 Lattice(d['lattice_rec']['matrix']), d['efermi'],
                 labels_dict, structure=structure, projections=projections)
         except Exception:
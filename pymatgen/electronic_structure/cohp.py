@@ -291,6 +291,38 @@ class CompleteCohp(Cohp):
         else:
             self.bonds = bonds
 
+    @property
+    def all_cohps(self):
+        """
+        A dict of COHPs for individual bonds of the form {label: COHP}.
+        Reassigning all_cohps invalidates the cached stacked arrays.
+        """
+        return self._all_cohps
+
+    @all_cohps.setter
+    def all_cohps(self, cohp_dict):
+        self._all_cohps = cohp_dict
+        self._cohp_stack = None
+
+    def _build_cohp_stack(self):
+        """
+        Stacks the COHPs (and ICOHPs, if available for all bonds) of the
+        individual bonds into arrays of shape (nlabels, nspins, nenergies),
+        including the average COHP as the last row.
+        """
+        cohps = list(self._all_cohps.values()) + [self]
+        spins = list(self.cohp.keys())
+        self._cohp_label_index = {label: i for i, label
+                                  in enumerate(self._all_cohps.keys())}
+        self._cohp_spins = spins
+        self._cohp_stack = np.array([[c.cohp[spin] for spin in spins]
+                                     for c in cohps], dtype=float)
+        if all(c.icohp is not None for c in cohps):
+            self._icohp_stack = np.array([[c.icohp[spin] for spin in spins]
+                                          for c in cohps], dtype=float)
+        else:
+            self._icohp_stack = None
+
     def __str__(self):
         if self.are_coops:
             return "Complete COOPs for " + str(self.structure)
@@ -379,29 +411,23 @@ class CompleteCohp(Cohp):
         Returns:
             Returns a COHP object including a summed COHP
         """
-        # check if cohps are spinpolarized or not
-        first_cohpobject = self.get_cohp_by_label(label_list[0])
-        summed_cohp = first_cohpobject.cohp.copy()
-        summed_icohp = first_cohpobject.icohp.copy()
-        for label in label_list[1:]:
-            cohp_here = self.get_cohp_by_label(label)
-            summed_cohp[Spin.up] = np.sum([summed_cohp[Spin.up], cohp_here.cohp[Spin.up]], axis=0)
-            if Spin.down in summed_cohp:
-                summed_cohp[Spin.down] = np.sum([summed_cohp[Spin.down], cohp_here.cohp[Spin.down]], axis=0)
-            summed_icohp[Spin.up] = np.sum([summed_icohp[Spin.up], cohp_here.icohp[Spin.up]], axis=0)
-            if Spin.down in summed_icohp:
-                summed_icohp[Spin.down] = np.sum([summed_icohp[Spin.down], cohp_here.icohp[Spin.down]], axis=0)
-
-        divided_cohp = {}
-        divided_icohp = {}
-        divided_cohp[Spin.up] = np.divide(summed_cohp[Spin.up], divisor)
-        divided_icohp[Spin.up] = np.divide(summed_icohp[Spin.up], divisor)
-        if Spin.down in summed_cohp:
-            divided_cohp[Spin.down] = np.divide(summed_cohp[Spin.down], divisor)
-            divided_icohp[Spin.down] = np.divide(summed_icohp[Spin.down], divisor)
+        if self._cohp_stack is None:
+            self._build_cohp_stack()
+        average_index = len(self._cohp_label_index)
+        rows = [average_index if label.lower() == "average"
+                else self._cohp_label_index[label] for label in label_list]
+        summed_cohp = self._cohp_stack[rows].sum(axis=0) / divisor
+        divided_cohp = {spin: summed_cohp[i]
+                        for i, spin in enumerate(self._cohp_spins)}
+        if self._icohp_stack is not None:
+            summed_icohp = self._icohp_stack[rows].sum(axis=0) / divisor
+            divided_icohp = {spin: summed_icohp[i]
+                             for i, spin in enumerate(self._cohp_spins)}
+        else:
+            divided_icohp = None
 
-        return Cohp(efermi=first_cohpobject.efermi, energies=first_cohpobject.energies, cohp=divided_cohp,
-                    are_coops=first_cohpobject.are_coops,
+        return Cohp(efermi=self.efermi, energies=self.energies, cohp=divided_cohp,
+                    are_coops=self.are_coops,
                     icohp=divided_icohp)
 
     def get_summed_cohp_by_label_and_orbital_list(self, label_list, orbital_list, divisor=1):
@@ -859,6 +885,62 @@ class IcohpCollection(MSONable):
             self._icohplist[listel] = IcohpValue(listel, list_atom1[ilist], list_atom2[ilist], list_length[ilist],
                                                  list_translation[ilist], list_num[ilist], list_icohp[ilist])
 
+        self._build_arrays()
+
+    def _build_arrays(self):
+        """
+        Builds a columnar store of the ICOHP data (one row per label) together
+        with a per-site index and a bond length index, so that queries can be
+        answered with array operations instead of scanning all IcohpValues.
+        """
+        nbonds = len(self._list_labels)
+        self._label_index = {label: i for i, label in enumerate(self._list_labels)}
+        atoms1 = [re.split(r'(\d+)', atom) for atom in self._list_atom1]
+        atoms2 = [re.split(r'(\d+)', atom) for atom in self._list_atom2]
+        self._array_atom1 = np.array([int(a[1]) - 1 if len(a) > 1 else -1 for a in atoms1], dtype=int)
+        self._array_atom2 = np.array([int(a[1]) - 1 if len(a) > 1 else -1 for a in atoms2], dtype=int)
+        self._array_element1 = np.array([a[0] for a in atoms1], dtype=object)
+        self._array_element2 = np.array([a[0] for a in atoms2], dtype=object)
+        self._array_length = np.array(self._list_length, dtype=float).reshape(nbonds)
+        self._array_translation = np.array(self._list_translation, dtype=int).reshape(nbonds, 3)
+        self._array_num = np.array(self._list_num, dtype=int).reshape(nbonds)
+        spins = [Spin.up, Spin.down] if self._is_spin_polarized else [Spin.up]
+        self._array_icohp = np.array([[icohp.get(spin, 0.0) for spin in spins] for icohp in self._list_icohp],
+                                     dtype=float).reshape(nbonds, len(spins))
+        self._array_summed_icohp = self._array_icohp.sum(axis=1)
+
+        # rows sorted by bond length for range queries
+        self._length_order = np.argsort(self._array_length, kind="stable")
+        self._sorted_length = self._array_length[self._length_order]
+
+        # rows involving each site, in the original order
+        site_rows = {}
+        for irow, (atom1, atom2) in enumerate(zip(self._array_atom1, self._array_atom2)):
+            site_rows.setdefault(atom1, []).append(irow)
+            if atom2 != atom1:
+                site_rows.setdefault(atom2, []).append(irow)
+        self._site_index = {site: np.array(rows, dtype=int) for site, rows in site_rows.items()}
+
+    def _get_icohp_column(self, summed_spin_channels=True, spin=Spin.up):
+        """
+        Returns the column of ICOHP values (one entry per label) for the chosen spin channel(s)
+        """
+        if self._is_spin_polarized:
+            if summed_spin_channels:
+                return self._array_summed_icohp
+            return self._array_icohp[:, 1 if spin == Spin.down else 0]
+        if spin == Spin.down:
+            raise ValueError("The calculation was not performed with spin polarization")
+        return self._array_icohp[:, 0]
+
+    def _get_rows_by_bondlengths(self, minbondlength, maxbondlength):
+        """
+        Returns the rows with minbondlength <= length <= maxbondlength in the original order
+        """
+        start = np.searchsorted(self._sorted_length, minbondlength, side="left")
+        stop = np.searchsorted(self._sorted_length, maxbondlength, side="right")
+        return np.sort(self._length_order[start:stop])
+
     def __str__(self):
         joinstr = []
         for value in self._icohplist.values():
@@ -900,19 +982,10 @@ class IcohpCollection(MSONable):
         Returns:
              float that is a sum of all ICOHPs/ICOOPs as indicated with label_list
         """
-        sum_icohp = 0
-        for label in label_list:
-            icohp_here = self._icohplist[label]
-            if icohp_here.num_bonds != 1:
-                warnings.warn("One of the ICOHP values is an average over bonds. This is currently not considered.")
-            # prints warning if num_bonds is not equal to 1
-            if icohp_here._is_spin_polarized:
-                if summed_spin_channels:
-                    sum_icohp = sum_icohp + icohp_here.summed_icohp
-                else:
-                    sum_icohp = sum_icohp + icohp_here.icohpvalue(spin)
-            else:
-                sum_icohp = sum_icohp + icohp_here.icohpvalue(spin)
+        rows = [self._label_index[label] for label in label_list]
+        if np.any(self._array_num[rows] != 1):
+            warnings.warn("One of the ICOHP values is an average over bonds. This is currently not considered.")
+        sum_icohp = self._get_icohp_column(summed_spin_channels, spin)[rows].sum()
         return sum_icohp / divisor
 
     def get_icohp_dict_by_bondlengths(self, minbondlength=0.0, maxbondlength=8.0):
@@ -924,11 +997,8 @@ class IcohpCollection(MSONable):
         Returns:
              dict of IcohpValues, the keys correspond to the values from the initial list_labels
         """
-        newicohp_dict = {}
-        for value in self._icohplist.values():
-            if value._length >= minbondlength and value._length <= maxbondlength:
-                newicohp_dict[value._label] = value
-        return newicohp_dict
+        rows = self._get_rows_by_bondlengths(minbondlength, maxbondlength)
+        return {self._list_labels[irow]: self._icohplist[self._list_labels[irow]] for irow in rows}
 
     def get_icohp_dict_of_site(self, site, minsummedicohp=None, maxsummedicohp=None, minbondlength=0.0,
                                maxbondlength=8.0, only_bonds_to=None):
@@ -947,35 +1017,30 @@ class IcohpCollection(MSONable):
              dict of IcohpValues, the keys correspond to the values from the initial list_labels
         """
 
+        rows = self._site_index.get(site, np.array([], dtype=int))
+        lengths = self._array_length[rows]
+        mask = (lengths >= minbondlength) & (lengths <= maxbondlength)
+        if only_bonds_to is not None:
+            partners = np.where(self._array_atom1[rows] == site, self._array_element2[rows],
+                                self._array_element1[rows])
+            mask &= np.isin(partners, list(only_bonds_to))
+        summed = self._array_summed_icohp[rows]
+        if minsummedicohp is not None:
+            mask &= summed >= minsummedicohp
+        if maxsummedicohp is not None:
+            mask &= summed <= maxsummedicohp
+
         newicohp_dict = {}
-        for key, value in self._icohplist.items():
-            atomnumber1 = int(re.split(r'(\d+)', value._atom1)[1]) - 1
-            atomnumber2 = int(re.split(r'(\d+)', value._atom2)[1]) - 1
-            if site in (atomnumber1, atomnumber2):
-                # manipulate order of atoms so that searched one is always atom1
-                if site == atomnumber2:
-                    save = value._atom1
-                    value._atom1 = value._atom2
-                    value._atom2 = save
-
-                if only_bonds_to is None:
-                    second_test = True
-                else:
-                    second_test = (re.split(r'(\d+)', value._atom2)[0] in only_bonds_to)
-                if value._length >= minbondlength and value._length <= maxbondlength and second_test:
-                    if minsummedicohp is not None:
-                        if value.summed_icohp >= minsummedicohp:
-                            if maxsummedicohp is not None:
-                                if value.summed_icohp <= maxsummedicohp:
-                                    newicohp_dict[key] = value
-                            else:
-                                newicohp_dict[key] = value
-                    else:
-                        if maxsummedicohp is not None:
-                            if value.summed_icohp <= maxsummedicohp:
-                                newicohp_dict[key] = value
-                        else:
-                            newicohp_dict[key] = value
+        for irow, keep in zip(rows, mask):
+            key = self._list_labels[irow]
+            value = self._icohplist[key]
+            # manipulate order of atoms so that searched one is always atom1
+            if self._array_atom1[irow] == site:
+                value._atom1, value._atom2 = self._list_atom1[irow], self._list_atom2[irow]
+            else:
+                value._atom1, value._atom2 = self._list_atom2[irow], self._list_atom1[irow]
+            if keep:
+                newicohp_dict[key] = value
 
         return newicohp_dict
 
@@ -989,36 +1054,15 @@ class IcohpCollection(MSONable):
         Returns:
             lowest ICOHP/largest ICOOP value (i.e. ICOHP/ICOOP value of strongest bond)
         """
-        if not self._are_coops:
-            extremum = sys.float_info.max
-        else:
-            extremum = -sys.float_info.max
-
         if not self._is_spin_polarized:
             if spin == Spin.down:
                 warnings.warn("This spin channel does not exist. I am switching to Spin.up")
             spin = Spin.up
 
-        for value in self._icohplist.values():
-            if not value.is_spin_polarized or not summed_spin_channels:
-                if not self._are_coops:
-                    if value.icohpvalue(spin) < extremum:
-                        extremum = value.icohpvalue(spin)
-                        # print(extremum)
-                else:
-                    if value.icohpvalue(spin) > extremum:
-                        extremum = value.icohpvalue(spin)
-                        # print(extremum)
-            else:
-                if not self._are_coops:
-                    if value.summed_icohp < extremum:
-                        extremum = value.summed_icohp
-                        # print(extremum)
-                else:
-                    if value.summed_icohp > extremum:
-                        extremum = value.summed_icohp
-                        # print(extremum)
-        return extremum
+        values = self._get_icohp_column(summed_spin_channels, spin)
+        if not self._are_coops:
+            return min(values.min(), sys.float_info.max) if len(values) else sys.float_info.max
+        return max(values.max(), -sys.float_info.max) if len(values) else -sys.float_info.max
 
     @property
     def is_spin_polarized(self):
@@ -15,7 +15,9 @@ from pymatgen.core.periodic_table import get_el_sp
 from pymatgen.core.structure import Structure
 from pymatgen.core.spectrum import Spectrum
 from pymatgen.util.coord import get_linear_interpolated_value
+from pymatgen.util.serialization import decode_array
 from scipy.constants.codata import value as _cd
+from scipy.special import expit
 
 __author__ = "Shyue Ping Ong"
 __copyright__ = "Copyright 2012, The Materials Project"
@@ -399,14 +401,24 @@ class Dos(MSONable):
         """
         Returns Dos object from dict representation of Dos.
         """
-        return Dos(d["efermi"], d["energies"],
-                   {Spin(int(k)): v
+        return Dos(d["efermi"], decode_array(d["energies"]),
+                   {Spin(int(k)): decode_array(v)
                     for k, v in d["densities"].items()})
 
-    def as_dict(self):
+    def as_dict(self, fmt=None):
         """
         Json-serializable dict representation of Dos.
-        """
+
+        Args:
+            fmt (str): None (default) for the standard format or "columnar"
+                to keep the energies and densities as numpy arrays.
+        """
+        if fmt == "columnar":
+            return {"@module": self.__class__.__module__,
+                    "@class": self.__class__.__name__, "efermi": self.efermi,
+                    "energies": self.energies,
+                    "densities": {str(spin): dens
+                                  for spin, dens in self.densities.items()}}
         return {"@module": self.__class__.__module__,
                 "@class": self.__class__.__name__, "efermi": self.efermi,
                 "energies": list(self.energies),
@@ -607,6 +619,83 @@ class FermiDos(Dos, MSONable):
                     rtol * 100, concentration))
         return fermi
 
+    def get_fermi_levels(self, concentrations, temperatures,
+                         rtol: float = 0.01, tol: float = 1e-8,
+                         max_iter: int = 100) -> np.ndarray:
+        """
+        Vectorized counterpart of get_fermi. Solves for the fermi levels of
+        many (concentration, temperature) pairs at once by bisection, using
+        the fact that the doping decreases monotonically with the fermi
+        level. The occupation integrals are evaluated for all pairs together
+        against the precomputed valence and conduction band state weights.
+
+        concentrations and temperatures are broadcast against each other, so
+        a full grid can be computed with, e.g.,
+        get_fermi_levels(c[:, None], T[None, :]).
+
+        Args:
+            concentrations: Doping concentrations in 1/cm^3. Negative values
+                represent n-type doping and positive values represent p-type
+                doping.
+            temperatures: Temperatures in Kelvin.
+            rtol: The maximum acceptable relative error in the concentration.
+            tol: Convergence tolerance of the fermi level in eV.
+            max_iter: Maximum number of bisection steps.
+
+        Returns:
+            Array of fermi levels in eV with the broadcast shape of the
+            inputs. Entries for which no fermi level reproduces the
+            concentration within rtol are set to NaN, in the cases where
+            get_fermi would raise a ValueError.
+        """
+        conc, temp = np.broadcast_arrays(
+            np.asarray(concentrations, dtype=float),
+            np.asarray(temperatures, dtype=float))
+        shape = conc.shape
+        conc = conc.ravel()
+        temp = temp.ravel()
+
+        # Bracket by the energy window, padded by many kT so that the
+        # occupations at the bracket ends are saturated.
+        pad = 40 * _cd("Boltzmann constant in eV/K") * temp
+        lo = self.energies.min() - pad
+        hi = self.energies.max() + pad
+        for _ in range(max_iter):
+            mid = (lo + hi) / 2
+            too_low = self._get_doping_array(mid, temp) > conc
+            lo = np.where(too_low, mid, lo)
+            hi = np.where(too_low, hi, mid)
+            if np.max(hi - lo) < tol:
+                break
+        fermi = (lo + hi) / 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_error = np.abs(
+                self._get_doping_array(fermi, temp) / conc - 1.0)
+        fermi[~(relative_error <= rtol)] = np.nan
+        return fermi.reshape(shape)
+
+    def _get_doping_array(self, fermi_levels, temperatures,
+                          chunk_size: int = 2 ** 22):
+        """
+        Doping for 1D arrays of fermi levels and temperatures, evaluated
+        with the same left Riemann sum as get_doping.
+        """
+        kt = _cd("Boltzmann constant in eV/K") * temperatures
+        e_cb = self.energies[self.idx_cbm:]
+        w_cb = self.tdos[self.idx_cbm:] * self.de[self.idx_cbm:]
+        e_vb = self.energies[:self.idx_vbm + 1]
+        w_vb = self.tdos[:self.idx_vbm + 1] * self.de[:self.idx_vbm + 1]
+        doping = np.empty(len(fermi_levels))
+        step = max(1, chunk_size // len(self.energies))
+        for i in range(0, len(fermi_levels), step):
+            f = fermi_levels[i:i + step, None]
+            t = kt[i:i + step, None]
+            cb_integral = expit(-(e_cb - f) / t) @ w_cb
+            vb_integral = expit((e_vb - f) / t) @ w_vb
+            doping[i:i + step] = vb_integral - cb_integral
+        return doping / (self.volume * self.A_to_cm ** 3)
+
     @classmethod
     def from_dict(cls, d):
         """
@@ -659,6 +748,119 @@ class CompleteDos(Dos):
         self.pdos = pdoss
         self.structure = structure
 
+    @property
+    def pdos(self):
+        """
+        Dict of partial densities of the form {Site:{Orbital:{Spin:Densities}}}.
+        Reassigning pdos invalidates the cached dense array representation.
+        """
+        return self._pdos
+
+    @pdos.setter
+    def pdos(self, pdoss):
+        self._pdos = pdoss
+        self._pdos_array = None
+
+    @staticmethod
+    def _get_orbital_type(orb):
+        return _get_orb_type(orb)
+
+    def _build_pdos_array(self):
+        sites = list(self._pdos.keys())
+        orbitals = {}
+        spins = {}
+        for atom_dos in self._pdos.values():
+            for orb, pdos in atom_dos.items():
+                orbitals.setdefault(orb, len(orbitals))
+                for spin in pdos.keys():
+                    spins.setdefault(spin, len(spins))
+        data = np.zeros((len(sites), len(orbitals), len(spins),
+                         len(self.energies)))
+        for i, atom_dos in enumerate(self._pdos.values()):
+            for orb, pdos in atom_dos.items():
+                for spin, dens in pdos.items():
+                    data[i, orbitals[orb], spins[spin]] = dens
+        self._pdos_array = data
+        self._pdos_sites = sites
+        self._pdos_site_index = {site: i for i, site in enumerate(sites)}
+        self._pdos_orbitals = list(orbitals.keys())
+        self._pdos_orbital_index = orbitals
+        self._pdos_spins = list(spins.keys())
+
+    @property
+    def pdos_array(self):
+        """
+        Dense array representation of the partial densities, with shape
+        (nsites, norbitals, nspins, nenergies). The axes are labelled by
+        pdos_sites, pdos_orbitals and pdos_spins respectively. Orbitals that
+        are absent for a site are zero-filled. The array is built lazily from
+        pdos and cached.
+        """
+        if self._pdos_array is None:
+            self._build_pdos_array()
+        return self._pdos_array
+
+    @property
+    def pdos_sites(self):
+        """
+        Sites labelling the first axis of pdos_array.
+        """
+        if self._pdos_array is None:
+            self._build_pdos_array()
+        return self._pdos_sites
+
+    @property
+    def pdos_orbitals(self):
+        """
+        Orbitals labelling the second axis of pdos_array.
+        """
+        if self._pdos_array is None:
+            self._build_pdos_array()
+        return self._pdos_orbitals
+
+    @property
+    def pdos_spins(self):
+        """
+        Spins labelling the third axis of pdos_array.
+        """
+        if self._pdos_array is None:
+            self._build_pdos_array()
+        return self._pdos_spins
+
+    def _get_site_index(self, site):
+        if self._pdos_array is None:
+            self._build_pdos_array()
+        return self._pdos_site_index[site]
+
+    def _to_dos(self, data):
+        """
+        Converts a (nspins, nenergies) array into a Dos.
+        """
+        return Dos(self.efermi, self.energies,
+                   {spin: data[i] for i, spin in enumerate(self.pdos_spins)})
+
+    @staticmethod
+    def _group_sum(data, labels, axis):
+        """
+        Sums data over an axis according to the group labels of each index
+        along that axis, using a one-hot masking matrix.
+
+        Args:
+            data: Array to reduce.
+            labels: Sequence of group labels, one for each index along axis.
+            axis: Axis to reduce.
+
+        Returns:
+            dict of {label: reduced array}, in order of first appearance.
+        """
+        groups = {}
+        for label in labels:
+            groups.setdefault(label, len(groups))
+        mask = np.zeros((len(groups), len(labels)))
+        mask[[groups[label] for label in labels], np.arange(len(labels))] = 1
+        summed = np.tensordot(mask, data, axes=([1], [axis]))
+        return {label: summed[i] for label, i in groups.items()}
+
     def get_site_orbital_dos(self, site, orbital):
         """
         Get the Dos for a particular orbital of a particular site.
@@ -682,8 +884,8 @@ class CompleteDos(Dos):
         Returns:
             Dos containing summed orbital densities for site.
         """
-        site_dos = functools.reduce(add_densities, self.pdos[site].values())
-        return Dos(self.efermi, self.energies, site_dos)
+        return self._to_dos(
+            self.pdos_array[self._get_site_index(site)].sum(axis=0))
 
     def get_site_spd_dos(self, site):
         """
@@ -695,15 +897,12 @@ class CompleteDos(Dos):
         Returns:
             dict of {orbital: Dos}, e.g. {"s": Dos object, ...}
         """
-        spd_dos = dict()
-        for orb, pdos in self.pdos[site].items():
-            orbital_type = _get_orb_type(orb)
-            if orbital_type in spd_dos:
-                spd_dos[orbital_type] = add_densities(spd_dos[orbital_type], pdos)
-            else:
-                spd_dos[orbital_type] = pdos
-        return {orb: Dos(self.efermi, self.energies, densities)
-                for orb, densities in spd_dos.items()}
+        data = self.pdos_array[self._get_site_index(site)]
+        present = [self._pdos_orbital_index[orb] for orb in self.pdos[site]]
+        labels = [self._get_orbital_type(self.pdos_orbitals[i])
+                  for i in present]
+        return {orb: self._to_dos(dens) for orb, dens in
+                self._group_sum(data[present], labels, 0).items()}
 
     def get_site_t2g_eg_resolved_dos(self, site):
         """
@@ -737,17 +936,12 @@ class CompleteDos(Dos):
         Returns:
             dict of {orbital: Dos}, e.g. {"s": Dos object, ...}
         """
-        spd_dos = {}
-        for atom_dos in self.pdos.values():
-            for orb, pdos in atom_dos.items():
-                orbital_type = _get_orb_type(orb)
-                if orbital_type not in spd_dos:
-                    spd_dos[orbital_type] = pdos
-                else:
-                    spd_dos[orbital_type] = \
-                        add_densities(spd_dos[orbital_type], pdos)
-        return {orb: Dos(self.efermi, self.energies, densities)
-                for orb, densities in spd_dos.items()}
+        if not self.pdos:
+            return {}
+        labels = [self._get_orbital_type(orb) for orb in self.pdos_orbitals]
+        return {orb: self._to_dos(dens) for orb, dens in
+                self._group_sum(self.pdos_array.sum(axis=0), labels,
+                                0).items()}
 
     def get_element_dos(self):
         """
@@ -756,17 +950,12 @@ class CompleteDos(Dos):
         Returns:
             dict of {Element: Dos}
         """
-
-        el_dos = {}
-        for site, atom_dos in self.pdos.items():
-            el = site.specie
-            for pdos in atom_dos.values():
-                if el not in el_dos:
-                    el_dos[el] = pdos
-                else:
-                    el_dos[el] = add_densities(el_dos[el], pdos)
-        return {el: Dos(self.efermi, self.energies, densities)
-                for el, densities in el_dos.items()}
+        if not self.pdos:
+            return {}
+        labels = [site.specie for site in self.pdos_sites]
+        return {el: self._to_dos(dens) for el, dens in
+                self._group_sum(self.pdos_array.sum(axis=1), labels,
+                                0).items()}
 
     def get_element_spd_dos(self, el):
         """
@@ -779,19 +968,21 @@ class CompleteDos(Dos):
             dict of {Element: {"S": densities, "P": densities, "D": densities}}
         """
         el = get_el_sp(el)
-        el_dos = {}
-        for site, atom_dos in self.pdos.items():
-            if site.specie == el:
-                for orb, pdos in atom_dos.items():
-                    orbital_type = _get_orb_type(orb)
-                    if orbital_type not in el_dos:
-                        el_dos[orbital_type] = pdos
-                    else:
-                        el_dos[orbital_type] = \
-                            add_densities(el_dos[orbital_type], pdos)
-
-        return {orb: Dos(self.efermi, self.energies, densities)
-                for orb, densities in el_dos.items()}
+        if not self.pdos:
+            return {}
+        site_mask = np.array([site.specie == el for site in self.pdos_sites],
+                             dtype=bool)
+        data = self.pdos_array[site_mask]
+        # Only orbitals actually present for sites of this element contribute
+        # a key, consistent with the dict-based representation.
+        present = sorted({self._pdos_orbital_index[orb]
+                          for site, keep in zip(self.pdos_sites, site_mask)
+                          if keep for orb in self.pdos[site]})
+        labels = [self._get_orbital_type(self.pdos_orbitals[i])
+                  for i in present]
+        return {orb: self._to_dos(dens) for orb, dens in
+                self._group_sum(data[:, present].sum(axis=0), labels,
+                                0).items()}
 
     @property
     def spin_polarization(self):
@@ -831,15 +1022,34 @@ class CompleteDos(Dos):
             orb_dos = {}
             for orb_str, odos in d["pdos"][i].items():
                 orb = Orbital[orb_str]
-                orb_dos[orb] = {Spin(int(k)): v
+                orb_dos[orb] = {Spin(int(k)): decode_array(v)
                                 for k, v in odos["densities"].items()}
             pdoss[at] = orb_dos
         return CompleteDos(struct, tdos, pdoss)
 
-    def as_dict(self):
+    def as_dict(self, fmt=None):
         """
         Json-serializable dict representation of CompleteDos.
-        """
+
+        Args:
+            fmt (str): None (default) for the standard format or "columnar"
+                for a compact format in which the energies and (projected)
+                densities are kept as numpy arrays, the structure is written
+                with Structure.as_dict(fmt="columnar") and the derived
+                "atom_dos" and "spd_dos" summaries are omitted.
+        """
+        if fmt == "columnar":
+            d = Dos.as_dict(self, fmt=fmt)
+            d.update({"@module": self.__class__.__module__,
+                      "@class": self.__class__.__name__,
+                      "structure": self.structure.as_dict(fmt=fmt),
+                      "pdos": []})
+            if len(self.pdos) > 0:
+                for at in self.structure:
+                    d["pdos"].append({str(orb): {"densities": {str(int(spin)): dens
+                                                               for spin, dens in pdos.items()}}
+                                      for orb, pdos in self.pdos[at].items()})
+            return d
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__, "efermi": self.efermi,
              "structure": self.structure.as_dict(),
@@ -863,9 +1073,15 @@ class CompleteDos(Dos):
 
 class LobsterCompleteDos(CompleteDos):
     """
-    Extended CompleteDOS for Lobster
+    Extended CompleteDOS for Lobster. Orbitals are labelled by the strings
+    used in the Lobster files, e.g. "3s" or "4p_x". In the orbital projected
+    Dos, different principal quantum numbers (e.g. 3s and 4s) are summed.
     """
 
+    @staticmethod
+    def _get_orbital_type(orb):
+        return _get_orb_type_lobster(orb)
+
     def get_site_orbital_dos(self, site, orbital):
         """
         Get the Dos for a particular orbital of a particular site.
@@ -916,54 +1132,6 @@ class LobsterCompleteDos(CompleteDos):
                 "e_g": Dos(self.efermi, self.energies,
                            functools.reduce(add_densities, eg_dos))}
 
-    def get_spd_dos(self):
-        """
-        Get orbital projected Dos.
-        For example, if 3s and 4s are included in the basis of some element, they will be both summed in the orbital
-        projected DOS
-
-        Returns:
-            dict of {orbital: Dos}, e.g. {"s": Dos object, ...}
-        """
-        spd_dos = {}
-        for atom_dos in self.pdos.values():
-            for orb, pdos in atom_dos.items():
-                orbital_type = _get_orb_type_lobster(orb)
-                if orbital_type not in spd_dos:
-                    spd_dos[orbital_type] = pdos
-                else:
-                    spd_dos[orbital_type] = \
-                        add_densities(spd_dos[orbital_type], pdos)
-
-        return {orb: Dos(self.efermi, self.energies, densities)
-                for orb, densities in spd_dos.items()}
-
-    def get_element_spd_dos(self, el):
-        """
-        Get element and spd projected Dos
-
-
-        Args:
-            el: Element in Structure.composition associated with LobsterCompleteDos
-
-        Returns:
-            dict of {Element: {"S": densities, "P": densities, "D": densities}}
-        """
-        el = get_el_sp(el)
-        el_dos = {}
-        for site, atom_dos in self.pdos.items():
-            if site.specie == el:
-                for orb, pdos in atom_dos.items():
-                    orbital_type = _get_orb_type_lobster(orb)
-                    if orbital_type not in el_dos:
-                        el_dos[orbital_type] = pdos
-                    else:
-                        el_dos[orbital_type] = \
-                            add_densities(el_dos[orbital_type], pdos)
-
-        return {orb: Dos(self.efermi, self.energies, densities)
-                for orb, densities in el_dos.items()}
-
     @classmethod
     def from_dict(cls, d):
         """
@@ -977,7 +1145,7 @@ class LobsterCompleteDos(CompleteDos):
             orb_dos = {}
             for orb_str, odos in d["pdos"][i].items():
                 orb = orb_str
-                orb_dos[orb] = {Spin(int(k)): v
+                orb_dos[orb] = {Spin(int(k)): decode_array(v)
                                 for k, v in odos["densities"].items()}
             pdoss[at] = orb_dos
         return LobsterCompleteDos(struct, tdos, pdoss)
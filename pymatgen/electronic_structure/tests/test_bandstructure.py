@@ -9,6 +9,8 @@ import json
 from io import open
 import warnings
 
+import numpy as np
+
 from pymatgen.electronic_structure.bandstructure import Kpoint
 from pymatgen.electronic_structure.plotter import BSPlotterProjected
 from pymatgen import Lattice
@@ -17,6 +19,7 @@ from pymatgen.io.vasp import BSVasprun
 from pymatgen.electronic_structure.bandstructure import BandStructureSymmLine, get_reconstructed_band_structure, \
     LobsterBandStructureSymmLine
 from pymatgen.util.testing import PymatgenTest
+from pymatgen.util.serialization import pmg_json_dumps, pmg_json_loads, orjson
 
 from monty.serialization import loadfn
 
@@ -202,6 +205,25 @@ class BandStructureSymmLine_test(PymatgenTest):
         s = json.dumps(self.bs_spin.as_dict())
         self.assertIsNotNone(s)
 
+    def test_as_dict_columnar(self):
+        for bs in [self.bs, self.bs_spin]:
+            d = bs.as_dict(fmt="columnar")
+            self.assertIsInstance(d["bands"]["1"], np.ndarray)
+            self.assertEqual(d["kpoints"].shape, (len(bs.kpoints), 3))
+            for backend in ["json", "orjson"]:
+                if backend == "orjson" and orjson is None:
+                    continue
+                bs2 = pmg_json_loads(pmg_json_dumps(d, backend=backend), backend=backend)
+                self.assertIsInstance(bs2, BandStructureSymmLine)
+                for spin, bands in bs.bands.items():
+                    self.assertArrayAlmostEqual(bs2.bands[spin], bands)
+                for spin, proj in bs.projections.items():
+                    self.assertArrayAlmostEqual(bs2.projections[spin], proj)
+                self.assertArrayAlmostEqual([k.frac_coords for k in bs2.kpoints],
+                                            [k.frac_coords for k in bs.kpoints])
+                self.assertEqual(bs2.get_band_gap(), bs.get_band_gap())
+                self.assertEqual(bs2.structure, bs.structure)
+
     def test_old_format_load(self):
         with open(os.path.join(test_dir, "bs_ZnS_old.json"),
                   "r", encoding='utf-8') as f:
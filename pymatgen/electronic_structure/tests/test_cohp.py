@@ -6,6 +6,8 @@ import unittest
 import json
 import os
 
+import numpy as np
+
 from pymatgen.electronic_structure.cohp import CompleteCohp, Cohp, IcohpValue, IcohpCollection
 from pymatgen.electronic_structure.core import Spin, Orbital
 from pymatgen.util.testing import PymatgenTest
@@ -459,6 +461,41 @@ class CombinedIcohpTest(unittest.TestCase):
         self.assertEqual(self.icoopcollection_Fe.extremum_icohpvalue(summed_spin_channels=False, spin=Spin.down),
                          -0.05756)
 
+    def test_indexed_queries(self):
+        # compare the indexed queries with a brute-force scan on a larger collection
+        rng = np.random.RandomState(0)
+        nbonds = 500
+        list_labels = [str(i + 1) for i in range(nbonds)]
+        list_atom1 = ["Fe" + str(i) for i in rng.randint(1, 21, nbonds)]
+        list_atom2 = ["O" + str(i) for i in rng.randint(21, 41, nbonds)]
+        list_length = list(rng.uniform(1.5, 5.0, nbonds))
+        list_translation = [[0, 0, 0]] * nbonds
+        list_num = [1] * nbonds
+        list_icohp = [{Spin.up: -u, Spin.down: -d} for u, d in rng.uniform(0, 1, (nbonds, 2))]
+        collection = IcohpCollection(is_spin_polarized=True, are_coops=False, list_labels=list_labels,
+                                     list_atom1=list_atom1, list_atom2=list_atom2, list_length=list_length,
+                                     list_translation=list_translation, list_num=list_num,
+                                     list_icohp=list_icohp)
+
+        by_length = collection.get_icohp_dict_by_bondlengths(minbondlength=2.0, maxbondlength=3.0)
+        self.assertEqual(list(by_length.keys()),
+                         [lab for lab, length in zip(list_labels, list_length) if 2.0 <= length <= 3.0])
+
+        for site in [0, 4, 25]:
+            of_site = collection.get_icohp_dict_of_site(site, maxsummedicohp=-0.8, maxbondlength=4.0)
+            ref = [lab for lab, a1, a2, length, icohp in
+                   zip(list_labels, list_atom1, list_atom2, list_length, list_icohp)
+                   if site + 1 in (int(a1[2:]), int(a2[1:])) and length <= 4.0
+                   and icohp[Spin.up] + icohp[Spin.down] <= -0.8]
+            self.assertEqual(list(of_site.keys()), ref)
+            for value in of_site.values():
+                self.assertEqual(int(value._atom1.strip("FeO")), site + 1)
+
+        self.assertAlmostEqual(collection.get_summed_icohp_by_label_list(list_labels[:100], divisor=2.0),
+                               sum(icohp[Spin.up] + icohp[Spin.down] for icohp in list_icohp[:100]) / 2.0)
+        self.assertAlmostEqual(collection.extremum_icohpvalue(summed_spin_channels=False, spin=Spin.down),
+                               min(icohp[Spin.down] for icohp in list_icohp))
+
 
 class CompleteCohpTest(PymatgenTest):
     def setUp(self):
@@ -9,6 +9,7 @@ import json
 import numpy as np
 
 from monty.serialization import loadfn
+from monty.json import MontyEncoder, MontyDecoder
 
 from pymatgen import Structure
 from pymatgen.electronic_structure.core import Spin, Orbital, OrbitalType
@@ -91,8 +92,30 @@ class FermiDosTest(unittest.TestCase):
         self.assertAlmostEqual(sci_dos.get_fermi_interextrapolated(0.0, 300),
                                2.5226, 4)
 
+    def test_get_fermi_levels(self):
+        T = 300
+        fermi0 = self.dos.efermi
+        frange = [fermi0 - 0.5, fermi0, fermi0 + 2.0, fermi0 + 2.2]
+        ref_dopings = [3.48077e+21, 1.9235e+18, -2.6909e+16, -4.8723e+19]
+        fermis = self.dos.get_fermi_levels(ref_dopings, T)
+        self.assertEqual(fermis.shape, (4,))
+        for calc, f_ref in zip(fermis, frange):
+            self.assertAlmostEqual(calc, f_ref, 4)
+
+        concs = np.array([1e17, -1e17, 1e19])
+        temps = np.array([300., 600.])
+        grid = self.dos.get_fermi_levels(concs[:, None], temps[None, :])
+        self.assertEqual(grid.shape, (3, 2))
+        for i, c in enumerate(concs):
+            for j, t in enumerate(temps):
+                self.assertAlmostEqual(grid[i, j],
+                                       self.dos.get_fermi(c, t), 6)
 
-class CompleteDosTest(unittest.TestCase):
+        # Unreachable concentrations are flagged rather than raised.
+        self.assertTrue(np.isnan(self.dos.get_fermi_levels(1e30, T)))
+
+
+class CompleteDosTest(PymatgenTest):
 
     def setUp(self):
         with open(os.path.join(test_dir, "complete_dos.json"), "r") as f:
@@ -171,6 +194,51 @@ class CompleteDosTest(unittest.TestCase):
         self.assertTrue((abs(sum_spd.energies
                              - sum_element.energies) < 0.0001).all())
 
+    def test_to_from_dict_columnar(self):
+        d = self.dos.as_dict(fmt="columnar")
+        self.assertIsInstance(d["energies"], np.ndarray)
+        self.assertNotIn("atom_dos", d)
+        dos = json.loads(json.dumps(d, cls=MontyEncoder), cls=MontyDecoder)
+        self.assertIsInstance(dos, CompleteDos)
+        self.assertEqual(dos.structure, self.dos.structure)
+        self.assertArrayAlmostEqual(dos.energies, self.dos.energies)
+        self.assertArrayAlmostEqual(dos.pdos_array, self.dos.pdos_array)
+        dos = CompleteDos.from_dict(json.loads(json.dumps(d, cls=MontyEncoder)))
+        self.assertArrayAlmostEqual(dos.densities[Spin.down], self.dos.densities[Spin.down])
+
+    def test_pdos_array(self):
+        dos = self.dos
+        nsites = len(dos.structure)
+        self.assertEqual(dos.pdos_array.shape,
+                         (nsites, len(dos.pdos_orbitals), 2, 301))
+        site = dos.structure[4]
+        i = dos.pdos_sites.index(site)
+        j = dos.pdos_orbitals.index(Orbital.dxy)
+        k = dos.pdos_spins.index(Spin.down)
+        self.assertArrayAlmostEqual(dos.pdos_array[i, j, k],
+                                    dos.pdos[site][Orbital.dxy][Spin.down])
+
+        # Masked reductions must agree with summing the dict view directly.
+        for el, el_dos in dos.get_element_dos().items():
+            ref = sum(np.array(pdos[Spin.up]) for s, atom_dos in dos.pdos.items()
+                      if s.specie == el for pdos in atom_dos.values())
+            self.assertArrayAlmostEqual(el_dos.densities[Spin.up], ref)
+        for orb, el_dos in dos.get_element_spd_dos(site.specie).items():
+            ref = sum(np.array(pdos[Spin.down]) for s, atom_dos in dos.pdos.items()
+                      if s.specie == site.specie
+                      for o, pdos in atom_dos.items() if o.orbital_type == orb)
+            self.assertArrayAlmostEqual(el_dos.densities[Spin.down], ref)
+        site_spd = dos.get_site_spd_dos(site)
+        self.assertArrayAlmostEqual(
+            site_spd[OrbitalType.d].densities[Spin.up],
+            sum(np.array(pdos[Spin.up]) for o, pdos in dos.pdos[site].items()
+                if o.orbital_type == OrbitalType.d))
+
+        # Reassigning pdos invalidates the cached array.
+        dos.pdos = {site: dos.pdos[site]}
+        self.assertEqual(dos.pdos_array.shape[0], 1)
+        self.assertEqual(len(dos.get_element_dos()), 1)
+
     def test_str(self):
         self.assertIsNotNone(str(self.dos))
 
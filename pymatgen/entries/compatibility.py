@@ -14,7 +14,7 @@ from collections import defaultdict
 from typing import Sequence, Union, Optional
 from monty.design_patterns import cached_class
 from monty.serialization import loadfn
-from monty.json import MSONable
+from monty.json import MSONable, MontyDecoder
 
 from pymatgen.io.vasp.sets import MITRelaxSet, MPRelaxSet
 from pymatgen.core.periodic_table import Element
@@ -25,6 +25,7 @@ from pymatgen.entries.computed_entries import ComputedEntry, \
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 MU_H2O = -2.4583  # Free energy of formation of water, eV/H2O, used by MaterialsProjectAqueousCompatibility
+_CACHE_SIZE = 10000  # Max. number of cached anion types / U rules per Correction
 
 __author__ = "Ryan Kingsbury, Shyue Ping Ong, Anubhav Jain, Stephen Dacek, Sai Jayaraman"
 __copyright__ = "Copyright 2012-2020, The Materials Project"
@@ -216,6 +217,21 @@ class AnionCorrection(Correction):
             float))
         self.name = c['Name']
         self.correct_peroxide = correct_peroxide
+        self._anion_types = {}  # type: dict
+
+    def _get_anion_type(self, func, structure, **kwargs):
+        """
+        Returns func(structure, **kwargs) for the oxide_type and
+        sulfide_type functions, cached by the content of the structure since
+        the neighbor analysis is much slower than the other corrections.
+        """
+        key = (func.__name__, tuple(site.species_string for site in structure),
+               structure.lattice.matrix.tobytes(), structure.frac_coords.tobytes())
+        if key not in self._anion_types:
+            if len(self._anion_types) >= _CACHE_SIZE:
+                self._anion_types.clear()
+            self._anion_types[key] = func(structure, **kwargs)
+        return self._anion_types[key]
 
     def get_correction(self, entry) -> float:
         """
@@ -233,7 +249,7 @@ class AnionCorrection(Correction):
             if entry.data.get("sulfide_type"):
                 sf_type = entry.data["sulfide_type"]
             elif hasattr(entry, "structure"):
-                sf_type = sulfide_type(entry.structure)
+                sf_type = self._get_anion_type(sulfide_type, entry.structure)
             if sf_type in self.sulfide_correction:
                 correction += self.sulfide_correction[sf_type] * comp["S"]
 
@@ -250,8 +266,9 @@ class AnionCorrection(Correction):
                         correction += ox_corr * comp["O"]
 
                 elif hasattr(entry, "structure"):
-                    ox_type, nbonds = oxide_type(entry.structure, 1.05,
-                                                 return_nbonds=True)
+                    ox_type, nbonds = self._get_anion_type(oxide_type, entry.structure,
+                                                           relative_cutoff=1.05,
+                                                           return_nbonds=True)
                     if ox_type in self.oxide_correction:
                         correction += self.oxide_correction[ox_type] * \
                                       nbonds
@@ -375,6 +392,7 @@ class UCorrection(Correction):
 
         self.name = c["Name"]
         self.compat_type = compat_type
+        self._u_rules = {}  # type: dict
 
     def get_correction(self, entry) -> float:
         """
@@ -389,24 +407,42 @@ class UCorrection(Correction):
         calc_u = entry.parameters.get("hubbards", None)
         calc_u = defaultdict(int) if calc_u is None else calc_u
         comp = entry.composition
-
+        amounts = comp.get_el_amt_dict()
+
+        # The U checks and the correction per atom of each element only
+        # depend on the elements and the U values, so they are evaluated
+        # once for all entries with the same signature.
+        key = (tuple(sorted((el, amt > 0) for el, amt in amounts.items())),
+               tuple(sorted((k, v) for k, v in calc_u.items() if k in amounts)))
+        if key not in self._u_rules:
+            if len(self._u_rules) >= _CACHE_SIZE:
+                self._u_rules.clear()
+            self._u_rules[key] = self._get_u_rule(comp, calc_u)
+        rule = self._u_rules[key]
+        if isinstance(rule, str):
+            raise CompatibilityError(rule)
+        return sum(corr * amounts[sym] for sym, corr in rule.items())
+
+    def _get_u_rule(self, comp, calc_u):
+        """
+        Returns the U correction per atom of the elements of comp, or the
+        error message if the U values are not valid.
+        """
         elements = sorted([el for el in comp.elements if comp[el] > 0],
                           key=lambda el: el.X)
         most_electroneg = elements[-1].symbol
-        correction = 0
         ucorr = self.u_corrections.get(most_electroneg, {})
         usettings = self.u_settings.get(most_electroneg, {})
 
+        rule = {}
         for el in comp.elements:
             sym = el.symbol
             # Check for bad U values
             if calc_u.get(sym, 0) != usettings.get(sym, 0):
-                raise CompatibilityError('Invalid U value of %s on %s' %
-                                         (calc_u.get(sym, 0), sym))
+                return 'Invalid U value of %s on %s' % (calc_u.get(sym, 0), sym)
             if sym in ucorr:
-                correction += float(ucorr[sym]) * comp[el]
-
-        return correction
+                rule[sym] = float(ucorr[sym])
+        return rule
 
     def __str__(self):
         return "{} {} Correction".format(self.name, self.compat_type)
@@ -450,12 +486,14 @@ class Compatibility(MSONable, metaclass=abc.ABCMeta):
             An adjusted entry if entry is compatible, otherwise None is
             returned.
         """
-        if self.process_entries(entry):
-            return self.process_entries(entry)[0]
+        processed_entries = self.process_entries(entry)
+        if processed_entries:
+            return processed_entries[0]
         else:
             return None
 
-    def process_entries(self, entries: Union[ComputedEntry, list], clean: bool = False):
+    def process_entries(self, entries: Union[ComputedEntry, list], clean: bool = False,
+                        ncpus: Optional[int] = None, chunk_size: int = 1000):
         """
         Process a sequence of entries with the chosen Compatibility scheme.
 
@@ -464,6 +502,11 @@ class Compatibility(MSONable, metaclass=abc.ABCMeta):
             clean: bool, whether to remove any previously-applied energy adjustments.
                 If True, all EnergyAdjustment are removed prior to processing the Entry.
                 Default is False.
+            ncpus: Number of processes used to compute the energy adjustments.
+                The entries are sent to the processes in chunks of chunk_size
+                entries and the adjustments are applied to the original
+                entries. Default of None means serial processing.
+            chunk_size: Number of entries per chunk if ncpus is set.
 
         Returns:
             A list of adjusted entries.  Entries in the original list which
@@ -472,22 +515,34 @@ class Compatibility(MSONable, metaclass=abc.ABCMeta):
         # convert input arg to a list if not already
         if isinstance(entries, ComputedEntry):
             entries = [entries]
+        entries = list(entries)
 
-        processed_entry_list = []
-
-        for entry in entries:
-            ignore_entry = False
-            # if clean is True, remove all previous adjustments, other than Manual adjustments, from the entry
-            if clean:
+        # if clean is True, remove all previous adjustments, other than Manual adjustments, from the entry
+        if clean:
+            for entry in entries:
                 for ea in entry.energy_adjustments:
                     entry.energy_adjustments.remove(ea)
 
-            # get the energy adjustments
-            try:
-                adjustments = self.get_adjustments(entry)
-            except CompatibilityError as exc:
-                ignore_entry = True
-                print(exc)
+        # get the energy adjustments
+        if ncpus:
+            import multiprocessing as mp
+            # Compatibility schemes are sent to the processes as dicts since
+            # the cached Correction classes cannot be pickled.
+            compat_dict = self.as_dict()
+            chunks = [(compat_dict, entries[i:i + chunk_size])
+                      for i in range(0, len(entries), chunk_size)]
+            with mp.Pool(ncpus) as p:
+                all_adjustments = [adj for chunk in p.imap(_get_adjustments_list, chunks)
+                                   for adj in chunk]
+        else:
+            all_adjustments = _get_adjustments_list((self, entries))
+
+        processed_entry_list = []
+
+        for entry, adjustments in zip(entries, all_adjustments):
+            ignore_entry = False
+            if isinstance(adjustments, CompatibilityError):
+                print(adjustments)
                 continue
 
             for ea in adjustments:
@@ -547,6 +602,23 @@ class Compatibility(MSONable, metaclass=abc.ABCMeta):
               )
 
 
+def _get_adjustments_list(args):
+    """
+    Returns the energy adjustments of a list of entries, or the
+    CompatibilityError for the entries that are not compatible.
+    """
+    compat, entries = args
+    if isinstance(compat, dict):
+        compat = MontyDecoder().process_decoded(compat)
+    all_adjustments = []
+    for entry in entries:
+        try:
+            all_adjustments.append(compat.get_adjustments(entry))
+        except CompatibilityError as exc:
+            all_adjustments.append(exc)
+    return all_adjustments
+
+
 class CorrectionsList(Compatibility):
     """
     The CorrectionsList class combines a list of corrections to be applied to
@@ -564,6 +636,7 @@ class CorrectionsList(Compatibility):
             corrections: List of corrections to apply.
         """
         self.corrections = corrections
+        self._cls_dict = None  # type: Optional[dict]
         super().__init__()
 
     def get_adjustments(self, entry):
@@ -571,12 +644,16 @@ class CorrectionsList(Compatibility):
         Get the list of energy adjustments to be applied to an entry.
         """
         adjustment_list = []
+        # The corrections are fixed on init, so the dict representation of
+        # the scheme stored in the adjustments only has to be created once.
+        if self._cls_dict is None:
+            self._cls_dict = self.as_dict()
         # try:
         corrections = self.get_corrections_dict(entry)
         for k, v in corrections.items():
             adjustment_list.append(ConstantEnergyAdjustment(v,
                                                             name=k,
-                                                            cls=self.as_dict(),
+                                                            cls=self._cls_dict,
                                                             )
                                    )
 
@@ -962,7 +1039,8 @@ class MaterialsProjectAqueousCompatibility(Compatibility):
 
         return adjustments
 
-    def process_entries(self, entries: Union[ComputedEntry, list], clean: bool = False):
+    def process_entries(self, entries: Union[ComputedEntry, list], clean: bool = False,
+                        ncpus: Optional[int] = None, chunk_size: int = 1000):
         """
         Process a sequence of entries with the chosen Compatibility scheme.
 
@@ -971,6 +1049,9 @@ class MaterialsProjectAqueousCompatibility(Compatibility):
             clean: bool, whether to remove any previously-applied energy adjustments.
                 If True, all EnergyAdjustment are removed prior to processing the Entry.
                 Default is False.
+            ncpus: Number of processes used to compute the energy adjustments.
+                Default of None means serial processing.
+            chunk_size: Number of entries per chunk if ncpus is set.
 
         Returns:
             A list of adjusted entries.  Entries in the original list which
@@ -982,7 +1063,8 @@ class MaterialsProjectAqueousCompatibility(Compatibility):
 
         # pre-process entries with the given solid compatibility class
         if self.solid_compat:
-            entries = self.solid_compat.process_entries(entries, clean=True)
+            entries = self.solid_compat.process_entries(entries, clean=True, ncpus=ncpus,
+                                                        chunk_size=chunk_size)
 
         # extract the DFT energies of oxygen and water from the list of entries, if present
         if not self.o2_energy:
@@ -997,4 +1079,4 @@ class MaterialsProjectAqueousCompatibility(Compatibility):
                 self.h2o_energy = h2o_entries[0].energy_per_atom
                 self.h2o_adjustments = h2o_entries[0].correction / h2o_entries[0].composition.num_atoms
 
-        return super().process_entries(entries)
+        return super().process_entries(entries, ncpus=ncpus, chunk_size=chunk_size)
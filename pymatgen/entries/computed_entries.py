@@ -12,6 +12,7 @@ diagram analysis.
 
 import json
 import abc
+import copy
 
 from monty.json import MontyEncoder, MontyDecoder, MSONable
 
@@ -342,15 +343,27 @@ class ComputedEntry(Entry):
                              for k, v in d.get("data", {}).items()},
                        entry_id=d.get("entry_id", None))
 
-    def as_dict(self) -> dict:
+    def as_dict(self, fmt: str = None) -> dict:
         """
+        :param fmt: None (default) for the standard format, in which the
+            energy adjustments, parameters and data are converted to plain
+            JSON types. "columnar" deep copies them as they are (e.g.,
+            numpy arrays are preserved), which is much faster if the dict is
+            serialized with MontyEncoder or pymatgen.util.serialization.
+            pmg_json_dumps anyway.
         :return: MSONable dict.
         """
         return_dict = super().as_dict()
-        return_dict.update({"energy_adjustments": json.loads(json.dumps(self.energy_adjustments, cls=MontyEncoder)),
-                            "parameters": json.loads(json.dumps(self.parameters, cls=MontyEncoder)),
-                            "data": json.loads(json.dumps(self.data, cls=MontyEncoder)),
-                            "entry_id": self.entry_id,
+        if fmt == "columnar":
+            return_dict.update({"energy_adjustments": copy.deepcopy(self.energy_adjustments),
+                                "parameters": copy.deepcopy(self.parameters),
+                                "data": copy.deepcopy(self.data)})
+        else:
+            return_dict.update({"energy_adjustments": json.loads(json.dumps(self.energy_adjustments,
+                                                                            cls=MontyEncoder)),
+                                "parameters": json.loads(json.dumps(self.parameters, cls=MontyEncoder)),
+                                "data": json.loads(json.dumps(self.data, cls=MontyEncoder))})
+        return_dict.update({"entry_id": self.entry_id,
                             "correction": self.correction})
         return return_dict
 
@@ -390,14 +403,17 @@ class ComputedStructureEntry(ComputedEntry):
             parameters=parameters, data=data, entry_id=entry_id)
         self.structure = structure
 
-    def as_dict(self) -> dict:
+    def as_dict(self, fmt: str = None) -> dict:
         """
+        :param fmt: None (default) for the standard format or "columnar" for
+            the compact format, in which the structure is also written with
+            Structure.as_dict(fmt="columnar").
         :return: MSONAble dict.
         """
-        d = super().as_dict()
+        d = super().as_dict(fmt=fmt)
         d["@module"] = self.__class__.__module__
         d["@class"] = self.__class__.__name__
-        d["structure"] = self.structure.as_dict()
+        d["structure"] = self.structure.as_dict(fmt=fmt)
         return d
 
     @classmethod
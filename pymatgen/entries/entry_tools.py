@@ -16,23 +16,30 @@ __email__ = "shyuep@gmail.com"
 __date__ = "Feb 24, 2012"
 
 import logging
-import json
 import datetime
 import collections
 import itertools
 import csv
 import re
 
-from typing import List, Union, Iterable, Set
+from typing import Dict, List, Union, Iterable, Set
+
+import numpy as np
+
 from pymatgen.core.periodic_table import Element
 from pymatgen.core.composition import Composition
+from pymatgen.core.structure import Structure
 from pymatgen.analysis.phase_diagram import PDEntry
-from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
-from monty.json import MontyEncoder, MontyDecoder, MSONable
+from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry, \
+    ManualEnergyAdjustment
+from monty.json import MSONable
 from monty.string import unicode2str
 
+from pymatgen.util.serialization import pmg_json_dumps, pmg_json_loads
+
 from pymatgen.analysis.structure_matcher import StructureMatcher, \
     SpeciesComparator
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -47,43 +54,93 @@ def _get_host(structure, species_to_remove):
 
 
 def _perform_grouping(args):
-    (entries_json, hosts_json, ltol, stol, angle_tol,
-     primitive_cell, scale, comparator, groups) = args
-
-    entries = json.loads(entries_json, cls=MontyDecoder)
-    hosts = json.loads(hosts_json, cls=MontyDecoder)
-    unmatched = list(zip(entries, hosts))
-    while len(unmatched) > 0:
-        ref_host = unmatched[0][1]
-        logger.info(
-            "Reference tid = {}, formula = {}".format(unmatched[0][0].entry_id,
-                                                      ref_host.formula)
-        )
-        ref_formula = ref_host.composition.reduced_formula
-        logger.info("Reference host = {}".format(ref_formula))
-        matches = [unmatched[0]]
-        for i in range(1, len(unmatched)):
-            test_host = unmatched[i][1]
-            logger.info("Testing tid = {}, formula = {}"
-                        .format(unmatched[i][0].entry_id, test_host.formula))
-            test_formula = test_host.composition.reduced_formula
-            logger.info("Test host = {}".format(test_formula))
-            m = StructureMatcher(ltol=ltol, stol=stol, angle_tol=angle_tol,
-                                 primitive_cell=primitive_cell, scale=scale,
-                                 comparator=comparator)
-            if m.fit(ref_host, test_host):
-                logger.info("Fit found")
-                matches.append(unmatched[i])
-        groups.append(json.dumps([m[0] for m in matches], cls=MontyEncoder))
-        unmatched = list(filter(lambda x: x not in matches, unmatched))
-        logger.info("{} unmatched remaining".format(len(unmatched)))
+    (indices, hosts, ltol, stol, angle_tol, primitive_cell, scale,
+     comparator, symprec, vol_tol) = args
+
+    hosts = [Structure.from_dict(h) if isinstance(h, dict) else h for h in hosts]
+    buckets = [list(range(len(hosts)))]
+    if symprec is not None:
+        by_spg = collections.defaultdict(list)  # type: Dict[int, List[int]]
+        for i in buckets[0]:
+            spg = SpacegroupAnalyzer(hosts[i], symprec=symprec).get_space_group_number()
+            by_spg[spg].append(i)
+        buckets = list(by_spg.values())
+    if vol_tol is not None and not scale:
+        vol_buckets = []
+        for bucket in buckets:
+            vpa = {i: hosts[i].volume / len(hosts[i]) for i in bucket}
+            ordered = sorted(bucket, key=vpa.get)
+            sub_bucket = [ordered[0]]
+            for prev, i in zip(ordered[:-1], ordered[1:]):
+                if vpa[i] > vpa[prev] * (1 + vol_tol):
+                    vol_buckets.append(sorted(sub_bucket))
+                    sub_bucket = []
+                sub_bucket.append(i)
+            vol_buckets.append(sorted(sub_bucket))
+        buckets = vol_buckets
+
+    m = StructureMatcher(ltol=ltol, stol=stol, angle_tol=angle_tol,
+                         primitive_cell=primitive_cell, scale=scale,
+                         comparator=comparator)
+    groups = []
+    for bucket in buckets:
+        unmatched = bucket
+        while len(unmatched) > 0:
+            ref = unmatched[0]
+            ref_host = hosts[ref]
+            logger.info("Reference host = {}".format(ref_host.composition.reduced_formula))
+            matches = [ref]
+            for i in unmatched[1:]:
+                if m.fit(ref_host, hosts[i]):
+                    logger.info("Fit found")
+                    matches.append(i)
+            groups.append([indices[i] for i in matches])
+            matched = set(matches)
+            unmatched = [i for i in unmatched if i not in matched]
+            logger.info("{} unmatched remaining".format(len(unmatched)))
+    return groups
+
+
+def _iter_index_groups(entries, species_to_remove, ltol, stol, angle_tol,
+                       primitive_cell, scale, comparator, ncpus, symprec,
+                       vol_tol):
+    """
+    Yields groups of indices of structurally similar entries, one bucket of
+    entries with the same comparator hash (i.e., composition) at a time.
+    """
+    buckets = collections.defaultdict(list)
+    for i, entry in enumerate(entries):
+        host = _get_host(entry.structure, species_to_remove)
+        buckets[comparator.get_hash(host.composition)].append((i, host))
+    # The cost of grouping a bucket grows quadratically with its size. Start
+    # with the largest buckets so that the work is balanced over the workers.
+    buckets = sorted(buckets.values(), key=len, reverse=True)
+    if ncpus:
+        import multiprocessing as mp
+        logger.info("Using {} cpus".format(ncpus))
+        # Only the compact dicts of the host structures are sent to the
+        # workers, which return indices of the entries.
+        tasks = (([i for i, host in bucket],
+                  [host.as_dict(verbosity=0, fmt="columnar") for i, host in bucket],
+                  ltol, stol, angle_tol, primitive_cell, scale, comparator,
+                  symprec, vol_tol)
+                 for bucket in buckets)
+        with mp.Pool(ncpus) as p:
+            for groups in p.imap_unordered(_perform_grouping, tasks):
+                yield from groups
+    else:
+        for bucket in buckets:
+            yield from _perform_grouping(
+                ([i for i, host in bucket], [host for i, host in bucket],
+                 ltol, stol, angle_tol, primitive_cell, scale, comparator,
+                 symprec, vol_tol))
 
 
 def group_entries_by_structure(entries, species_to_remove=None,
                                ltol=0.2, stol=.4, angle_tol=5,
                                primitive_cell=True, scale=True,
                                comparator=SpeciesComparator(),
-                               ncpus=None):
+                               ncpus=None, symprec=None, vol_tol=None):
     """
     Given a sequence of ComputedStructureEntries, use structure fitter to group
     them by structural similarity.
@@ -105,6 +162,16 @@ def group_entries_by_structure(entries, species_to_remove=None,
             which implies rigid species mapping.
         ncpus: Number of cpus to use. Use of multiple cpus can greatly improve
             fitting speed. Default of None means serial processing.
+        symprec (float): If not None, entries are only compared with
+            entries that have the same space group, determined with this
+            symprec. This greatly reduces the number of fits for large sets
+            of entries, but structures that only match within the
+            tolerances may end up in different groups. Defaults to None.
+        vol_tol (float): If not None and scale is False, entries are only
+            compared with entries of similar volume per atom, i.e., the
+            entries sorted by volume per atom are split where consecutive
+            volumes per atom differ by more than this fraction. Defaults to
+            None.
 
     Returns:
         Sequence of sequence of entries by structural similarity. e.g,
@@ -112,38 +179,33 @@ def group_entries_by_structure(entries, species_to_remove=None,
     """
     start = datetime.datetime.now()
     logger.info("Started at {}".format(start))
-    entries_host = [(entry, _get_host(entry.structure, species_to_remove))
-                    for entry in entries]
-    if ncpus:
-        symm_entries = collections.defaultdict(list)
-        for entry, host in entries_host:
-            symm_entries[comparator.get_structure_hash(host)].append((entry,
-                                                                      host))
-        import multiprocessing as mp
-        logging.info("Using {} cpus".format(ncpus))
-        manager = mp.Manager()
-        groups = manager.list()
-        p = mp.Pool(ncpus)
-        # Parallel processing only supports Python primitives and not objects.
-        p.map(_perform_grouping,
-              [(json.dumps([e[0] for e in eh], cls=MontyEncoder),
-                json.dumps([e[1] for e in eh], cls=MontyEncoder),
-                ltol, stol, angle_tol, primitive_cell, scale,
-                comparator, groups)
-               for eh in symm_entries.values()])
-    else:
-        groups = []
-        hosts = [host for entry, host in entries_host]
-        _perform_grouping((json.dumps(entries, cls=MontyEncoder),
-                           json.dumps(hosts, cls=MontyEncoder),
-                           ltol, stol, angle_tol, primitive_cell, scale,
-                           comparator, groups))
-    entry_groups = []
-    for g in groups:
-        entry_groups.append(json.loads(g, cls=MontyDecoder))
-    logging.info("Finished at {}".format(datetime.datetime.now()))
-    logging.info("Took {}".format(datetime.datetime.now() - start))
-    return entry_groups
+    entries = list(entries)
+    groups = sorted(_iter_index_groups(entries, species_to_remove, ltol, stol,
+                                       angle_tol, primitive_cell, scale,
+                                       comparator, ncpus, symprec, vol_tol))
+    logger.info("Finished at {}".format(datetime.datetime.now()))
+    logger.info("Took {}".format(datetime.datetime.now() - start))
+    return [[entries[i] for i in g] for g in groups]
+
+
+def iter_group_entries_by_structure(entries, species_to_remove=None,
+                                    ltol=0.2, stol=.4, angle_tol=5,
+                                    primitive_cell=True, scale=True,
+                                    comparator=SpeciesComparator(),
+                                    ncpus=None, symprec=None, vol_tol=None):
+    """
+    Same as group_entries_by_structure, but yields the groups of entries
+    as soon as they are found, i.e., in no particular order. See
+    group_entries_by_structure for a description of the arguments.
+
+    Yields:
+        Lists of structurally similar entries.
+    """
+    entries = list(entries)
+    for g in _iter_index_groups(entries, species_to_remove, ltol, stol,
+                                angle_tol, primitive_cell, scale, comparator,
+                                ncpus, symprec, vol_tol):
+        yield [entries[i] for i in g]
 
 
 class EntrySet(collections.abc.MutableSet, MSONable):
@@ -297,3 +359,296 @@ class EntrySet(collections.abc.MutableSet, MSONable):
                             comp[Element(elements[ind - 1])] = float(row[ind])
                     entries.append(PDEntry(Composition(comp), energy, name))
         return cls(entries)
+
+
+class EntryArray:
+    """
+    An array-backed collection of ComputedEntry/ComputedStructureEntry
+    objects. Energies and corrections are stored as arrays and compositions
+    as an (n_entries, n_elements) matrix of element amounts, so that
+    operations over very large entry sets (filtering by chemical system,
+    computing energies per atom) are vectorized. Parameters and data are
+    stored as columns, i.e., {key: [value for each entry]}, and structures
+    are only deserialized when an entry is requested.
+
+    Compositions are stored as element amounts, i.e., oxidation states in
+    the entry compositions are not retained (they are retained in the
+    structures). Parameters and data values of None are treated as missing.
+    """
+
+    def __init__(self, elements, compositions, energies, corrections=None,
+                 energy_adjustments=None, entry_ids=None, parameters=None,
+                 data=None, structures=None):
+        """
+        Args:
+            elements ([str]): Element symbols of the composition columns.
+            compositions (array): (n_entries, n_elements) array of element
+                amounts.
+            energies (array): Uncorrected energies.
+            corrections (array): Total energy corrections. Defaults to zero.
+            energy_adjustments (list): Optional list of lists of
+                EnergyAdjustments. Overrides the corrections when the
+                entries are created.
+            entry_ids (list): Optional entry ids.
+            parameters (dict): Parameters as {key: list of values}.
+            data (dict): Data as {key: list of values}.
+            structures (list): Optional list of Structures (or their
+                JSON serialization, which is decoded lazily). If given,
+                ComputedStructureEntries are created.
+        """
+        self.elements = list(elements)
+        self.energies = np.array(energies, dtype=float)
+        n = len(self.energies)
+        self.compositions = np.array(compositions, dtype=float).reshape(n, len(self.elements))
+        self.corrections = np.zeros(n) if corrections is None \
+            else np.array(corrections, dtype=float)
+        self.energy_adjustments = list(energy_adjustments) \
+            if energy_adjustments is not None else None
+        self.entry_ids = list(entry_ids) if entry_ids is not None else [None] * n
+        self.parameters = {k: list(v) for k, v in (parameters or {}).items()}
+        self.data = {k: list(v) for k, v in (data or {}).items()}
+        self._structures = list(structures) if structures is not None else None
+
+    @classmethod
+    def from_entries(cls, entries):
+        """
+        Create an EntryArray from a sequence of entries.
+
+        Args:
+            entries: Sequence of ComputedEntry or ComputedStructureEntry
+                objects. Structures are stored if all entries have one.
+
+        Returns:
+            EntryArray
+        """
+        entries = list(entries)
+        el_amts = [e.composition.get_el_amt_dict() for e in entries]
+        elements = sorted({el for d in el_amts for el in d},
+                          key=lambda el: Element(el).Z if Element.is_valid_symbol(el) else 0)
+        col = {el: i for i, el in enumerate(elements)}
+        compositions = np.zeros((len(entries), len(elements)))
+        for i, d in enumerate(el_amts):
+            for el, amt in d.items():
+                compositions[i, col[el]] = amt
+
+        def get_columns(dicts):
+            keys = []  # type: List[str]
+            for d in dicts:
+                keys.extend(k for k in d if k not in keys)
+            return {k: [d.get(k) for d in dicts] for k in keys}
+
+        energy_adjustments = [list(e.energy_adjustments) for e in entries]
+        if all(len(ea) == 0 or (len(ea) == 1 and isinstance(ea[0], ManualEnergyAdjustment))
+               for ea in energy_adjustments):
+            # Plain corrections are fully described by the corrections array.
+            energy_adjustments = None
+        has_structures = len(entries) > 0 and all(hasattr(e, "structure") for e in entries)
+        return cls(elements, compositions,
+                   [e.uncorrected_energy for e in entries],
+                   corrections=[e.correction for e in entries],
+                   energy_adjustments=energy_adjustments,
+                   entry_ids=[e.entry_id for e in entries],
+                   parameters=get_columns([e.parameters for e in entries]),
+                   data=get_columns([e.data for e in entries]),
+                   structures=[e.structure for e in entries] if has_structures else None)
+
+    def __len__(self):
+        return len(self.energies)
+
+    def __iter__(self):
+        return (self.get_entry(i) for i in range(len(self)))
+
+    def __getitem__(self, index):
+        """
+        Args:
+            index: An integer returns the entry. A slice, boolean mask or
+                integer array returns an EntryArray with the selected entries.
+        """
+        if isinstance(index, (int, np.integer)):
+            return self.get_entry(int(index))
+        indices = np.arange(len(self))[index]
+
+        def take(values):
+            return [values[i] for i in indices]
+
+        return EntryArray(
+            self.elements, self.compositions[indices], self.energies[indices],
+            corrections=self.corrections[indices],
+            energy_adjustments=take(self.energy_adjustments)
+            if self.energy_adjustments is not None else None,
+            entry_ids=take(self.entry_ids),
+            parameters={k: take(v) for k, v in self.parameters.items()},
+            data={k: take(v) for k, v in self.data.items()},
+            structures=take(self._structures) if self._structures is not None else None)
+
+    @property
+    def num_atoms(self):
+        """
+        Number of atoms in each entry.
+        """
+        return self.compositions.sum(axis=1)
+
+    @property
+    def energy(self):
+        """
+        Corrected energies of the entries.
+        """
+        return self.energies + self.corrections
+
+    @property
+    def energy_per_atom(self):
+        """
+        Corrected energies per atom of the entries.
+        """
+        return self.energy / self.num_atoms
+
+    @property
+    def chemsys(self) -> set:
+        """
+        Returns:
+            set representing the chemical system, e.g., {"Li", "Fe", "P", "O"}
+        """
+        present = (np.abs(self.compositions) > Composition.amount_tolerance).any(axis=0)
+        return {el for el, p in zip(self.elements, present) if p}
+
+    def get_chemsys_mask(self, chemsys):
+        """
+        Args:
+            chemsys: Chemical system specified as list of elements, e.g.,
+                ["Li", "O"], or as a string, e.g., "Li-O".
+
+        Returns:
+            Boolean array that is True for the entries belonging to the
+            chemical system (including all sub systems).
+        """
+        if isinstance(chemsys, str):
+            chemsys = chemsys.split("-")
+        chemsys = {str(el) for el in chemsys}
+        outside = [i for i, el in enumerate(self.elements) if el not in chemsys]
+        return ~(np.abs(self.compositions[:, outside]) > Composition.amount_tolerance).any(axis=1)
+
+    def get_subset_in_chemsys(self, chemsys):
+        """
+        Returns an EntryArray containing only the entries belonging to a
+        particular chemical system (including all sub systems). For example,
+        if the entries are from the Li-Fe-P-O system, and chemsys=["Li", "O"],
+        only the Li, O, and Li-O entries are returned.
+
+        Args:
+            chemsys: Chemical system specified as list of elements, e.g.,
+                ["Li", "O"], or as a string, e.g., "Li-O".
+
+        Returns:
+            EntryArray
+        """
+        return self[self.get_chemsys_mask(chemsys)]
+
+    def get_structure(self, i):
+        """
+        Args:
+            i (int): Index of the entry.
+
+        Returns:
+            Structure of entry i. Serialized structures are decoded on the
+            first access.
+        """
+        if self._structures is None:
+            return None
+        s = self._structures[i]
+        if isinstance(s, (str, bytes)):
+            s = pmg_json_loads(s)
+            self._structures[i] = s
+        return s
+
+    def get_entry(self, i):
+        """
+        Args:
+            i (int): Index of the entry.
+
+        Returns:
+            ComputedStructureEntry if structures are stored, ComputedEntry
+            otherwise.
+        """
+        composition = Composition({el: amt for el, amt in zip(self.elements, self.compositions[i])
+                                   if abs(amt) > Composition.amount_tolerance})
+        if self.energy_adjustments is not None:
+            kwargs = {"energy_adjustments": list(self.energy_adjustments[i])}
+        else:
+            kwargs = {"correction": float(self.corrections[i])}
+        kwargs.update(
+            parameters={k: v[i] for k, v in self.parameters.items() if v[i] is not None},
+            data={k: v[i] for k, v in self.data.items() if v[i] is not None},
+            entry_id=self.entry_ids[i])
+        energy = float(self.energies[i])
+        if self._structures is None:
+            return ComputedEntry(composition, energy, **kwargs)
+        entry = ComputedStructureEntry(self.get_structure(i), energy, **kwargs)
+        if entry.composition.element_composition != composition:
+            # e.g., normalized entries
+            entry.composition = composition
+        return entry
+
+    def to_entries(self):
+        """
+        Returns:
+            List of ComputedEntry or ComputedStructureEntry objects.
+        """
+        return list(self)
+
+    def to_file(self, filename):
+        """
+        Writes the EntryArray to a single compressed binary (numpy .npz)
+        file. Structures are stored in the compact columnar JSON format and
+        are only parsed when they are accessed after loading.
+
+        Args:
+            filename (str): Filename to write to.
+        """
+        if self._structures is not None:
+            structures = [s if isinstance(s, bytes) else s.encode("utf-8") if isinstance(s, str)
+                          else pmg_json_dumps(s.as_dict(fmt="columnar")).encode("utf-8")
+                          for s in self._structures]
+            offsets = np.cumsum([0] + [len(s) for s in structures])
+            structures_buffer = np.frombuffer(b"".join(structures), dtype=np.uint8)
+        else:
+            offsets = np.zeros(0, dtype=int)
+            structures_buffer = np.zeros(0, dtype=np.uint8)
+        metadata = pmg_json_dumps({"energy_adjustments": self.energy_adjustments,
+                                   "entry_ids": self.entry_ids,
+                                   "parameters": self.parameters,
+                                   "data": self.data,
+                                   "has_structures": self._structures is not None})
+        with open(filename, "wb") as f:
+            np.savez_compressed(f, elements=np.array(self.elements, dtype=str),
+                                compositions=self.compositions,
+                                energies=self.energies,
+                                corrections=self.corrections,
+                                metadata=np.frombuffer(metadata.encode("utf-8"), dtype=np.uint8),
+                                structures=structures_buffer,
+                                structure_offsets=offsets)
+
+    @classmethod
+    def from_file(cls, filename):
+        """
+        Reads an EntryArray written by to_file.
+
+        Args:
+            filename (str): Filename to read from.
+
+        Returns:
+            EntryArray
+        """
+        with np.load(filename, allow_pickle=False) as f:
+            metadata = pmg_json_loads(f["metadata"].tobytes().decode("utf-8"))
+            structures = None
+            if metadata["has_structures"]:
+                buffer = f["structures"].tobytes()
+                offsets = f["structure_offsets"]
+                structures = [buffer[i:j] for i, j in zip(offsets[:-1], offsets[1:])]
+            return cls(f["elements"].tolist(), f["compositions"], f["energies"],
+                       corrections=f["corrections"],
+                       energy_adjustments=metadata["energy_adjustments"],
+                       entry_ids=metadata["entry_ids"],
+                       parameters=metadata["parameters"],
+                       data=metadata["data"],
+                       structures=structures)
@@ -655,6 +655,28 @@ class OxideTypeCorrectionTest(unittest.TestCase):
         li2o_entry_corrected = self.compat.process_entry(li2o_entry)
         self.assertAlmostEqual(li2o_entry_corrected.energy, -3.0 - 0.66975, 4)
 
+    def test_process_entries_batch(self):
+        latt = Lattice.from_parameters(3.278, 3.278, 3.278, 60, 60, 60)
+        struct = Structure(latt, ["Li", "Li", "O"],
+                           [[0.25, 0.25, 0.25], [0.75, 0.75, 0.75], [0, 0, 0]])
+        params = {'is_hubbard': False, 'hubbards': None, 'run_type': 'GGA',
+                  'potcar_spec': [{'titel': 'PAW_PBE Li 17Jan2003', 'hash': '65e83282d1707ec078c1012afbd05be8'},
+                                  {'titel': 'PAW_PBE O 08Apr2002', 'hash': '7a25bc5b9a5393f46600a4939d357982'}]}
+        entries = [ComputedStructureEntry(struct, -3, parameters=params) for i in range(4)]
+        entries.append(ComputedStructureEntry(struct, -3, parameters=dict(params, run_type="HF")))
+        processed = self.compat.process_entries(entries)
+        self.assertEqual(len(processed), 4)
+        for e in processed:
+            self.assertAlmostEqual(e.energy, -3.0 - 0.66975, 4)
+        anion_correction = self.compat.corrections[2]
+        self.assertEqual(len([k for k in anion_correction._anion_types if k[0] == "oxide_type"]), 1)
+
+        entries = [ComputedStructureEntry(struct, -3, parameters=params) for i in range(4)]
+        processed = self.compat.process_entries(entries, ncpus=2, chunk_size=2)
+        self.assertEqual([id(e) for e in processed], [id(e) for e in entries])
+        for e in processed:
+            self.assertAlmostEqual(e.energy, -3.0 - 0.66975, 4)
+
 
 class OxideTypeCorrectionNoPeroxideCorrTest(unittest.TestCase):
 
@@ -9,6 +9,7 @@ import os
 
 from collections import defaultdict
 from pymatgen.io.vasp.outputs import Vasprun
+from pymatgen.util.serialization import pmg_json_dumps, pmg_json_loads
 from pymatgen.entries.computed_entries import ComputedEntry, \
     ComputedStructureEntry, EnergyAdjustment, ConstantEnergyAdjustment, \
     CompositionEnergyAdjustment, TemperatureEnergyAdjustment, ManualEnergyAdjustment
@@ -204,6 +205,29 @@ class ComputedStructureEntryTest(unittest.TestCase):
         e = ComputedStructureEntry.from_dict(d)
         self.assertAlmostEqual(e.energy, -269.38319884)
 
+    def test_to_from_dict_columnar(self):
+        self.entry.energy_adjustments.append(ConstantEnergyAdjustment(-1.0))
+        d = self.entry.as_dict(fmt="columnar")
+        self.assertEqual(d["structure"]["fmt"], "columnar")
+        e = ComputedStructureEntry.from_dict(d)
+        self.assertAlmostEqual(e.energy, -270.38319884)
+        self.assertEqual(e.structure, self.entry.structure)
+        e = pmg_json_loads(pmg_json_dumps(d))
+        self.assertAlmostEqual(e.energy, -270.38319884)
+        self.assertEqual(e.structure, self.entry.structure)
+        self.assertEqual(e.parameters, self.entry.parameters)
+
+        # the in-memory round trip does not share state with the original
+        self.entry.data["forces"] = [[0.0, 0.0, 1.0]]
+        e = ComputedStructureEntry.from_dict(self.entry.as_dict(fmt="columnar"))
+        e.energy_adjustments[-1].value = -2.0
+        e.data["forces"][0][2] = 2.0
+        e.parameters.setdefault("hubbards", {})["Fe"] = 5.3
+        self.assertAlmostEqual(self.entry.energy, -270.38319884)
+        self.assertEqual(self.entry.data["forces"], [[0.0, 0.0, 1.0]])
+        self.assertNotEqual(e.parameters, self.entry.parameters)
+        self.assertAlmostEqual(e.energy, -271.38319884)
+
     def test_str(self):
         self.assertIsNotNone(str(self.entry))
 
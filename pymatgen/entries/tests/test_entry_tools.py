@@ -6,9 +6,13 @@
 import unittest
 from pathlib import Path
 from monty.serialization import loadfn, dumpfn
+from monty.tempfile import ScratchDir
 import os
+import numpy as np
 from pymatgen.core.periodic_table import Element
-from pymatgen.entries.entry_tools import group_entries_by_structure, EntrySet
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.entries.entry_tools import group_entries_by_structure, \
+    iter_group_entries_by_structure, EntrySet, EntryArray
 
 test_dir = Path(__file__).absolute().parent / ".." / ".." / ".." / 'test_files'
 
@@ -24,6 +28,16 @@ class FuncTest(unittest.TestCase):
         # Make sure no entries are left behind
         self.assertEqual(sum([len(g) for g in groups]), len(entries))
 
+        groups_parallel = group_entries_by_structure(entries, ncpus=2)
+        self.assertEqual([[e.entry_id for e in g] for g in groups_parallel],
+                         [[e.entry_id for e in g] for g in groups])
+        groups_iter = list(iter_group_entries_by_structure(entries, ncpus=2))
+        self.assertEqual(sorted([len(g) for g in groups_iter]),
+                         [1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 4])
+        groups = group_entries_by_structure(entries, scale=False, vol_tol=0.3)
+        self.assertEqual(sorted([len(g) for g in groups]),
+                         [1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 4])
+
 
 class EntrySetTest(unittest.TestCase):
 
@@ -52,6 +66,59 @@ class EntrySetTest(unittest.TestCase):
         os.remove("temp_entry_set.json")
 
 
+class EntryArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.entries = loadfn(str(test_dir / "Li-Fe-P-O_entries.json"))
+        self.entry_array = EntryArray.from_entries(self.entries)
+
+    def test_energy_per_atom(self):
+        self.assertEqual(len(self.entry_array), len(self.entries))
+        np.testing.assert_allclose(self.entry_array.energy_per_atom,
+                                   [e.energy_per_atom for e in self.entries])
+        self.assertEqual(self.entry_array.chemsys, {'Fe', 'Li', 'O', 'P'})
+
+    def test_get_subset_in_chemsys(self):
+        subset = self.entry_array.get_subset_in_chemsys(["Li", "O"])
+        expected = EntrySet(self.entries).get_subset_in_chemsys(["Li", "O"])
+        self.assertEqual(sorted(e.entry_id for e in subset),
+                         sorted(e.entry_id for e in expected))
+        self.assertEqual(len(self.entry_array.get_subset_in_chemsys("Fe-O-F")),
+                         len(self.entry_array.get_subset_in_chemsys("Fe-O")))
+
+    def test_to_entries(self):
+        for e1, e2 in zip(self.entries, self.entry_array.to_entries()):
+            self.assertEqual(e1.composition, e2.composition)
+            self.assertAlmostEqual(e1.energy, e2.energy)
+            self.assertAlmostEqual(e1.correction, e2.correction)
+            self.assertEqual(e1.entry_id, e2.entry_id)
+            self.assertEqual(e1.parameters, e2.parameters)
+
+    def test_to_from_file(self):
+        entries = loadfn(str(test_dir / "TiO2_entries.json"))
+        entry_array = EntryArray.from_entries(entries)
+        with ScratchDir("."):
+            entry_array.to_file("entries.npz")
+            entry_array = EntryArray.from_file("entries.npz")
+        self.assertIsInstance(entry_array._structures[0], bytes)
+        for e1, e2 in zip(entries, entry_array):
+            self.assertIsInstance(e2, ComputedStructureEntry)
+            self.assertEqual(e1.structure, e2.structure)
+            self.assertAlmostEqual(e1.energy, e2.energy)
+            self.assertEqual(e1.entry_id, e2.entry_id)
+
+    def test_empty(self):
+        entry_array = EntryArray.from_entries([])
+        self.assertEqual(len(entry_array), 0)
+        self.assertEqual(entry_array.compositions.shape, (0, 0))
+        self.assertEqual(entry_array.to_entries(), [])
+        with ScratchDir("."):
+            entry_array.to_file("entries.npz")
+            entry_array = EntryArray.from_file("entries.npz")
+        self.assertEqual(len(entry_array), 0)
+        self.assertEqual(list(entry_array), [])
+
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
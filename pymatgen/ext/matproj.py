@@ -15,15 +15,21 @@ https://www.materialsproject.org/dashboard.
 import sys
 import itertools
 import json
+import os
 import platform
 import re
+import hashlib
+import sqlite3
+import threading
 import warnings
-from time import sleep
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time
 import requests
 from monty.json import MontyDecoder, MontyEncoder
 
 from enum import Enum, unique
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from pymatgen import SETTINGS, __version__ as pmg_version
 
@@ -103,7 +109,8 @@ class MPRester:
                                  "is_compatible", "spacegroup",
                                  "band_gap", "density", "icsd_id", "cif")
 
-    def __init__(self, api_key=None, endpoint=None, include_user_agent=True):
+    def __init__(self, api_key=None, endpoint=None, include_user_agent=True,
+                 cache=None, offline=False):
         """
         Args:
             api_key (str): A String API key for accessing the MaterialsProject
@@ -122,6 +129,12 @@ class MPRester:
                 making the API request. This helps MP support pymatgen users, and
                 is similar to what most web browsers send with each page request.
                 Set to False to disable the user agent.
+            cache (str/MPRestCache): Path of an on-disk cache of responses, or
+                an MPRestCache for more control over expiry and size. If this
+                is None, the code will check if there is a "PMG_MAPI_CACHE"
+                setting. Defaults to no caching.
+            offline (bool): Whether to serve all requests from the cache only,
+                without accessing the network. Requires a cache.
         """
         if api_key is not None:
             self.api_key = api_key
@@ -136,6 +149,15 @@ class MPRester:
         if self.preamble != "https://materialsproject.org/rest/v2":
             warnings.warn("Non-default endpoint used: {}".format(self.preamble))
 
+        if cache is None:
+            cache = SETTINGS.get("PMG_MAPI_CACHE")
+        if cache is not None and not isinstance(cache, MPRestCache):
+            cache = MPRestCache(cache)
+        if offline and cache is None:
+            raise ValueError("Offline mode requires a cache.")
+        self.cache = cache
+        self.offline = offline
+
         self.session = requests.Session()
         self.session.headers = {"x-api-key": self.api_key}
         if include_user_agent:
@@ -145,6 +167,9 @@ class MPRester:
             platform_info = "{}/{}".format(platform.system(), platform.release())
             self.session.headers["user-agent"] = "{} ({} {})".format(
                 pymatgen_info, python_info, platform_info)
+        # requests.Session is not thread-safe, so worker threads of chunked
+        # queries use their own sessions, stored here.
+        self._local = threading.local()
 
     def __enter__(self):
         """
@@ -162,25 +187,35 @@ class MPRester:
                       mp_decode=True):
         response = None
         url = self.preamble + sub_url
+        text = None
+        if self.cache is not None:
+            key = self.cache.get_key(method, url, payload)
+            text = self.cache.get(key, ignore_ttl=self.offline)
+            if text is None and self.offline:
+                raise MPRestError("No cached response for {} in offline mode."
+                                  .format(url))
+        session = getattr(self._local, "session", None) or self.session
         try:
-            if method == "POST":
-                response = self.session.post(url, data=payload, verify=True)
-            else:
-                response = self.session.get(url, params=payload, verify=True)
-            if response.status_code in [200, 400]:
-                if mp_decode:
-                    data = json.loads(response.text, cls=MontyDecoder)
+            if text is None:
+                if method == "POST":
+                    response = session.post(url, data=payload, verify=True)
                 else:
-                    data = json.loads(response.text)
-                if data["valid_response"]:
-                    if data.get("warning"):
-                        warnings.warn(data["warning"])
-                    return data["response"]
-                else:
-                    raise MPRestError(data["error"])
-
-            raise MPRestError("REST query returned with error status code {}"
-                              .format(response.status_code))
+                    response = session.get(url, params=payload, verify=True)
+                if response.status_code not in [200, 400]:
+                    raise MPRestError("REST query returned with error status "
+                                      "code {}".format(response.status_code))
+                text = response.text
+            if mp_decode:
+                data = json.loads(text, cls=MontyDecoder)
+            else:
+                data = json.loads(text)
+            if data["valid_response"]:
+                if self.cache is not None and response is not None:
+                    self.cache.set(key, text)
+                if data.get("warning"):
+                    warnings.warn(data["warning"])
+                return data["response"]
+            raise MPRestError(data["error"])
 
         except Exception as ex:
             msg = "{}. Content: {}".format(str(ex), response.content) \
@@ -699,20 +734,62 @@ class MPRester:
             List of ComputedEntries.
 
         """
-        if isinstance(elements, str):
-            elements = elements.split('-')
+        return self.get_entries_in_chemsyses(
+            [elements], compatible_only=compatible_only,
+            inc_structure=inc_structure, property_data=property_data,
+            conventional_unit_cell=conventional_unit_cell)[0]
 
-        all_chemsyses = []
-        for i in range(len(elements)):
-            for els in itertools.combinations(elements, i + 1):
-                all_chemsyses.append('-'.join(sorted(els)))
+    def get_entries_in_chemsyses(self, chemsyses, compatible_only=True,
+                                 inc_structure=None, property_data=None,
+                                 conventional_unit_cell=False):
+        """
+        Gets the ComputedEntries of many chemical systems at once, e.g., to
+        build many phase diagrams. The union of all sub-chemical systems is
+        fetched in a single query, so entries shared between the systems
+        (e.g., the elemental and binary phases) are only fetched once.
+
+        Args:
+            chemsyses ([str or [str]]): List of chemical systems, each a
+                string of element symbols separated by dashes, e.g.,
+                "Li-Fe-O" or a list of element symbols, e.g.,
+                ["Li", "Fe", "O"].
+            compatible_only (bool): Whether to return only "compatible"
+                entries. See get_entries_in_chemsys.
+            inc_structure (str): If None, entries returned are
+                ComputedEntries. If inc_structure="final",
+                ComputedStructureEntries with final structures are returned.
+                Otherwise, ComputedStructureEntries with initial structures
+                are returned.
+            property_data (list): Specify additional properties to include in
+                entry.data. If None, no data. Should be a subset of
+                supported_properties.
+            conventional_unit_cell (bool): Whether to get the standard
+                conventional unit cell
 
-        entries = self.get_entries({"chemsys": {"$in": all_chemsyses}},
+        Returns:
+            List of lists of ComputedEntries, one for each chemical system
+            in the same order. Entries in several systems are the same
+            objects.
+        """
+        systems = []
+        all_chemsyses = set()
+        for elements in chemsyses:
+            if isinstance(elements, str):
+                elements = elements.split('-')
+            systems.append(set(elements))
+            for i in range(len(elements)):
+                for els in itertools.combinations(elements, i + 1):
+                    all_chemsyses.add('-'.join(sorted(els)))
+
+        entries = self.get_entries({"chemsys": {"$in": sorted(all_chemsyses)}},
                                    compatible_only=compatible_only,
                                    inc_structure=inc_structure,
                                    property_data=property_data,
                                    conventional_unit_cell=conventional_unit_cell)
-        return entries
+        entry_elements = [{el.symbol for el in e.composition.elements}
+                          for e in entries]
+        return [[e for e, els in zip(entries, entry_elements) if els <= system]
+                for system in systems]
 
     def get_exp_thermo_data(self, formula):
         """
@@ -743,7 +820,7 @@ class MPRester:
                         self.get_exp_thermo_data(formula))
 
     def query(self, criteria, properties, chunk_size=500, max_tries_per_chunk=5,
-              mp_decode=True):
+              mp_decode=True, nproc=1, backoff=5):
         r"""
 
         Performs an advanced query using MongoDB-like syntax for directly
@@ -764,7 +841,9 @@ class MPRester:
         can opt out of this behavior by setting CHUNK_SIZE=0. To guard against
         intermittent server errors in the case of many chunks per query,
         possibly-transient server errors will result in re-trying a give chunk
-        up to MAX_TRIES_PER_CHUNK times.
+        up to MAX_TRIES_PER_CHUNK times. Up to NPROC chunks are fetched
+        concurrently. Use query_iter to process the results chunk by chunk
+        instead of holding all of them in memory.
 
         Args:
             criteria (str/dict): Criteria of the query as a string or
@@ -802,6 +881,10 @@ class MPRester:
             mp_decode (bool): Whether to do a decoding to a Pymatgen object
                 where possible. In some cases, it might be useful to just get
                 the raw python dict, i.e., set to False.
+            nproc (int): Number of chunks to fetch concurrently. Defaults to 1,
+                i.e., chunks are fetched one after another.
+            backoff (float): Seconds to wait before re-trying a chunk after a
+                5xx error. The wait is doubled after each failed try.
 
         Returns:
             List of results. E.g.,
@@ -827,33 +910,136 @@ class MPRester:
                 "/query", payload=payload, method="POST", mp_decode=mp_decode)
 
         data = []
+        for chunk_data in self._query_chunks(criteria, properties, chunk_size,
+                                             max_tries_per_chunk, mp_decode,
+                                             nproc, backoff):
+            data.extend(chunk_data)
+        return data
+
+    def query_iter(self, criteria, properties, chunk_size=500,
+                   max_tries_per_chunk=5, mp_decode=True, nproc=1, backoff=5):
+        """
+        Same as query, but yields the results as the chunks arrive instead of
+        returning one list, so that only the chunks being fetched are held in
+        memory. Results are yielded in the same order as query returns them.
+
+        Args:
+            criteria (str/dict): Criteria of the query. See query.
+            properties (list): Properties to request for as a list.
+            chunk_size (int): Number of materials for which to fetch data at a
+                time. Use chunk_size=0 to force no chunking.
+            max_tries_per_chunk (int): How many times to re-try fetching a given
+                chunk when the server gives a 5xx error.
+            mp_decode (bool): Whether to do a decoding to a Pymatgen object
+                where possible.
+            nproc (int): Number of chunks to fetch concurrently.
+            backoff (float): Seconds to wait before re-trying a chunk after a
+                5xx error. The wait is doubled after each failed try.
+
+        Yields:
+            Results, e.g., {u'formula': {u'O': 1, u'Li': 2.0}}
+        """
+        if not isinstance(criteria, dict):
+            criteria = self.parse_criteria(criteria)
+        if chunk_size == 0:
+            yield from self.query(criteria, properties, chunk_size=0,
+                                  mp_decode=mp_decode)
+            return
+
+        count_payload = {"criteria": json.dumps(criteria),
+                         "properties": json.dumps(properties),
+                         "options": json.dumps({"count_only": True})}
+        num_results = self._make_request(
+            "/query", payload=count_payload, method="POST")
+        if num_results <= chunk_size:
+            yield from self.query(criteria, properties, chunk_size=0,
+                                  mp_decode=mp_decode)
+            return
+
+        for chunk_data in self._query_chunks(criteria, properties, chunk_size,
+                                             max_tries_per_chunk, mp_decode,
+                                             nproc, backoff):
+            yield from chunk_data
+
+    def _query_chunks(self, criteria, properties, chunk_size,
+                      max_tries_per_chunk, mp_decode, nproc, backoff):
+        """
+        Yields the results of a query one chunk of material ids at a time,
+        in order. Up to nproc chunks are fetched concurrently, and at most
+        2 * nproc fetched chunks are held before they are consumed. With
+        nproc > 1, each worker thread uses its own requests.Session (with the
+        same headers as self.session), since sessions are not thread-safe.
+        With nproc == 1, chunks are fetched serially with self.session.
+        """
         mids = [d["material_id"] for d in
                 self.query(criteria, ["material_id"], chunk_size=0)]
-        chunks = get_chunks(mids, size=chunk_size)
+        chunks = iter(get_chunks(mids, size=chunk_size))
         progress_bar = PBar(total=len(mids))
-        for chunk in chunks:
+
+        def fetch(chunk):
             chunk_criteria = criteria.copy()
             chunk_criteria.update({"material_id": {"$in": chunk}})
-            num_tries = 0
-            while num_tries < max_tries_per_chunk:
+            return self._query_chunk(chunk_criteria, properties,
+                                     max_tries_per_chunk, mp_decode, backoff)
+
+        if nproc == 1:
+            for chunk in chunks:
+                chunk_data = fetch(chunk)
+                progress_bar.update(len(chunk))
+                yield chunk_data
+            return
+
+        worker_sessions = []
+
+        def fetch_in_worker(chunk):
+            if getattr(self._local, "session", None) is None:
+                session = requests.Session()
+                session.headers = self.session.headers.copy()
+                self._local.session = session
+                worker_sessions.append(session)
+            return fetch(chunk)
+
+        pending = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=nproc) as executor:
                 try:
-                    data.extend(self.query(chunk_criteria, properties,
-                                           chunk_size=0, mp_decode=mp_decode))
-                    break
-                except MPRestError as e:
-                    match = re.search(r"error status code (\d+)", e.message)
-                    if match:
-                        if not match.group(1).startswith("5"):
-                            raise e
-                        else:  # 5xx error. Try again
-                            num_tries += 1
-                            print(
-                                "Unknown server error. Trying again in five "
-                                "seconds (will try at most {} times)...".format(
-                                    max_tries_per_chunk))
-                            sleep(5)
-            progress_bar.update(len(chunk))
-        return data
+                    for chunk in itertools.islice(chunks, 2 * nproc):
+                        pending.append((len(chunk), executor.submit(fetch_in_worker, chunk)))
+                    while pending:
+                        size, future = pending.popleft()
+                        chunk_data = future.result()
+                        for chunk in itertools.islice(chunks, 1):
+                            pending.append((len(chunk), executor.submit(fetch_in_worker, chunk)))
+                        progress_bar.update(size)
+                        yield chunk_data
+                finally:
+                    for _, future in pending:
+                        future.cancel()
+        finally:
+            for session in worker_sessions:
+                session.close()
+
+    def _query_chunk(self, criteria, properties, max_tries, mp_decode,
+                     backoff):
+        """
+        Performs a single unchunked query, re-trying after 5xx errors.
+        """
+        num_tries = 0
+        while True:
+            try:
+                return self.query(criteria, properties, chunk_size=0,
+                                  mp_decode=mp_decode)
+            except MPRestError as e:
+                num_tries += 1
+                match = re.search(r"error status code (\d+)", str(e))
+                if not (match and match.group(1).startswith("5")) or \
+                        num_tries >= max_tries:
+                    raise e
+                # 5xx error. Try again
+                wait = backoff * 2 ** (num_tries - 1)
+                print("Unknown server error. Trying again in {} seconds (will "
+                      "try at most {} times)...".format(wait, max_tries))
+                sleep(wait)
 
     def submit_structures(self, structures, authors, projects=None,
                           references='', remarks=None, data=None,
@@ -1452,6 +1638,117 @@ class MPRester:
             return {"$or": list(map(parse_tok, toks))}
 
 
+class MPRestCache:
+    """
+    A persistent on-disk cache of Materials API responses. Responses are
+    stored as compressed JSON text in a SQLite database, keyed by the
+    request method, url and payload. Entries older than ttl are not served,
+    and the least recently used entries are evicted once the total size of
+    the stored responses exceeds max_size.
+    """
+
+    def __init__(self, path=os.path.join(os.path.expanduser("~"), ".pmg_mapi_cache.sqlite"),
+                 ttl=7 * 24 * 3600, max_size=2 ** 30):
+        """
+        Args:
+            path (str): Path of the SQLite database. Created if it does not
+                exist.
+            ttl (float): Time in seconds after which a cached response
+                expires. Use None for responses that never expire.
+            max_size (int): Maximum total size in bytes of the compressed
+                responses.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                             "data BLOB, size INTEGER, created REAL, accessed REAL)")
+
+    @staticmethod
+    def get_key(method, url, payload):
+        """
+        Returns the cache key of a request.
+
+        Args:
+            method (str): "GET" or "POST".
+            url (str): Full url of the request.
+            payload (dict): Payload of the request.
+
+        Returns:
+            str: Key of the request.
+        """
+        return hashlib.sha1(json.dumps([method, url, payload], sort_keys=True)
+                            .encode()).hexdigest()
+
+    def get(self, key, ignore_ttl=False):
+        """
+        Returns the cached response text for a key, or None if there is no
+        cached response or it has expired. Expired responses are kept on
+        disk until they are replaced by set() or removed by purge().
+
+        Args:
+            key (str): Key of the request.
+            ignore_ttl (bool): Whether to also serve expired responses,
+                e.g., when no new response can be fetched.
+        """
+        with self._lock, self._db:
+            row = self._db.execute("SELECT data, created FROM responses WHERE key = ?",
+                                   (key,)).fetchone()
+            if row is None:
+                return None
+            now = time()
+            if not ignore_ttl and self.ttl is not None and now - row[1] > self.ttl:
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return zlib.decompress(row[0]).decode()
+
+    def set(self, key, text):
+        """
+        Stores the response text for a key, evicting the least recently used
+        responses if the cache becomes too large.
+        """
+        data = zlib.compress(text.encode())
+        now = time()
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                             (key, data, len(data), now, now))
+            total = self._db.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+            if total > self.max_size:
+                rows = self._db.execute("SELECT key, size FROM responses "
+                                        "ORDER BY accessed").fetchall()
+                evict = []
+                for k, size in rows:
+                    if total <= self.max_size:
+                        break
+                    evict.append((k,))
+                    total -= size
+                self._db.executemany("DELETE FROM responses WHERE key = ?", evict)
+
+    def purge(self):
+        """
+        Removes all expired responses.
+        """
+        if self.ttl is None:
+            return
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses WHERE created < ?",
+                             (time() - self.ttl,))
+
+    def clear(self):
+        """
+        Removes all cached responses.
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
 class MPRestError(Exception):
     """
     Exception class for MPRestAdaptor.
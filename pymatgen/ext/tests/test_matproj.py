@@ -4,11 +4,18 @@
 import platform
 import re
 import unittest
+import unittest.mock
 import warnings
 import random
 import sys
+import json
+import threading
+import requests
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+from monty.tempfile import ScratchDir
 from pymatgen import SETTINGS, __version__ as pmg_version
-from pymatgen.ext.matproj import MPRester, MPRestError, TaskType
+from pymatgen.ext.matproj import MPRester, MPRestError, TaskType, MPRestCache
 from pymatgen.core.periodic_table import Element
 from pymatgen.core.structure import Structure, Composition
 from pymatgen.entries.computed_entries import ComputedEntry
@@ -473,5 +480,215 @@ class MPResterTest(PymatgenTest):
         self.assertNotIn("user-agent", self.rester.session.headers, msg="user-agent header unwanted")
 
 
+class _FakeQueryHandler(BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for the /query endpoint of the Materials API.
+    """
+    docs = [{"material_id": "mp-%d" % i, "pretty_formula": "Li%dO" % i}
+            for i in range(23)]
+    # number of 5xx errors to return for queries containing a material id
+    failures = {}
+    error_code = 503
+    num_requests = 0
+    api_keys = set()
+
+    def do_POST(self):
+        _FakeQueryHandler.num_requests += 1
+        _FakeQueryHandler.api_keys.add(self.headers.get("x-api-key"))
+        length = int(self.headers["Content-Length"])
+        form = parse_qs(self.rfile.read(length).decode())
+        criteria = json.loads(form["criteria"][0])
+        properties = json.loads(form["properties"][0])
+        mids = criteria.get("material_id")
+        if isinstance(mids, dict):
+            mids = mids["$in"]
+        elif mids is not None:
+            mids = [mids]
+        docs = [d for d in self.docs if mids is None or d["material_id"] in mids]
+        if "chemsys" in criteria:
+            docs = [d for d in docs if d["chemsys"] in criteria["chemsys"]["$in"]]
+        for mid in mids or []:
+            if self.failures.get(mid):
+                self.failures[mid] -= 1
+                self.send_response(self.error_code)
+                self.end_headers()
+                return
+        if "options" in form and json.loads(form["options"][0]).get("count_only"):
+            response = len(docs)
+        else:
+            response = [{k: d[k] for k in properties} for d in docs]
+        body = json.dumps({"valid_response": True,
+                           "response": response}).encode()
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MPResterLocalServerTest(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter("ignore")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeQueryHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.rester = MPRester(
+            api_key="dummy",
+            endpoint="http://127.0.0.1:%d" % self.server.server_address[1])
+        _FakeQueryHandler.failures = {}
+        _FakeQueryHandler.error_code = 503
+        _FakeQueryHandler.num_requests = 0
+        _FakeQueryHandler.api_keys = set()
+
+    def tearDown(self):
+        warnings.simplefilter("default")
+        self.rester.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_query_concurrent(self):
+        props = ["material_id", "pretty_formula"]
+        data = self.rester.query({}, props, chunk_size=0)
+        self.assertEqual(data, _FakeQueryHandler.docs)
+        for nproc in (1, 4):
+            self.assertEqual(self.rester.query({}, props, chunk_size=5,
+                                               nproc=nproc), data)
+        results = self.rester.query_iter({}, props, chunk_size=5, nproc=3)
+        self.assertNotIsInstance(results, list)
+        self.assertEqual(list(results), data)
+        self.assertEqual(list(self.rester.query_iter({}, props, chunk_size=50)),
+                         data)
+        self.assertEqual(next(self.rester.query_iter({}, props, chunk_size=5,
+                                                     nproc=2)), data[0])
+
+    def test_query_worker_sessions(self):
+        props = ["material_id"]
+        sessions = []
+        session_cls = requests.Session
+
+        def make_session():
+            session = session_cls()
+            sessions.append(session)
+            return session
+
+        with unittest.mock.patch("pymatgen.ext.matproj.requests.Session",
+                                 side_effect=make_session):
+            self.assertEqual(len(self.rester.query({}, props, chunk_size=5,
+                                                   nproc=3)), 23)
+        # Worker threads get their own sessions with the same headers.
+        self.assertTrue(1 <= len(sessions) <= 3)
+        self.assertEqual(_FakeQueryHandler.api_keys, {"dummy"})
+        self.assertIsNone(getattr(self.rester._local, "session", None))
+
+        # Serial queries use the main session.
+        del sessions[:]
+        with unittest.mock.patch("pymatgen.ext.matproj.requests.Session",
+                                 side_effect=make_session):
+            self.assertEqual(len(self.rester.query({}, props, chunk_size=5,
+                                                   nproc=1)), 23)
+        self.assertEqual(sessions, [])
+
+    def test_query_retry(self):
+        props = ["pretty_formula"]
+        _FakeQueryHandler.failures = {"mp-7": 2, "mp-21": 1}
+        data = self.rester.query({}, props, chunk_size=5, nproc=3, backoff=0)
+        self.assertEqual(len(data), 23)
+        self.assertEqual(_FakeQueryHandler.failures, {"mp-7": 0, "mp-21": 0})
+
+        _FakeQueryHandler.failures = {"mp-7": 3}
+        self.assertRaises(MPRestError, self.rester.query, {}, props,
+                          chunk_size=5, max_tries_per_chunk=3, backoff=0)
+        _FakeQueryHandler.failures = {"mp-7": 1}
+        _FakeQueryHandler.error_code = 404
+        self.assertRaises(MPRestError, self.rester.query, {}, props,
+                          chunk_size=5, backoff=0)
+
+    def test_get_entries_in_chemsyses(self):
+        formulas = ["Li", "Fe", "O2", "Na", "Li2O", "FeO", "LiFeO2", "Na2O",
+                    "NaFeO2", "LiNaO"]
+        docs = []
+        for i, formula in enumerate(formulas):
+            comp = Composition(formula)
+            docs.append({
+                "material_id": "mp-%d" % i, "task_id": "mp-%d" % i,
+                "chemsys": "-".join(sorted(el.symbol for el in comp)),
+                "energy": -1.0 * i, "unit_cell_formula": comp.as_dict(),
+                "run_type": "GGA", "is_hubbard": False, "hubbards": {},
+                "potcar_symbols": [], "oxide_type": "oxide",
+                "pseudo_potential": {"functional": "PBE",
+                                     "labels": [el.symbol for el in comp]}})
+        _FakeQueryHandler.docs, all_docs = docs, _FakeQueryHandler.docs
+        try:
+            systems = self.rester.get_entries_in_chemsyses(
+                ["Li-Fe-O", ["O", "Na"], "Fe"], compatible_only=False)
+            self.assertEqual(_FakeQueryHandler.num_requests, 2)
+            self.assertEqual(
+                [sorted(e.composition.reduced_formula for e in entries)
+                 for entries in systems],
+                [["Fe", "FeO", "Li", "Li2O", "LiFeO2", "O2"],
+                 ["Na", "Na2O", "O2"], ["Fe"]])
+            self.assertIs(systems[0][1], systems[2][0])
+            entries = self.rester.get_entries_in_chemsys(
+                ["Na", "O"], compatible_only=False)
+            self.assertEqual([e.entry_id for e in entries],
+                             [e.entry_id for e in systems[1]])
+        finally:
+            _FakeQueryHandler.docs = all_docs
+
+    def test_cache(self):
+        props = ["material_id", "pretty_formula"]
+        with ScratchDir("."):
+            rester = MPRester(api_key="dummy", endpoint=self.rester.preamble,
+                              cache="cache.sqlite")
+            data = rester.query({}, props, chunk_size=5, nproc=2)
+            num_requests = _FakeQueryHandler.num_requests
+            self.assertEqual(len(rester.cache), num_requests)
+            self.assertEqual(rester.query({}, props, chunk_size=5), data)
+            self.assertEqual(_FakeQueryHandler.num_requests, num_requests)
+            self.assertEqual(rester.query({"material_id": "mp-1"}, props,
+                                          chunk_size=0), data[1:2])
+            self.assertEqual(_FakeQueryHandler.num_requests, num_requests + 1)
+
+            # offline mode only serves cached responses
+            offline = MPRester(api_key="dummy", endpoint=self.rester.preamble,
+                               cache=MPRestCache("cache.sqlite"), offline=True)
+            self.assertEqual(offline.query({}, props, chunk_size=5), data)
+            self.assertRaises(MPRestError, offline.query, {}, ["material_id"])
+            self.assertEqual(_FakeQueryHandler.num_requests, num_requests + 1)
+            self.assertRaises(ValueError, MPRester, api_key="dummy",
+                              offline=True)
+
+            # failed requests are not cached
+            _FakeQueryHandler.failures = {"mp-2": 1}
+            self.assertRaises(MPRestError, rester.query,
+                              {"material_id": "mp-2"}, props, chunk_size=0)
+            self.assertEqual(rester.query({"material_id": "mp-2"}, props,
+                                          chunk_size=0), data[2:3])
+
+            # offline mode serves expired responses and keeps them on disk
+            stale = MPRester(api_key="dummy", endpoint=self.rester.preamble,
+                             cache=MPRestCache("cache.sqlite", ttl=0),
+                             offline=True)
+            num_cached = len(stale.cache)
+            self.assertEqual(stale.query({}, props, chunk_size=5), data)
+            self.assertEqual(len(stale.cache), num_cached)
+
+            cache = MPRestCache("cache.sqlite", ttl=0)
+            key = cache.get_key("POST", "url", {"a": 1})
+            cache.set(key, "[1]")
+            self.assertIsNone(cache.get(key))
+            self.assertEqual(cache.get(key, ignore_ttl=True), "[1]")
+            cache.purge()
+            self.assertEqual(len(cache), 0)
+            cache = MPRestCache("small.sqlite", max_size=100)
+            for i in range(5):
+                cache.set(str(i), json.dumps(list(range(i * 20, i * 20 + 20))))
+            self.assertIsNone(cache.get("0"))
+            self.assertEqual(json.loads(cache.get("4")), list(range(80, 100)))
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
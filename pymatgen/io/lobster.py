@@ -76,95 +76,182 @@ class Cohpcar:
 
     """
 
-    def __init__(self, are_coops: bool = False, filename: str = None):
+    def __init__(self, are_coops: bool = False, filename: str = None, labels: Optional[List[str]] = None):
         """
         Args:
             are_coops: Determines if the file is a list of COHPs or COOPs.
               Default is False for COHPs.
             filename: Name of the COHPCAR file. If it is None, the default
               file name will be chosen, depending on the value of are_coops.
+            labels: Labels of the bonds whose (orbital-resolved) COHPs are
+              read in, e.g. ["1", "5"]. The average is always read. Use an
+              empty list to read only the average. If None, all bonds are
+              read. Further bonds can be read in later with load_labels.
         """
         self.are_coops = are_coops
         if filename is None:
             filename = "COOPCAR.lobster" if are_coops \
                 else "COHPCAR.lobster"
+        self._filename = filename
 
+        # Only the header is kept in memory; the numeric block is streamed
+        # and converted in bulk, keeping only the columns that are needed.
         with zopen(filename, "rt") as f:
-            contents = f.read().split("\n")
+            f.readline()
+            # The parameters line is the second line in a COHPCAR file. It
+            # contains all parameters that are needed to map the file.
+            parameters = f.readline().split()
+            # Subtract 1 to skip the average
+            num_bonds = int(parameters[0]) - 1
+            self.efermi = float(parameters[-1])
+            if int(parameters[1]) == 2:
+                self._spins = [Spin.up, Spin.down]
+                self.is_spin_polarized = True
+            else:
+                self._spins = [Spin.up]
+                self.is_spin_polarized = False
+            self._num_bonds = num_bonds
+            self._num_columns = 1 + 2 * (num_bonds + 1) * len(self._spins)
 
-        # The parameters line is the second line in a COHPCAR file. It
-        # contains all parameters that are needed to map the file.
-        parameters = contents[1].split()
-        # Subtract 1 to skip the average
-        num_bonds = int(parameters[0]) - 1
-        self.efermi = float(parameters[-1])
-        if int(parameters[1]) == 2:
-            spins = [Spin.up, Spin.down]
-            self.is_spin_polarized = True
-        else:
-            spins = [Spin.up]
-            self.is_spin_polarized = False
+            # The COHP data start in row num_bonds + 3
+            f.readline()
+            self._bonds = self._get_bonds([f.readline().rstrip("\n") for _ in range(num_bonds)])
+
+            average_columns = [0] + [c + 2 * s * (num_bonds + 1) for s in range(len(self._spins)) for c in (1, 2)]
+            data = self._read_columns(f, average_columns + self._get_bond_columns(labels))
 
-        # The COHP data start in row num_bonds + 3
-        data = np.array([np.array(row.split(), dtype=float) for row in contents[num_bonds + 3:]]).transpose()
-        data = np.array([np.array(row.split(), dtype=float) for row in contents[num_bonds + 3:]]).transpose()
         self.energies = data[0]
-        cohp_data = {"average": {"COHP": {spin: data[1 + 2 * s * (num_bonds + 1)]
-                                          for s, spin in enumerate(spins)},
-                                 "ICOHP": {spin: data[2 + 2 * s * (num_bonds + 1)]
-                                           for s, spin in enumerate(spins)}}}  # type: Dict[Any, Any]
+        self.cohp_data = {"average": {"COHP": {spin: data[1 + 2 * s * (num_bonds + 1)]
+                                               for s, spin in enumerate(self._spins)},
+                                      "ICOHP": {spin: data[2 + 2 * s * (num_bonds + 1)]
+                                                for s, spin in enumerate(self._spins)}}}  # type: Dict[Any, Any]
+        self.orb_res_cohp = None  # type: Optional[Dict[str, Any]]
+        self._add_bonds(labels, data)
+
+    def _get_bonds(self, header: List[str]) -> List[tuple]:
+        """
+        Assigns labels to the bonds in the COHPCAR header. The labeling had
+        to be changed: there are more than one COHP for each atom combination.
+        This is done to make the labeling consistent with ICOHPLIST.lobster.
+
+        Args:
+            header: lines of the COHPCAR header describing the bonds.
 
-        orb_cohp = {}  # type: Dict[str, Any]
+        Returns:
+            List of (bond index, label, bond data) tuples.
+        """
+        bonds = []
+        orb_labels = set()
         # present for Lobster versions older than Lobster 2.2.0
-        veryold = False
-        # the labeling had to be changed: there are more than one COHP for each atom combination
-        # this is done to make the labeling consistent with ICOHPLIST.lobster
+        self._veryold = False
         bondnumber = 0
-        for bond in range(num_bonds):
-            bond_data = self._get_bond_data(contents[3 + bond])
-
+        for bond, line in enumerate(header):
+            bond_data = self._get_bond_data(line)
             label = str(bondnumber)
-
-            orbs = bond_data["orbitals"]
-            cohp = {spin: data[2 * (bond + s * (num_bonds + 1)) + 3]
-                    for s, spin in enumerate(spins)}
-
-            icohp = {spin: data[2 * (bond + s * (num_bonds + 1)) + 4]
-                     for s, spin in enumerate(spins)}
-            if orbs is None:
+            if bond_data["orbitals"] is None:
                 bondnumber = bondnumber + 1
                 label = str(bondnumber)
-                cohp_data[label] = {"COHP": cohp, "ICOHP": icohp,
-                                    "length": bond_data["length"],
-                                    "sites": bond_data["sites"]}
-
-            elif label in orb_cohp:
-                orb_cohp[label].update(
-                    {bond_data["orb_label"]: {"COHP": cohp, "ICOHP": icohp, "orbitals": orbs,
-                                              "length": bond_data["length"], "sites": bond_data["sites"]}})
-            else:
+            elif label not in orb_labels:
                 # present for Lobster versions older than Lobster 2.2.0
                 if bondnumber == 0:
-                    veryold = True
-                if veryold:
+                    self._veryold = True
+                if self._veryold:
                     bondnumber += 1
                     label = str(bondnumber)
+                orb_labels.add(label)
+            bonds.append((bond, label, bond_data))
+        return bonds
+
+    def _get_bond_columns(self, labels: Optional[List[str]]) -> List[int]:
+        """
+        Returns the columns of the COHPCAR data block that belong to the
+        bonds with the given labels (all bonds if labels is None).
+        """
+        columns = []
+        for bond, label, _ in self._bonds:
+            if labels is None or label in labels:
+                for s in range(len(self._spins)):
+                    columns.append(2 * (bond + s * (self._num_bonds + 1)) + 3)
+                    columns.append(2 * (bond + s * (self._num_bonds + 1)) + 4)
+        return columns
+
+    def _read_columns(self, f, columns: List[int], chunk_size: int = 10000) -> Dict[int, np.ndarray]:
+        """
+        Reads the numeric block of the file in chunks of lines, converting
+        each chunk in bulk and keeping only the requested columns.
 
-                orb_cohp[label] = {bond_data["orb_label"]: {"COHP": cohp,
-                                                            "ICOHP": icohp,
-                                                            "orbitals": orbs,
-                                                            "length": bond_data["length"],
-                                                            "sites": bond_data["sites"]}}
+        Args:
+            f: file object positioned at the start of the data block.
+            columns: indices of the columns to keep.
+            chunk_size: number of lines converted at once.
+
+        Returns:
+            Dict of {column index: column data}.
+        """
+        columns = sorted(set(columns))
+        blocks = []
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                break
+            chunk = np.array(" ".join(lines).split(), dtype=float)
+            blocks.append(chunk.reshape(-1, self._num_columns)[:, columns])
+        data = np.concatenate(blocks) if blocks else np.zeros((0, len(columns)))
+        return {column: data[:, i] for i, column in enumerate(columns)}
+
+    def _add_bonds(self, labels: Optional[List[str]], data: Dict[int, np.ndarray]):
+        """
+        Adds the (orbital-resolved) COHPs of the bonds with the given labels
+        to cohp_data and orb_res_cohp.
+        """
+        orb_cohp = self.orb_res_cohp or {}
+        bond_data = None
+        for bond, label, bond_data in self._bonds:
+            if labels is not None and label not in labels:
+                continue
+            orbs = bond_data["orbitals"]
+            cohp = {spin: data[2 * (bond + s * (self._num_bonds + 1)) + 3]
+                    for s, spin in enumerate(self._spins)}
+            icohp = {spin: data[2 * (bond + s * (self._num_bonds + 1)) + 4]
+                     for s, spin in enumerate(self._spins)}
+            if orbs is None:
+                self.cohp_data[label] = {"COHP": cohp, "ICOHP": icohp,
+                                         "length": bond_data["length"],
+                                         "sites": bond_data["sites"]}
+            else:
+                orb_cohp.setdefault(label, {})[bond_data["orb_label"]] = {"COHP": cohp,
+                                                                         "ICOHP": icohp,
+                                                                         "orbitals": orbs,
+                                                                         "length": bond_data["length"],
+                                                                         "sites": bond_data["sites"]}
 
         # present for lobster older than 2.2.0
-        if veryold:
+        if self._veryold and bond_data is not None:
             for bond_str in orb_cohp:
-                cohp_data[bond_str] = {"COHP": None, "ICOHP": None,
-                                       "length": bond_data["length"],
-                                       "sites": bond_data["sites"]}
+                if bond_str not in self.cohp_data:
+                    self.cohp_data[bond_str] = {"COHP": None, "ICOHP": None,
+                                                "length": bond_data["length"],
+                                                "sites": bond_data["sites"]}
 
         self.orb_res_cohp = orb_cohp if orb_cohp else None
-        self.cohp_data = cohp_data
+
+    def load_labels(self, labels: List[str]):
+        """
+        Reads the (orbital-resolved) COHPs of further bonds from the file,
+        e.g. if the Cohpcar was initialized with only a subset of labels.
+
+        Args:
+            labels: Labels of the bonds to read in, e.g. ["2", "3"].
+        """
+        labels = [label for label in labels
+                  if label not in self.cohp_data and label not in (self.orb_res_cohp or {})]
+        if not labels:
+            return
+        with zopen(self._filename, "rt") as f:
+            for _ in range(self._num_bonds + 3):
+                f.readline()
+            data = self._read_columns(f, self._get_bond_columns(labels))
+        self._add_bonds(labels, data)
 
     @staticmethod
     def _get_bond_data(line: str) -> dict:
@@ -408,23 +495,18 @@ class Doscar:
 
         tdensities = {}
         itdensities = {}
-        f = open(doscar)
-        natoms = int(f.readline().split()[0])
-        efermi = float([f.readline() for nn in range(4)][3].split()[17])
-        dos = []
-        orbitals = []
-        for atom in range(natoms + 1):
-            line = f.readline()
-            ndos = int(line.split()[2])
-            orbitals.append(line.split(';')[-1].split())
-            line = f.readline().split()
-            cdos = np.zeros((ndos, len(line)))
-            cdos[0] = np.array(line)
-            for nd in range(1, ndos):
-                line = f.readline().split()
-                cdos[nd] = np.array(line)
-            dos.append(cdos)
-        f.close()
+        with zopen(doscar, "rt") as f:
+            natoms = int(f.readline().split()[0])
+            efermi = float([f.readline() for nn in range(4)][3].split()[17])
+            dos = []
+            orbitals = []
+            for atom in range(natoms + 1):
+                line = f.readline()
+                ndos = int(line.split()[2])
+                orbitals.append(line.split(';')[-1].split())
+                # convert the whole block at once
+                cdos = np.array(" ".join(itertools.islice(f, ndos)).split(), dtype=float)
+                dos.append(cdos.reshape(ndos, -1))
         doshere = np.array(dos[0])
         if len(doshere[0, :]) == 5:
             self._is_spin_polarized = True
@@ -1031,12 +1113,12 @@ class Fatband:
         if len(filenames) == 0:
             raise ValueError("No FATBAND files in folder or given")
         for ifilename, filename in enumerate(filenames):
+            # only the header line is needed here
             with zopen(filename, "rt") as f:
-                contents = f.read().split("\n")
+                parameters = f.readline().split()
 
             # TODO: could be replaced for future versions of Lobster, get atomname from filename
             atomnames.append(os.path.split(filename)[1].split('_')[1].capitalize())
-            parameters = contents[0].split()
             atomtype.append(re.split(r"[0-9]+", parameters[3])[0].capitalize())
             orbital_names.append(parameters[4])
 
@@ -1109,34 +1191,24 @@ class Fatband:
                          for i in range(self.number_kpts)]
                         for j in range(self.nbands)]
 
-            ikpoint = -1
-            for iline, line in enumerate(contents[1:-1]):
-                if line.split()[0] == '#':
-                    KPOINT = np.array([float(line.split()[4]), float(line.split()[5]), float(line.split()[6])])
-                    if ifilename == 0:
-                        kpoints_array.append(KPOINT)
-
-                    linenumber = 0
-                    iband = 0
-                    ikpoint += 1
-                if linenumber == self.nbands:
-                    iband = 0
-                if line.split()[0] != '#':
-
-                    if linenumber < self.nbands:
-                        if ifilename == 0:
-                            eigenvals[Spin.up][iband][ikpoint] = float(line.split()[1]) + self.efermi
+            # split the file into k-point header lines and the numeric
+            # (band, eigenvalue, projection) rows, which are converted at once
+            rows = [line.split() for line in contents[1:-1]]
+            header_rows = [row for row in rows if row[0] == '#']
+            values = np.array([row[1:3] for row in rows if row[0] != '#'],
+                              dtype=float).reshape(len(header_rows), -1, 2)
+            if ifilename == 0:
+                kpoints_array.extend(np.array(row[4:7], dtype=float) for row in header_rows)
 
-                        p_eigenvals[Spin.up][iband][ikpoint][atomnames[ifilename]][orbital_names[ifilename]] = float(
-                            line.split()[2])
-                    if linenumber >= self.nbands and self.is_spinpolarized:
+            spins = [Spin.up, Spin.down] if self.is_spinpolarized else [Spin.up]
+            for ispin, spin in enumerate(spins):
+                block = values[:, ispin * self.nbands:(ispin + 1) * self.nbands]
+                for ikpoint, kpoint_block in enumerate(block):
+                    for iband, (eigenval, projection) in enumerate(kpoint_block):
                         if ifilename == 0:
-                            eigenvals[Spin.down][iband][ikpoint] = float(line.split()[1]) + self.efermi
-                        p_eigenvals[Spin.down][iband][ikpoint][atomnames[ifilename]][
-                            orbital_names[ifilename]] = float(line.split()[2])
-
-                    linenumber += 1
-                    iband += 1
+                            eigenvals[spin][iband][ikpoint] = float(eigenval) + self.efermi
+                        p_eigenvals[spin][iband][ikpoint][atomnames[ifilename]][
+                            orbital_names[ifilename]] = float(projection)
 
         self.kpoints_array = kpoints_array
         self.eigenvals = eigenvals
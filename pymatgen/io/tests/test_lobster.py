@@ -238,6 +238,29 @@ class CohpcarTest(PymatgenTest):
                              for orbs in self.cohp_Na2UO4.orb_res_cohp["49"]], axis=0)
         self.assertArrayAlmostEqual(tot_Na2UO4, icohp_Na2UO4, decimal=3)
 
+    def test_selected_labels(self):
+        filename = os.path.join(test_dir, "COHPCAR.lobster.Na2UO4")
+        average_only = Cohpcar(filename=filename, labels=[])
+        self.assertEqual(list(average_only.cohp_data.keys()), ["average"])
+        self.assertIsNone(average_only.orb_res_cohp)
+        self.assertArrayEqual(average_only.energies, self.cohp_Na2UO4.energies)
+        self.assertArrayEqual(average_only.cohp_data["average"]["COHP"][Spin.up],
+                              self.cohp_Na2UO4.cohp_data["average"]["COHP"][Spin.up])
+
+        cohp = Cohpcar(filename=filename, labels=["49"])
+        self.assertEqual(sorted(cohp.cohp_data.keys()), ["49", "average"])
+        self.assertEqual(list(cohp.orb_res_cohp.keys()), ["49"])
+        self.assertArrayEqual(cohp.cohp_data["49"]["ICOHP"][Spin.up],
+                              self.cohp_Na2UO4.cohp_data["49"]["ICOHP"][Spin.up])
+
+        # the remaining bonds can be read in later
+        cohp.load_labels(["2", "49"])
+        self.assertEqual(sorted(cohp.cohp_data.keys()), ["2", "49", "average"])
+        self.assertEqual(cohp.cohp_data["2"]["sites"], self.cohp_Na2UO4.cohp_data["2"]["sites"])
+        self.assertArrayEqual(cohp.cohp_data["2"]["COHP"][Spin.up],
+                              self.cohp_Na2UO4.cohp_data["2"]["COHP"][Spin.up])
+        self.assertEqual(cohp.orb_res_cohp["2"].keys(), self.cohp_Na2UO4.orb_res_cohp["2"].keys())
+
 
 class IcohplistTest(unittest.TestCase):
     def setUp(self):
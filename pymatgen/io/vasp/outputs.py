@@ -17,6 +17,7 @@ import warnings
 from pathlib import Path
 import xml.etree.cElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 import collections
 
@@ -3450,6 +3451,21 @@ class Elfcar(VolumetricData):
         return VolumetricData(self.structure, alpha_data)
 
 
+def _add_old_phase_factors(phase_factors, idx, values):
+    """
+    Adds old-format (vasp 5.4.1 and before) phase factor rows to
+    phase_factors. The first row for a given position is the real part, and
+    subsequent rows are added as imaginary parts.
+    """
+    flat = phase_factors.reshape(-1, phase_factors.shape[-1])
+    lin = np.ravel_multi_index(idx, phase_factors.shape[:3])
+    first = np.zeros(len(lin), dtype=bool)
+    first[np.unique(lin, return_index=True)[1]] = True
+    real = first & np.isnan(flat[lin, 0])
+    flat[lin[real]] = values[real]
+    np.add.at(flat, lin[~real], 1j * values[~real])
+
+
 class Procar:
     """
     Object for reading a PROCAR file.
@@ -3489,12 +3505,31 @@ class Procar:
     ..attribute:: nions
 
         Number of ions
+
+    ..attribute:: ion_indices
+
+        0-based indices of the ions along the ion axis of data and
+        phase_factors.
+
+    ..attribute:: xyz_data
+
+        For non-collinear calculations, the magnetization-resolved
+        projections of the form {"x": nd.array, "y": nd.array, "z": nd.array},
+        with the same axes as data. None otherwise.
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, ions=None, orbitals=None, chunk_size=100000):
         """
         Args:
             filename: Name of file containing PROCAR.
+            ions: List of 0-based indices of the ions to keep in memory. If
+                None, all ions are kept. Otherwise, the ion axis of data and
+                phase_factors follows the order of ions.
+            orbitals: List of orbital names as they appear in the PROCAR
+                header (e.g., ["s", "dxy"]) to keep in memory. If None, all
+                orbitals are kept.
+            chunk_size: Number of ion rows that are collected before they are
+                converted to arrays in bulk.
         """
         headers = None
 
@@ -3504,78 +3539,122 @@ class Procar:
                 r"ions:\s*(\d+)")
             kpointexpr = re.compile(r"^k-point\s+(\d+).*weight = ([0-9\.]+)")
             bandexpr = re.compile(r"^band\s+(\d+)")
-            ionexpr = re.compile(r"^ion.*")
             expr = re.compile(r"^([0-9]+)\s+")
             current_kpoint = 0
             current_band = 0
-            done = False
+            ntot = 0
             spin = Spin.down
             weights = None
+            data = None
+            phase_factors = None
+            xyz_data = None
+
+            # The file is scanned once to locate the blocks of consecutive
+            # ion rows. Each block is only stored as text together with its
+            # (spin, k-point, band, number of tot lines so far) position, and
+            # blocks with the same number of columns are converted to arrays
+            # in bulk every chunk_size rows.
+            block = []
+            pending = defaultdict(lambda: ([], []))
+            npending = 0
+
+            def convert_blocks():
+                for ncols, (texts, meta) in pending.items():
+                    values = np.array(" ".join(texts).split(), dtype=float).reshape(-1, ncols)
+                    meta = np.array(meta, dtype=int)
+                    pos = np.repeat(meta[:, :4], meta[:, 4], axis=0)
+                    ion_pos = ion_lookup[values[:, 0].astype(int) - 1]
+                    keep = ion_pos >= 0
+                    values, pos, ion_pos = values[keep, 1:], pos[keep], ion_pos[keep]
+                    for ispin, ntot_here in set(map(tuple, meta[:, [0, 3]])):
+                        sp = Spin.up if ispin == 0 else Spin.down
+                        sel = (pos[:, 0] == ispin) & (pos[:, 3] == ntot_here)
+                        idx = (pos[sel, 1], pos[sel, 2], ion_pos[sel])
+                        vals = values[sel]
+                        if ntot_here == 0:
+                            data[sp][idx] = vals[:, orbital_columns]
+                        elif ncols - 1 == len(headers) + 1:
+                            # magnetization blocks of non-collinear
+                            # calculations, each terminated by a tot line
+                            xyz_data["xyz"[ntot_here - 1]][idx] = vals[:, orbital_columns]
+                        elif ncols - 1 > len(headers):
+                            # new format of PROCAR (vasp 5.4.4)
+                            phase_factors[sp][idx] = (vals[:, 2 * orbital_columns]
+                                                      + 1j * vals[:, 2 * orbital_columns + 1])
+                        else:
+                            # old format of PROCAR (vasp 5.4.1 and before),
+                            # the real part is followed by the imaginary part
+                            _add_old_phase_factors(phase_factors[sp], idx, vals[:, orbital_columns])
+                pending.clear()
 
             for l in f:
-                l = l.strip()
-                if bandexpr.match(l):
-                    m = bandexpr.match(l)
-                    current_band = int(m.group(1)) - 1
-                    done = False
-                elif kpointexpr.match(l):
+                l = l.lstrip()
+                if l[:1].isdigit():
+                    block.append(l)
+                    continue
+                if block:
+                    texts, meta = pending[len(block[0].split())]
+                    texts.append("".join(block))
+                    meta.append((0 if spin == Spin.up else 1, current_kpoint, current_band, ntot, len(block)))
+                    npending += len(block)
+                    block = []
+                    if npending >= chunk_size:
+                        convert_blocks()
+                        npending = 0
+                if l.startswith("band") and bandexpr.match(l):
+                    current_band = int(bandexpr.match(l).group(1)) - 1
+                    ntot = 0
+                elif l.startswith("k-point") and kpointexpr.match(l):
                     m = kpointexpr.match(l)
                     current_kpoint = int(m.group(1)) - 1
                     weights[current_kpoint] = float(m.group(2))
                     if current_kpoint == 0:
                         spin = Spin.up if spin == Spin.down else Spin.down
-                    done = False
-                elif headers is None and ionexpr.match(l):
+                    ntot = 0
+                elif headers is None and l.startswith("ion"):
                     headers = l.split()
                     headers.pop(0)
                     headers.pop(-1)
+                    selected_orbitals = headers if orbitals is None else list(orbitals)
+                    orbital_columns = np.array([headers.index(orb) for orb in selected_orbitals], dtype=int)
+                    ion_indices = list(range(nions)) if ions is None else list(ions)
+                    ion_lookup = np.full(nions, -1, dtype=int)
+                    ion_lookup[ion_indices] = np.arange(len(ion_indices))
+                    shape = (nkpoints, nbands, len(ion_indices), len(selected_orbitals))
 
                     def f():
-                        return np.zeros((nkpoints, nbands, nions, len(headers)))
+                        return np.zeros(shape)
 
                     data = defaultdict(f)
 
                     def f2():
-                        return np.full((nkpoints, nbands, nions, len(headers)),
-                                       np.NaN, dtype=np.complex128)
+                        return np.full(shape, np.NaN, dtype=np.complex128)
 
                     phase_factors = defaultdict(f2)
-                elif expr.match(l):
-                    toks = l.split()
-                    index = int(toks.pop(0)) - 1
-                    num_data = np.array([float(t) for t in toks[:len(headers)]])
-                    if not done:
-                        data[spin][current_kpoint, current_band, index, :] = num_data
-                    else:
-                        if len(toks) > len(headers):
-                            # new format of PROCAR (vasp 5.4.4)
-                            num_data = np.array([float(t)
-                                                 for t in toks[:2 * len(headers)]])
-                            for orb in range(len(headers)):
-                                phase_factors[spin][current_kpoint, current_band,
-                                                    index, orb] = complex(num_data[2 * orb], num_data[2 * orb + 1])
-                        else:
-                            # old format of PROCAR (vasp 5.4.1 and before)
-                            if np.isnan(phase_factors[spin][current_kpoint, current_band, index, 0]):
-                                phase_factors[spin][current_kpoint, current_band, index, :] = num_data
-                            else:
-                                phase_factors[spin][current_kpoint, current_band, index, :] += 1j * num_data
+                    xyz_data = defaultdict(f)
                 elif l.startswith("tot"):
-                    done = True
+                    ntot += 1
                 elif preambleexpr.match(l):
                     m = preambleexpr.match(l)
                     nkpoints = int(m.group(1))
                     nbands = int(m.group(2))
                     nions = int(m.group(3))
                     weights = np.zeros(nkpoints)
+            if block:
+                texts, meta = pending[len(block[0].split())]
+                texts.append("".join(block))
+                meta.append((0 if spin == Spin.up else 1, current_kpoint, current_band, ntot, len(block)))
+            convert_blocks()
 
             self.nkpoints = nkpoints
             self.nbands = nbands
             self.nions = nions
             self.weights = weights
-            self.orbitals = headers
+            self.orbitals = selected_orbitals
+            self.ion_indices = ion_indices
             self.data = data
             self.phase_factors = phase_factors
+            self.xyz_data = dict(xyz_data) if xyz_data else None
 
     def get_projection_on_elements(self, structure):
         """
@@ -3593,12 +3672,12 @@ class Procar:
                            for i in range(self.nkpoints)]
                           for j in range(self.nbands)]
 
-        for iat in range(self.nions):
+        for i, iat in enumerate(self.ion_indices):
             name = structure.species[iat].symbol
             for spin, d in self.data.items():
                 for k, b in itertools.product(range(self.nkpoints),
                                               range(self.nbands)):
-                    dico[spin][b][k][name] = np.sum(d[k, b, iat, :])
+                    dico[spin][b][k][name] = np.sum(d[k, b, i, :])
 
         return dico
 
@@ -3622,7 +3701,8 @@ class Procar:
         """
 
         orbital_index = self.orbitals.index(orbital)
-        return {spin: np.sum(d[:, :, atom_index, orbital_index] * self.weights[:, None])
+        ion_index = self.ion_indices.index(atom_index)
+        return {spin: np.sum(d[:, :, ion_index, orbital_index] * self.weights[:, None])
                 for spin, d in self.data.items()}
 
 
@@ -4216,7 +4296,9 @@ class Wavecar:
         the wavefunction. For non-spin-polarized, the first index corresponds
         to the kpoint and the second corresponds to the band (e.g.
         self.coeffs[kp][b] corresponds to k-point kp and band b). For
-        spin-polarized calculations, the first index is for the spin.
+        spin-polarized calculations, the first index is for the spin. If the
+        WAVECAR was read with lazy=True, this is None and the coefficients
+        are obtained on demand with get_coeffs.
 
     Acknowledgments:
         This code is based upon the Fortran program, WaveTrans, written by
@@ -4227,7 +4309,8 @@ class Wavecar:
     Author: Mark Turiansky
     """
 
-    def __init__(self, filename='WAVECAR', verbose=False, precision='normal', gamma=None):
+    def __init__(self, filename='WAVECAR', verbose=False, precision='normal', gamma=None,
+                 lazy=False):
         """
         Information is extracted from the given WAVECAR
 
@@ -4238,6 +4321,12 @@ class Wavecar:
                              accurate), only the first letter matters
             gamma (bool): determines if WAVECAR is assumed to have been generated
                              by gamma-point only executable
+            lazy (bool): if True, the coefficients are not read on
+                             initialization. Only the positions of the band
+                             records are indexed and the coefficients of a
+                             given spin, k-point and band are memory-mapped
+                             when they are needed (see get_coeffs). In this
+                             case, self.coeffs is None.
         """
         self.filename = filename
 
@@ -4308,9 +4397,24 @@ class Wavecar:
 
             # reading records
             # np.set_printoptions(precision=7, suppress=True)
+            filesize = os.fstat(f.fileno()).st_size
+            self._recl = recl
+            if rtag == 45200 or rtag == 53300:
+                self._file_dtype = np.complex64
+            else:
+                # this should handle double precision coefficients
+                # but I don't have a WAVECAR to test it with
+                self._file_dtype = np.complex128
+            self._coeff_dtype = np.complex64 if spin == 2 else np.complex128
+            self._nplane = []
+            self._extra_coeff_inds = []
+            self._coeff_offsets = np.zeros((spin, self.nk), dtype=np.int64)
             self.Gpoints = [None for _ in range(self.nk)]
             self.kpoints = []
-            if spin == 2:
+            if lazy:
+                self.coeffs = None
+                self.band_energy = [[] for _ in range(spin)] if spin == 2 else []
+            elif spin == 2:
                 self.coeffs = [[[None for i in range(self.nb)]
                                 for j in range(self.nk)] for _ in range(spin)]
                 self.band_energy = [[] for _ in range(spin)]
@@ -4349,59 +4453,132 @@ class Wavecar:
                     # padding to end of record that contains nplane, kpoints, evals and occs
                     np.fromfile(f, dtype=np.float64, count=(recl8 - 4 - 3 * self.nb) % recl8)
 
-                    # generate G integers
-                    if gamma is not None:
-                        # use it
-                        self.gamma = gamma
-                        (self.Gpoints[ink], extra_gpoints, extra_coeff_inds) = self._generate_G_points(kpoint, gamma)
+                    # the G-points only depend on the k-point, so they are
+                    # generated once and shared by both spin channels
+                    if ispin == 0:
+                        self._set_G_points(ink, kpoint, nplane, gamma, verbose)
+                    elif nplane != self._nplane[ink]:
+                        raise ValueError('inconsistent number of plane waves '
+                                         'for k-point {}'.format(ink))
+
+                    # extract coefficients, each band occupies one record
+                    self._coeff_offsets[ispin, ink] = f.tell()
+                    if lazy:
+                        f.seek(self.nb * recl, 1)
+                        if f.tell() > filesize:
+                            raise ValueError('WAVECAR {} is truncated'.format(self.filename))
+                        continue
+                    raw = np.fromfile(f, dtype=np.uint8, count=self.nb * recl)
+                    data = self._unpack_coeffs(raw, ink)
+                    if spin == 2:
+                        self.coeffs[ispin][ink] = list(data)
                     else:
-                        # try assuming a conventional (non-gamma) calculation
-                        self.gamma = False
-                        (self.Gpoints[ink], extra_gpoints, extra_coeff_inds) = self._generate_G_points(kpoint, False)
-                        initial_generated = len(self.Gpoints[ink])
-                    if gamma is None and len(self.Gpoints[ink]) != nplane:
-                        # failed with conventional, retry with gamma-only format
-                        self.gamma = True
-                        (self.Gpoints[ink], extra_gpoints, extra_coeff_inds) = self._generate_G_points(kpoint, True)
-                    if len(self.Gpoints[ink]) != nplane:
-                        # failed to match number of plane waves for either gamma or non-gamma
-                        if gamma is None:
-                            raise ValueError('failed to generate the correct number of '
-                                             'G points generated non-gamma {} gamma-only {}, read in {}'.format(
-                                                 initial_generated, len(self.Gpoints[ink]), nplane))
-                        else:
-                            raise ValueError('failed to generate the correct '
-                                             'number of G points for {} executable '
-                                             'generated {} read in {}'.format(
-                                                 'gamma' if gamma else 'k-points', len(self.Gpoints[ink]), nplane))
-                    if verbose:
-                        print("gamma-only input", gamma, "final", self.gamma)
-
-                    self.Gpoints[ink] = np.array(self.Gpoints[ink] + extra_gpoints, dtype=np.float64)
-
-                    # extract coefficients
-                    for inb in range(self.nb):
-                        if rtag == 45200 or rtag == 53300:
-                            data = np.fromfile(f, dtype=np.complex64, count=nplane)
-                            np.fromfile(f, dtype=np.float64, count=recl8 - nplane)
-                        elif rtag == 45210 or rtag == 53310:
-                            # this should handle double precision coefficients
-                            # but I don't have a WAVECAR to test it with
-                            data = np.fromfile(f, dtype=np.complex128, count=nplane)
-                            np.fromfile(f, dtype=np.float64, count=recl8 - 2 * nplane)
-
-                        extra_coeffs = []
-                        if len(extra_coeff_inds) > 0:
-                            # reconstruct extra coefficients missing from gamma-only executable WAVECAR
-                            for G_ind in extra_coeff_inds:
-                                # no idea where this factor of sqrt(2) comes from, but empirically
-                                # it appears to be necessary
-                                data[G_ind] /= np.sqrt(2)
-                                extra_coeffs.append(np.conj(data[G_ind]))
-                        if spin == 2:
-                            self.coeffs[ispin][ink][inb] = np.array(list(data) + extra_coeffs, dtype=np.complex64)
-                        else:
-                            self.coeffs[ink][inb] = np.array(list(data) + extra_coeffs, dtype=np.complex128)
+                        self.coeffs[ink] = list(data)
+
+    def _set_G_points(self, ink, kpoint, nplane, gamma, verbose=False):
+        """
+        Helper function that generates the G-points of a k-point and checks
+        them against the number of plane waves in the WAVECAR. If gamma is
+        None, the conventional (non-gamma) format is tried before the
+        gamma-point only format. There should be no reason for this function
+        to be called outside of initialization.
+
+        Args:
+            ink (int): the index of the k-point
+            kpoint (np.array): the array containing the k-point value
+            nplane (int): the number of plane waves read from the WAVECAR
+            gamma (bool): determines if WAVECAR is assumed to have been
+                generated by gamma-point only executable
+            verbose (bool): determines whether processing information is shown
+        """
+        if gamma is not None:
+            # use it
+            self.gamma = gamma
+            (gpoints, extra_gpoints, extra_coeff_inds) = self._generate_G_points(kpoint, gamma)
+        else:
+            # try assuming a conventional (non-gamma) calculation
+            self.gamma = False
+            (gpoints, extra_gpoints, extra_coeff_inds) = self._generate_G_points(kpoint, False)
+            initial_generated = len(gpoints)
+        if gamma is None and len(gpoints) != nplane:
+            # failed with conventional, retry with gamma-only format
+            self.gamma = True
+            (gpoints, extra_gpoints, extra_coeff_inds) = self._generate_G_points(kpoint, True)
+        if len(gpoints) != nplane:
+            # failed to match number of plane waves for either gamma or non-gamma
+            if gamma is None:
+                raise ValueError('failed to generate the correct number of '
+                                 'G points generated non-gamma {} gamma-only {}, read in {}'.format(
+                                     initial_generated, len(gpoints), nplane))
+            else:
+                raise ValueError('failed to generate the correct '
+                                 'number of G points for {} executable '
+                                 'generated {} read in {}'.format(
+                                     'gamma' if gamma else 'k-points', len(gpoints), nplane))
+        if verbose:
+            print("gamma-only input", gamma, "final", self.gamma)
+
+        self.Gpoints[ink] = np.concatenate([gpoints, extra_gpoints]).astype(np.float64)
+        self._nplane.append(nplane)
+        self._extra_coeff_inds.append(extra_coeff_inds)
+
+    def _unpack_coeffs(self, raw, kpoint):
+        """
+        Helper function that converts the raw bytes of consecutive band
+        records of a k-point into plane-wave coefficients.
+
+        Args:
+            raw (np.array): uint8 array holding one record per band
+            kpoint (int): the index of the k-point of the records
+
+        Returns:
+            a 2D numpy array of coefficients with one row per band
+        """
+        nbytes = self._nplane[kpoint] * np.dtype(self._file_dtype).itemsize
+        data = np.ascontiguousarray(raw.reshape((-1, self._recl))[:, :nbytes])
+        data = data.view(self._file_dtype)
+        extra_coeff_inds = self._extra_coeff_inds[kpoint]
+        if len(extra_coeff_inds) > 0:
+            # reconstruct extra coefficients missing from gamma-only executable WAVECAR
+            # no idea where this factor of sqrt(2) comes from, but empirically
+            # it appears to be necessary
+            data[:, extra_coeff_inds] = data[:, extra_coeff_inds].astype(np.complex128) / np.sqrt(2)
+            data = np.concatenate([data, np.conj(data[:, extra_coeff_inds])], axis=1)
+        return data.astype(self._coeff_dtype)
+
+    def get_coeffs(self, kpoint, band, spin=0):
+        """
+        Returns the plane-wave coefficients of a wavefunction.
+
+        For a Wavecar read with lazy=True, only the records of the requested
+        bands are memory-mapped from the file, so the remaining coefficients
+        are never loaded.
+
+        Args:
+            kpoint (int): the index of the kpoint of the wavefunction
+            band (int or list): the index of the band of the wavefunction, or
+                a sequence of band indices
+            spin (int): spin index for the desired wavefunction (only for
+                ISPIN = 2, default = 0)
+
+        Returns:
+            a numpy array of coefficients ordered like self.Gpoints[kpoint]
+            (a 2D array with one row per band if a sequence of bands is given)
+        """
+        if self.coeffs is not None:
+            coeffs = self.coeffs[spin][kpoint] if self.spin == 2 else self.coeffs[kpoint]
+            if np.ndim(band) == 0:
+                return coeffs[band]
+            return np.array([coeffs[b] for b in band])
+
+        ispin = spin if self.spin == 2 else 0
+        kpoint = range(self.nk)[kpoint]
+        bands = np.arange(self.nb)[band]
+        raw = np.memmap(self.filename, dtype=np.uint8, mode='r',
+                        offset=self._coeff_offsets[ispin, kpoint],
+                        shape=(self.nb, self._recl))
+        data = self._unpack_coeffs(raw[np.atleast_1d(bands)], kpoint)
+        return data if np.ndim(bands) else data[0]
 
     def _generate_nbmax(self):
         """
@@ -4446,10 +4623,10 @@ class Wavecar:
         """
         Helper function to generate G-points based on nbmax.
 
-        This function iterates over possible G-point values and determines
-        if the energy is less than G_{cut}. Valid values are appended to
-        the output array. This function should not be called outside of
-        initialization.
+        This function builds the grid of possible G-point values and keeps
+        those with an energy less than G_{cut}. The G-points are ordered in
+        the same way as the coefficients in the WAVECAR. This function should
+        not be called outside of initialization.
 
         Args:
             kpoint (np.array): the array containing the current k-point value
@@ -4457,39 +4634,29 @@ class Wavecar:
                           should be generated
 
         Returns:
-            a list containing valid G-points
-        """
+            a tuple of the valid G-points, the extra G-points that are implied
+            by time-reversal symmetry for the gamma-point only executable, and
+            the indices of the coefficients of these extra G-points
+        """
+        nbmax = self._nbmax
+        i3 = np.r_[0:nbmax[2] + 1, -nbmax[2]:0]
+        j2 = np.r_[0:nbmax[1] + 1, -nbmax[1]:0]
+        k1 = np.arange(nbmax[0] + 1) if gamma else np.r_[0:nbmax[0] + 1, -nbmax[0]:0]
+        i3, j2, k1 = np.meshgrid(i3, j2, k1, indexing='ij')
+        G = np.column_stack([k1.ravel(), j2.ravel(), i3.ravel()])
+        if gamma:
+            half = (G[:, 0] == 0) & ((G[:, 1] < 0) | ((G[:, 1] == 0) & (G[:, 2] < 0)))
+            G = G[~half]
 
+        g = np.linalg.norm(np.dot(kpoint + G, self.b), axis=1)
+        gpoints = G[g ** 2 / self._C < self.encut]
         if gamma:
-            kmax = self._nbmax[0] + 1
+            extra_coeff_inds = np.nonzero(np.any(gpoints != 0, axis=1))[0]
         else:
-            kmax = 2 * self._nbmax[0] + 1
-
-        gpoints = []
-        extra_gpoints = []
-        extra_coeff_inds = []
-        G_ind = 0
-        for i in range(2 * self._nbmax[2] + 1):
-            i3 = i - 2 * self._nbmax[2] - 1 if i > self._nbmax[2] else i
-            for j in range(2 * self._nbmax[1] + 1):
-                j2 = j - 2 * self._nbmax[1] - 1 if j > self._nbmax[1] else j
-                for k in range(kmax):
-                    k1 = k - 2 * self._nbmax[0] - 1 if k > self._nbmax[0] else k
-                    if gamma and ((k1 == 0 and j2 < 0) or (k1 == 0 and j2 == 0 and i3 < 0)):
-                        continue
-                    G = np.array([k1, j2, i3])
-                    v = kpoint + G
-                    g = np.linalg.norm(np.dot(v, self.b))
-                    E = g ** 2 / self._C
-                    if E < self.encut:
-                        gpoints.append(G)
-                        if gamma and (k1, j2, i3) != (0, 0, 0):
-                            extra_gpoints.append(-G)
-                            extra_coeff_inds.append(G_ind)
-                        G_ind += 1
-        return (gpoints, extra_gpoints, extra_coeff_inds)
-
-    def evaluate_wavefunc(self, kpoint, band, r, spin=0):
+            extra_coeff_inds = np.zeros(0, dtype=int)
+        return (gpoints, -gpoints[extra_coeff_inds], extra_coeff_inds)
+
+    def evaluate_wavefunc(self, kpoint, band, r, spin=0, chunk_size=2 ** 22):
         r"""
         Evaluates the wavefunction for a given position, r.
 
@@ -4504,24 +4671,40 @@ class Wavecar:
         G-point corresponding to k-point k.
 
         NOTE: This function is very slow; a discrete fourier transform is the
-        preferred method of evaluation (see Wavecar.fft_mesh).
+        preferred method of evaluation (see Wavecar.fft_mesh). If the
+        wavefunction is needed at many positions that are not on the fft mesh,
+        pass them all at once as an array of positions.
 
         Args:
             kpoint (int): the index of the kpoint where the wavefunction
                             will be evaluated
             band (int): the index of the band where the wavefunction will be
                             evaluated
-            r (np.array): the position where the wavefunction will be evaluated
+            r (np.array): the position where the wavefunction will be
+                            evaluated, or an (N, 3) array of positions
             spin (int):  spin index for the desired wavefunction (only for
                             ISPIN = 2, default = 0)
+            chunk_size (int): maximum number of (G-point, position) pairs
+                            evaluated at once, which bounds the memory used
+                            for an array of positions
         Returns:
-            a complex value corresponding to the evaluation of the wavefunction
+            a complex value corresponding to the evaluation of the wavefunction,
+            or an array of N values if an array of positions is given
         """
         v = self.Gpoints[kpoint] + self.kpoints[kpoint]
-        u = np.dot(np.dot(v, self.b), r)
-        c = self.coeffs[spin][kpoint][band] if self.spin == 2 else \
-            self.coeffs[kpoint][band]
-        return np.sum(np.dot(c, np.exp(1j * u, dtype=np.complex64))) / np.sqrt(self.vol)
+        c = self.get_coeffs(kpoint, band, spin=spin)
+        r = np.asarray(r, dtype=np.float64)
+        if r.ndim == 1:
+            u = np.dot(np.dot(v, self.b), r)
+            return np.sum(np.dot(c, np.exp(1j * u, dtype=np.complex64))) / np.sqrt(self.vol)
+
+        kG = np.dot(v, self.b)
+        step = max(1, chunk_size // len(kG))
+        values = np.empty(len(r), dtype=np.complex128)
+        for i in range(0, len(r), step):
+            u = np.dot(kG, r[i:i + step].T)
+            values[i:i + step] = np.dot(c, np.exp(1j * u, dtype=np.complex64))
+        return values / np.sqrt(self.vol)
 
     def fft_mesh(self, kpoint, band, spin=0, shift=True):
         """
@@ -4547,19 +4730,69 @@ class Wavecar:
         Returns:
             a numpy ndarray representing the 3D mesh of coefficients
         """
-        mesh = np.zeros(tuple(self.ng), dtype=np.complex)
-        tcoeffs = self.coeffs[spin][kpoint][band] if self.spin == 2 else \
-            self.coeffs[kpoint][band]
-        for gp, coeff in zip(self.Gpoints[kpoint], tcoeffs):
-            t = tuple(gp.astype(np.int) + (self.ng / 2).astype(np.int))
-            mesh[t] = coeff
+        mesh = np.zeros(tuple(self.ng), dtype=np.complex128)
+        tcoeffs = self.get_coeffs(kpoint, band, spin=spin)
+        inds = self.Gpoints[kpoint].astype(int) + (self.ng / 2).astype(int)
+        mesh[tuple(inds.T)] = tcoeffs
         if shift:
             return np.fft.ifftshift(mesh)
         else:
             return mesh
 
+    def _get_wavefunctions(self, kpoint, bands, spin, N):
+        """
+        Helper function that transforms the wavefunctions of several bands at
+        one k-point to real space with a single batched fft.
+
+        Args:
+            kpoint (int): the index of the kpoint
+            bands (list): the indices of the bands
+            spin (int): the spin of the wavefunctions
+            N (int): normalization factor, i.e. the number of mesh points
+
+        Returns:
+            a complex numpy array with one real-space mesh per band
+        """
+        coeffs = self.get_coeffs(kpoint, bands, spin=spin)
+        inds = self.Gpoints[kpoint].astype(int) + (self.ng / 2).astype(int)
+        mesh = np.zeros((len(bands),) + tuple(self.ng), dtype=np.complex128)
+        mesh[(slice(None),) + tuple(inds.T)] = coeffs
+        mesh = np.fft.ifftshift(mesh, axes=(1, 2, 3))
+        return np.fft.ifftn(mesh, axes=(1, 2, 3)) * N
+
+    def _get_density(self, kpoints, bands, spin, nproc=None):
+        """
+        Helper function that sums the charge densities of the given bands
+        over the given k-points. The bands of a k-point are transformed in
+        batches and the k-points are optionally distributed over a pool of
+        threads.
+
+        Args:
+            kpoints (list): the indices of the kpoints
+            bands (list): the indices of the bands
+            spin (int): the spin of the wavefunctions
+            nproc (int): number of threads used for the k-points
+
+        Returns:
+            a numpy array of the summed charge density on the fft mesh
+        """
+        N = np.prod(self.ng)
+        batch = max(1, 2 ** 22 // N)
+
+        def kpoint_density(kpoint):
+            den = np.zeros(tuple(self.ng))
+            for i in range(0, len(bands), batch):
+                wfr = self._get_wavefunctions(kpoint, bands[i:i + batch], spin, N)
+                den += np.sum(np.abs(np.conj(wfr) * wfr), axis=0)
+            return den
+
+        if nproc is not None and nproc > 1 and len(kpoints) > 1:
+            with ThreadPoolExecutor(max_workers=nproc) as executor:
+                return sum(executor.map(kpoint_density, kpoints))
+        return sum(map(kpoint_density, kpoints))
+
     def get_parchg(self, poscar, kpoint, band, spin=None, phase=False,
-                   scale=2):
+                   scale=2, nproc=None):
         """
         Generates a Chgcar object, which is the charge density of the specified
         wavefunction.
@@ -4572,6 +4805,11 @@ class Wavecar:
         sign of the wavefunction at that point in space. A warning is generated
         if the phase tag is on and the chosen kpoint is not Gamma.
 
+        If kpoint and/or band are sequences of indices, the charge densities of
+        all the specified wavefunctions are summed (i.e., a band-decomposed
+        charge density). The bands of each k-point are transformed together
+        and the k-points can be distributed over several threads.
+
         Note: Augmentation from the PAWs is NOT included in this function. The
         maximal charge density will differ from the PARCHG from VASP, but the
         qualitative shape of the charge density will match.
@@ -4579,8 +4817,10 @@ class Wavecar:
         Args:
             poscar (pymatgen.io.vasp.inputs.Poscar): Poscar object that has the
                                 structure associated with the WAVECAR file
-            kpoint (int):   the index of the kpoint for the wavefunction
-            band (int):     the index of the band for the wavefunction
+            kpoint (int):   the index of the kpoint for the wavefunction, or a
+                                list of indices
+            band (int):     the index of the band for the wavefunction, or a
+                                list of indices
             spin (int):     optional argument to specify the spin. If the
                                 Wavecar has ISPIN = 2, spin is None generates a
                                 Chgcar with total spin and magnetization, and
@@ -4588,45 +4828,46 @@ class Wavecar:
                                 down component.
             phase (bool):   flag to determine if the charge density is
                                 multiplied by the sign of the wavefunction.
-                                Only valid for real wavefunctions.
+                                Only valid for a single real wavefunction.
             scale (int):    scaling for the FFT grid. The default value of 2 is
                                 at least as fine as the VASP default.
+            nproc (int):    number of threads used to process the k-points
+                                (default: None, i.e. serial)
         Returns:
             a pymatgen.io.vasp.outputs.Chgcar object
         """
+        if phase and (np.ndim(kpoint) > 0 or np.ndim(band) > 0):
+            raise ValueError('phase == True is only valid for a single '
+                             'wavefunction')
 
         if phase and not np.all(self.kpoints[kpoint] == 0.):
             warnings.warn('phase == True should only be used for the Gamma '
                           'kpoint! I hope you know what you\'re doing!')
 
+        kpoints = np.atleast_1d(kpoint)
+        bands = np.atleast_1d(band)
+
         # scaling of ng for the fft grid, need to restore value at the end
         temp_ng = self.ng
         self.ng = self.ng * scale
         N = np.prod(self.ng)
 
         data = {}
-        if self.spin == 2:
-            if spin is not None:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=spin)) * N
-                den = np.abs(np.conj(wfr) * wfr)
-                if phase:
-                    den = np.sign(np.real(wfr)) * den
-                data['total'] = den
-            else:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=0)) * N
-                denup = np.abs(np.conj(wfr) * wfr)
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=1)) * N
-                dendn = np.abs(np.conj(wfr) * wfr)
+        try:
+            if self.spin == 2 and spin is None:
+                denup = self._get_density(kpoints, bands, 0, nproc=nproc)
+                dendn = self._get_density(kpoints, bands, 1, nproc=nproc)
                 data['total'] = denup + dendn
                 data['diff'] = denup - dendn
-        else:
-            wfr = np.fft.ifftn(self.fft_mesh(kpoint, band)) * N
-            den = np.abs(np.conj(wfr) * wfr)
-            if phase:
-                den = np.sign(np.real(wfr)) * den
-            data['total'] = den
-
-        self.ng = temp_ng
+            elif phase:
+                wfr = self._get_wavefunctions(kpoint, bands, spin or 0, N)[0]
+                den = np.abs(np.conj(wfr) * wfr)
+                data['total'] = np.sign(np.real(wfr)) * den
+            else:
+                data['total'] = self._get_density(kpoints, bands, spin or 0,
+                                                  nproc=nproc)
+        finally:
+            self.ng = temp_ng
         return Chgcar(poscar, data)
 
 
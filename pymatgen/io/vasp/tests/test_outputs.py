@@ -1261,6 +1261,24 @@ class ProcarTest(PymatgenTest):
         p = Procar(filepath)
         self.assertAlmostEqual(p.phase_factors[Spin.up][0, 0, 0, 0], -0.13 + 0.199j)
 
+    def test_selected_ions_orbitals(self):
+        filepath = self.TEST_FILES_DIR / 'PROCAR.phase'
+        full = Procar(filepath)
+        p = Procar(filepath, ions=[2, 0], orbitals=["s", "px"], chunk_size=10)
+        self.assertEqual(p.nions, 3)
+        self.assertEqual(p.orbitals, ["s", "px"])
+        self.assertEqual(p.ion_indices, [2, 0])
+        self.assertEqual(p.data[Spin.up].shape, (60, 12, 2, 2))
+        self.assertArrayEqual(p.data[Spin.down],
+                              full.data[Spin.down][:, :, [2, 0]][..., [0, 3]])
+        self.assertArrayEqual(p.phase_factors[Spin.up],
+                              full.phase_factors[Spin.up][:, :, [2, 0]][..., [0, 3]])
+        self.assertAlmostEqual(p.phase_factors[Spin.up][0, 0, 0, 0],
+                               -0.053 + 0.007j)
+        self.assertAlmostEqual(p.get_occupation(2, "px")[Spin.up],
+                               full.get_occupation(2, "px")[Spin.up])
+        self.assertIsNone(p.xyz_data)
+
 
 class XdatcarTest(PymatgenTest):
 
@@ -1398,6 +1416,22 @@ class WavecarTest(PymatgenTest):
         finally:
             Wavecar._generate_G_points = temp_ggp
 
+    def test_lazy(self):
+        for f in ['WAVECAR.N2', 'WAVECAR.N2.spin', 'WAVECAR.H2_low_symm.gamma']:
+            w = Wavecar(self.TEST_FILES_DIR / f)
+            wl = Wavecar(self.TEST_FILES_DIR / f, lazy=True)
+            self.assertIsNone(wl.coeffs)
+            self.assertEqual(wl.gamma, w.gamma)
+            for spin in range(w.spin):
+                self.assertArrayAlmostEqual(wl.get_coeffs(0, -1, spin=spin),
+                                            w.get_coeffs(0, -1, spin=spin))
+                self.assertArrayAlmostEqual(wl.get_coeffs(0, [0, 2], spin=spin),
+                                            w.get_coeffs(0, [0, 2], spin=spin))
+                self.assertArrayAlmostEqual(wl.fft_mesh(0, 1, spin=spin),
+                                            w.fft_mesh(0, 1, spin=spin))
+        with self.assertRaises(IndexError):
+            wl.get_coeffs(0, wl.nb)
+
     def test__generate_nbmax(self):
         self.w._generate_nbmax()
         self.assertEqual(self.w._nbmax.tolist(), [5, 5, 5])
@@ -1417,6 +1451,13 @@ class WavecarTest(PymatgenTest):
                                np.sum(self.w.coeffs[0][0]) / np.sqrt(self.vol),
                                places=4)
 
+    def test_evaluate_wavefunc_positions(self):
+        r = np.array([[0, 0, 0], [1.2, 3.4, 5.6], [7.5, 0.5, 2.5]])
+        values = self.w.evaluate_wavefunc(0, 3, r, chunk_size=300)
+        self.assertEqual(values.shape, (3,))
+        for v, ri in zip(values, r):
+            self.assertAlmostEqual(v, self.w.evaluate_wavefunc(0, 3, ri), places=6)
+
     def test_fft_mesh(self):
         mesh = self.w.fft_mesh(0, 5)
         ind = np.argmax(np.abs(mesh))
@@ -1505,6 +1546,36 @@ class WavecarTest(PymatgenTest):
         self.assertEqual(np.prod(c.data['total'].shape), np.prod(w.ng * 2))
         self.assertFalse(np.all(c.data['total'] > 0.))
 
+    def test_get_parchg_bands(self):
+        poscar = Poscar.from_file(self.TEST_FILES_DIR / 'POSCAR')
+        w = Wavecar(self.TEST_FILES_DIR / 'WAVECAR.N2.spin', lazy=True)
+        c = w.get_parchg(poscar, [0], [1, 2, 3], scale=1, nproc=2)
+        for key in ['total', 'diff']:
+            summed = sum(w.get_parchg(poscar, 0, b, scale=1).data[key]
+                         for b in [1, 2, 3])
+            self.assertArrayAlmostEqual(c.data[key], summed)
+
+        # add a second k-point with the bands in reverse order, so that the
+        # k-points are summed by the thread pool
+        w = Wavecar(self.TEST_FILES_DIR / 'WAVECAR.N2.spin')
+        w.kpoints.append(w.kpoints[0])
+        w.Gpoints.append(w.Gpoints[0])
+        for coeffs in w.coeffs:
+            coeffs.append(coeffs[0][::-1])
+        w.nk += 1
+        c = w.get_parchg(poscar, [0, 1], [1, 2, 3], scale=1, nproc=2)
+        serial = w.get_parchg(poscar, [0, 1], [1, 2, 3], scale=1)
+        for key in ['total', 'diff']:
+            summed = sum(w.get_parchg(poscar, k, [1, 2, 3], scale=1).data[key]
+                         for k in [0, 1])
+            self.assertArrayAlmostEqual(c.data[key], serial.data[key])
+            self.assertArrayAlmostEqual(c.data[key], summed)
+        self.assertFalse(np.allclose(
+            w.get_parchg(poscar, 0, [1, 2, 3], scale=1).data['total'],
+            w.get_parchg(poscar, 1, [1, 2, 3], scale=1).data['total']))
+        self.assertRaises(ValueError, w.get_parchg, poscar, 0, [0, 1],
+                          phase=True)
+
 
 class EigenvalTest(PymatgenTest):
     _multiprocess_shared_ = True
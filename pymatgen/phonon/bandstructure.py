@@ -44,23 +44,78 @@ def estimate_band_connection(prev_eigvecs, eigvecs, prev_band_order):
     A function to order the phonon eigenvectors taken from phonopy
     """
     metric = np.abs(np.dot(prev_eigvecs.conjugate().T, eigvecs))
-    connection_order = []
-    for overlaps in metric:
-        maxval = 0
-        for i in reversed(range(len(metric))):
-            val = overlaps[i]
-            if i in connection_order:
-                continue
-            if val > maxval:
-                maxval = val
-                maxindex = i
-        connection_order.append(maxindex)
-
+    connection_order = _greedy_connection(metric)
     band_order = [connection_order[x] for x in prev_band_order]
 
     return band_order
 
 
+def _greedy_connection(metric):
+    """
+    Connects each previous band, in turn, to the still available band with the
+    largest overlap (the last one in case of ties).
+
+    Args:
+        metric: matrix of overlaps between the previous (rows) and the
+            current (columns) eigenvectors
+
+    Returns:
+        numpy array with the band connected to each previous band
+    """
+    nbands = len(metric)
+    connection_order = np.zeros(nbands, dtype=int)
+    available = np.ones(nbands, dtype=bool)
+    for i, overlaps in enumerate(metric):
+        vals = np.where(available, overlaps, -np.inf)[::-1]
+        connection_order[i] = nbands - 1 - np.argmax(vals)
+        available[connection_order[i]] = False
+    return connection_order
+
+
+def get_band_order(eigvecs, method="greedy", chunk_size=2 ** 24):
+    """
+    Orders the phonon bands along a path of q-points by connecting the
+    branches with the largest eigenvector overlap between consecutive
+    q-points. The overlap matrices are computed for many q-points at once.
+
+    Args:
+        eigvecs: array with shape (nqpoints, nbands, ndim) containing the
+            eigenvectors of each band at each q-point
+        method: "greedy" connects the bands one at a time as in phonopy,
+            "hungarian" finds the connection that maximizes the total overlap
+            by solving the linear assignment problem
+        chunk_size: maximum number of matrix elements in a batch of overlap
+            matrices
+
+    Returns:
+        numpy array with shape (nqpoints, nbands), where the element [q, b] is
+        the index of the band at q-point q connected to band b at the first
+        q-point
+    """
+    if method not in ("greedy", "hungarian"):
+        raise ValueError("Unknown band connection method {}".format(method))
+    if method == "hungarian":
+        from pymatgen.optimization.linear_assignment import LinearAssignment  # type: ignore
+
+    nqpoints, nbands = eigvecs.shape[:2]
+    order = np.zeros((nqpoints, nbands), dtype=int)
+    order[0] = np.arange(nbands)
+
+    step = max(1, chunk_size // (nbands ** 2))
+    for start in range(1, nqpoints, step):
+        stop = min(start + step, nqpoints)
+        metrics = np.abs(np.matmul(eigvecs[start - 1:stop - 1].conjugate(),
+                                   eigvecs[start:stop].transpose(0, 2, 1)))
+        for nq, metric in zip(range(start, stop), metrics):
+            if method == "greedy":
+                connection_order = _greedy_connection(metric)
+            else:
+                connection_order = LinearAssignment(1 - metric).solution
+            order[nq] = connection_order[order[nq - 1]]
+
+    return order
+
+
 class PhononBandStructure(MSONable):
     """
     This is the most generic phonon band structure data possible
@@ -517,34 +572,29 @@ class PhononBandStructureSymmLine(PhononBandStructure):
 
         return d
 
-    def band_reorder(self):
+    def band_reorder(self, method="greedy"):
         """
         Re-order the eigenvalues according to the similarity of the eigenvectors
+
+        Args:
+            method: "greedy" or "hungarian", see get_band_order
         """
         eiv = self.eigendisplacements
         eig = self.bands
 
         nphonons, nqpoints = self.bands.shape
-        order = np.zeros([nqpoints, nphonons], dtype=int)
-        order[0] = np.array(range(nphonons))
 
         # get the atomic masses
         atomic_masses = [site.specie.atomic_mass for site in self.structure.sites]
 
         # get order
-        for nq in range(1, nqpoints):
-            old_eiv = eigenvectors_from_displacements(eiv[:, nq - 1], atomic_masses)
-            new_eiv = eigenvectors_from_displacements(eiv[:, nq], atomic_masses)
-            order[nq] = estimate_band_connection(old_eiv.reshape([nphonons, nphonons]).T,
-                                                 new_eiv.reshape([nphonons, nphonons]).T,
-                                                 order[nq - 1])
+        eigvecs = np.einsum("nqax,a->qnax", eiv, np.sqrt(atomic_masses))
+        order = get_band_order(eigvecs.reshape([nqpoints, nphonons, nphonons]), method=method)
 
         # reorder
-        for nq in range(1, nqpoints):
-            eivq = eiv[:, nq]
-            eigq = eig[:, nq]
-            eiv[:, nq] = eivq[order[nq]]
-            eig[:, nq] = eigq[order[nq]]
+        qpoints = np.arange(nqpoints)
+        eiv[:] = eiv[order.T, qpoints]
+        eig[:] = eig[order.T, qpoints]
 
     def as_dict(self):
         """
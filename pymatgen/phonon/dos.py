@@ -166,31 +166,13 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/(K*mol)
 
         Args:
-            t: a temperature in K
+            t: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the numer of
                 formula units
         Returns:
-            Constant volume specific heat C_v
+            Constant volume specific heat C_v (an array with the shape of t if t is an array)
         """
-
-        if t == 0:
-            return 0
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        def csch2(x):
-            return 1.0 / (np.sinh(x) ** 2)
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * t)
-        cv = np.trapz(wd2kt ** 2 * csch2(wd2kt) * dens, x=freqs)
-        cv *= const.Boltzmann * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            cv /= formula_units
-
-        return cv
+        return self._get_thermal_property("cv", t, structure=structure)
 
     def entropy(self, t, structure=None):
         """
@@ -202,29 +184,13 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/(K*mol)
 
         Args:
-            t: a temperature in K
+            t: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the numer of
                 formula units
         Returns:
-            Vibrational entropy
+            Vibrational entropy (an array with the shape of t if t is an array)
         """
-
-        if t == 0:
-            return 0
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * t)
-        s = np.trapz((wd2kt * coth(wd2kt) - np.log(2 * np.sinh(wd2kt))) * dens, x=freqs)
-
-        s *= const.Boltzmann * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            s /= formula_units
-
-        return s
+        return self._get_thermal_property("entropy", t, structure=structure)
 
     def internal_energy(self, t, structure=None):
         """
@@ -236,29 +202,13 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/mol
 
         Args:
-            t: a temperature in K
+            t: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the numer of
                 formula units
         Returns:
-            Phonon contribution to the internal energy
+            Phonon contribution to the internal energy (an array with the shape of t if t is an array)
         """
-
-        if t == 0:
-            return self.zero_point_energy(structure=structure)
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * t)
-        e = np.trapz(freqs * coth(wd2kt) * dens, x=freqs) / 2
-
-        e *= THZ_TO_J * const.Avogadro
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            e /= formula_units
-
-        return e
+        return self._get_thermal_property("internal_energy", t, structure=structure)
 
     def helmholtz_free_energy(self, t, structure=None):
         """
@@ -270,29 +220,21 @@ class PhononDos(MSONable):
         the division is performed internally and the result is in J/mol
 
         Args:
-            t: a temperature in K
+            t: a temperature in K, or an array of temperatures
             structure: the structure of the system. If not None it will be used to determine the numer of
                 formula units
         Returns:
-            Phonon contribution to the Helmholtz free energy
+            Phonon contribution to the Helmholtz free energy (an array with the shape of t if t is an array)
         """
+        return self._get_thermal_property("helmholtz_free_energy", t, structure=structure)
 
-        if t == 0:
-            return self.zero_point_energy(structure=structure)
-
-        freqs = self._positive_frequencies
-        dens = self._positive_densities
-
-        wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * t)
-        f = np.trapz(np.log(2 * np.sinh(wd2kt)) * dens, x=freqs)
-
-        f *= const.Boltzmann * const.Avogadro * t
-
-        if structure:
-            formula_units = structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
-            f /= formula_units
-
-        return f
+    def _get_thermal_property(self, prop, t, structure=None):
+        """
+        Helper function that evaluates one of the thermodynamic functions for
+        a scalar or an array of temperatures.
+        """
+        values = get_thermal_properties([self], t, prop, structure=structure)[..., 0]
+        return values if np.ndim(t) else float(values)
 
     def zero_point_energy(self, structure=None):
         """
@@ -323,6 +265,83 @@ class PhononDos(MSONable):
         return zpe
 
 
+def _formula_units(structure):
+    """
+    Number of formula units in the given structure.
+    """
+    return structure.composition.num_atoms / structure.composition.reduced_composition.num_atoms
+
+
+def get_thermal_properties(phonon_doses, t, prop, structure=None, chunk_size=2 ** 22):
+    """
+    Evaluates a thermodynamic function for several PhononDos at several
+    temperatures at once, e.g. the vibrational free energies of the DOSs
+    obtained at different volumes in a quasi-harmonic calculation. The
+    positive frequencies of the DOSs are padded to a common length, so the
+    DOSs do not need to share the same frequency grid.
+
+    Args:
+        phonon_doses: a list of PhononDos
+        t: a temperature in K, or an array of temperatures
+        prop: the name of the function, one of "cv", "entropy",
+            "internal_energy" and "helmholtz_free_energy". Results are in
+            the units of the corresponding PhononDos method.
+        structure: the structure of the system. If not None it will be used to determine the numer of
+            formula units
+        chunk_size: maximum number of (temperature, frequency) pairs
+            evaluated at once
+
+    Returns:
+        numpy array with shape t.shape + (len(phonon_doses),)
+    """
+    if prop not in ("cv", "entropy", "internal_energy", "helmholtz_free_energy"):
+        raise ValueError("Unknown thermodynamic function {}".format(prop))
+
+    t = np.asarray(t, dtype=np.float64)
+    temps = t.ravel()
+    npos = [len(dos._positive_frequencies) for dos in phonon_doses]
+    freqs = np.zeros((len(phonon_doses), max(npos)))
+    dens = np.zeros_like(freqs)
+    mask = np.zeros(freqs.shape, dtype=bool)
+    for i, dos in enumerate(phonon_doses):
+        # repeating the last frequency makes the padding invisible to trapz
+        freqs[i] = dos._positive_frequencies[-1]
+        freqs[i, :npos[i]] = dos._positive_frequencies
+        dens[i, :npos[i]] = dos._positive_densities
+        mask[i, :npos[i]] = True
+
+    values = np.zeros((len(temps), len(phonon_doses)))
+    finite = temps != 0
+    if prop in ("internal_energy", "helmholtz_free_energy"):
+        values[~finite] = [dos.zero_point_energy() for dos in phonon_doses]
+
+    ind = np.nonzero(finite)[0]
+    step = max(1, chunk_size // freqs.size)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        for i in range(0, len(ind), step):
+            tt = temps[ind[i:i + step]][:, None, None]
+            wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * tt)
+            if prop == "cv":
+                y = wd2kt ** 2 * (1.0 / (np.sinh(wd2kt) ** 2))
+            elif prop == "entropy":
+                y = wd2kt * coth(wd2kt) - np.log(2 * np.sinh(wd2kt))
+            elif prop == "internal_energy":
+                y = freqs * coth(wd2kt) / 2
+            else:
+                y = np.log(2 * np.sinh(wd2kt)) * tt
+            values[ind[i:i + step]] = np.trapz(np.where(mask, y * dens, 0), x=freqs, axis=-1)
+
+    if prop in ("cv", "entropy", "helmholtz_free_energy"):
+        values[finite] *= const.Boltzmann * const.Avogadro
+    else:
+        values[finite] *= THZ_TO_J * const.Avogadro
+
+    if structure:
+        values /= _formula_units(structure)
+
+    return values.reshape(t.shape + (len(phonon_doses),))
+
+
 class CompletePhononDos(PhononDos):
     """
     This wrapper class defines a total dos, and also provides a list of PDos.
@@ -3,7 +3,10 @@ import os
 import json
 from io import open
 
-from pymatgen.phonon.bandstructure import PhononBandStructure, PhononBandStructureSymmLine
+import numpy as np
+
+from pymatgen.phonon.bandstructure import PhononBandStructure, PhononBandStructureSymmLine, \
+    estimate_band_connection, get_band_order
 from pymatgen.util.testing import PymatgenTest
 
 test_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..",
@@ -77,6 +80,38 @@ class PhononBandStructureSymmLineTest(PymatgenTest):
     def test_write_methods(self):
         self.bs2.write_phononwebsite('test.json')
 
+    def test_band_reorder(self):
+        nbands, nqpoints = self.bs2.bands.shape
+        scrambled = PhononBandStructureSymmLine.from_dict(self.bs2.as_dict())
+        for q in range(1, nqpoints):
+            perm = np.roll(np.arange(nbands), q)
+            scrambled.bands[:, q] = scrambled.bands[perm, q]
+            scrambled.eigendisplacements[:, q] = scrambled.eigendisplacements[perm, q]
+        # the optimal assignment does not depend on the initial order of the bands
+        bs = PhononBandStructureSymmLine.from_dict(self.bs2.as_dict())
+        bs.band_reorder(method="hungarian")
+        scrambled.band_reorder(method="hungarian")
+        self.assertArrayAlmostEqual(bs.bands, scrambled.bands)
+        self.assertRaises(ValueError, bs.band_reorder, method="random")
+
+    def test_get_band_order(self):
+        nbands, nqpoints, natoms, ndim = self.bs2.eigendisplacements.shape
+        eigvecs = np.einsum("nqax->qnax", self.bs2.eigendisplacements).reshape(
+            nqpoints, nbands, natoms * ndim)
+        order = get_band_order(eigvecs)
+        self.assertEqual(order.shape, (nqpoints, nbands))
+        # the q-points where the band order changes and the new order, as
+        # obtained by connecting the bands one q-point at a time
+        changes = {13: [1, 0, 2, 3, 4, 5], 20: [1, 0, 3, 2, 4, 5], 26: [0, 1, 3, 2, 5, 4],
+                   39: [0, 1, 3, 2, 4, 5], 52: [1, 0, 4, 2, 3, 5], 91: [1, 0, 4, 3, 2, 5],
+                   104: [1, 0, 5, 3, 2, 4], 117: [2, 1, 5, 4, 0, 3]}
+        expected = list(range(nbands))
+        for q in range(nqpoints):
+            expected = changes.get(q, expected)
+            self.assertEqual(list(order[q]), expected)
+        self.assertEqual(estimate_band_connection(eigvecs[116].T, eigvecs[117].T, order[116]),
+                         changes[117])
+
     def tearDown(self):
         if os.path.isfile('test.json'):
             os.remove('test.json')
@@ -2,8 +2,10 @@ import unittest
 import os
 import json
 
+import numpy as np
+
 from pymatgen.core.periodic_table import Element
-from pymatgen.phonon.dos import PhononDos, CompletePhononDos
+from pymatgen.phonon.dos import PhononDos, CompletePhononDos, get_thermal_properties
 from pymatgen.util.testing import PymatgenTest
 
 test_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..",
@@ -43,6 +45,31 @@ class DosTest(PymatgenTest):
         self.assertAlmostEqual(self.dos.entropy(300, structure=self.structure), 75.08543723748751, 4)
         self.assertAlmostEqual(self.dos.zero_point_energy(structure=self.structure), 4847.462485708741, 4)
 
+    def test_thermodynamic_functions_arrays(self):
+        temps = np.array([[0, 10], [300, 1000]])
+        # reference values at 10, 300 and 1000 K from the scalar implementation
+        expected = {"cv": [0.19076720769301733, 48.049366665412485, 49.71682028638008],
+                    "entropy": [0.062183359383993206, 75.08543723748751, 134.30068185070115],
+                    "internal_energy": [4847.928517301369, 15527.596956593827, 50056.43207116668],
+                    "helmholtz_free_energy": [4847.306684481734, -6998.034212172694, -84244.24977154055]}
+        for prop in ["cv", "entropy", "internal_energy", "helmholtz_free_energy"]:
+            func = getattr(self.dos, prop)
+            values = func(temps, structure=self.structure)
+            self.assertEqual(values.shape, (2, 2))
+            self.assertArrayAlmostEqual(values.ravel()[1:], expected[prop], 4)
+            for t, v in zip(temps.ravel(), values.ravel()):
+                self.assertAlmostEqual(v, func(t, structure=self.structure))
+        self.assertAlmostEqual(self.dos.internal_energy(0), self.dos.zero_point_energy())
+
+        # DOSs on different frequency grids are padded internally
+        dos2 = PhononDos(self.dos.frequencies[:150] * 1.1, self.dos.densities[:150])
+        values = get_thermal_properties([self.dos, dos2], [100, 300], "helmholtz_free_energy")
+        self.assertEqual(values.shape, (2, 2))
+        self.assertArrayAlmostEqual(values[:, 0], self.dos.helmholtz_free_energy(np.array([100, 300])))
+        self.assertAlmostEqual(values[1, 1], dos2.helmholtz_free_energy(300))
+        self.assertArrayAlmostEqual(values[:, 1], [3434.6252190833375, -6093.6080726588725], 4)
+        self.assertRaises(ValueError, get_thermal_properties, [self.dos], 300, "enthalpy")
+
 
 class CompleteDosTest(PymatgenTest):
 
@@ -15,7 +15,8 @@ v3.0 - pymatgen no longer ships with spglib. Instead, spglib (the python
 
 import itertools
 import logging
-from collections import defaultdict
+import hashlib
+from collections import defaultdict, namedtuple, OrderedDict
 import copy
 
 import math
@@ -44,12 +45,115 @@ __date__ = "May 14, 2016"
 logger = logging.getLogger(__name__)
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class SpglibCache:
+    """
+    A bounded least-recently-used cache of spglib results. Entries are keyed
+    by a hash of the cell passed to spglib (lattice, fractional coordinates,
+    species numbers and magnetic moments), the tolerances and the name of the
+    spglib function, so that analyzing the same structure repeatedly, e.g.
+    from different parts of pymatgen, only calls spglib once.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Args:
+            maxsize (int): Maximum number of cached results. A maxsize of 0
+                disables the cache.
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(func_name, cell, symprec, angle_tolerance):
+        """
+        Canonical hash of the arguments of a spglib call.
+
+        Args:
+            func_name (str): Name of the spglib function.
+            cell (tuple): (lattice, positions, numbers, magmoms) cell.
+            symprec (float): Distance tolerance.
+            angle_tolerance (float): Angle tolerance.
+
+        Returns:
+            (str): Hex digest of the arguments.
+        """
+        h = hashlib.sha1(func_name.encode())
+        for arr, dtype in zip(cell, [np.float64, np.float64, np.int64, np.float64]):
+            h.update(np.ascontiguousarray(arr, dtype=dtype).tobytes())
+        h.update(np.array([symprec, angle_tolerance], dtype=np.float64).tobytes())
+        return h.hexdigest()
+
+    def get(self, func_name, cell, symprec, angle_tolerance, func):
+        """
+        Returns the cached result of a spglib call, calling func() to compute
+        it if needed. A copy is returned, so callers may modify the result.
+
+        Args:
+            func_name (str): Name of the spglib function.
+            cell (tuple): (lattice, positions, numbers, magmoms) cell.
+            symprec (float): Distance tolerance.
+            angle_tolerance (float): Angle tolerance.
+            func (callable): Function without arguments calling spglib.
+
+        Returns:
+            The result of func().
+        """
+        if self.maxsize <= 0:
+            self.misses += 1
+            return func()
+        key = self.get_key(func_name, cell, symprec, angle_tolerance)
+        if key in self._data:
+            self.hits += 1
+            self._data.move_to_end(key)
+        else:
+            self.misses += 1
+            self._data[key] = func()
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return copy.deepcopy(self._data[key])
+
+    def cache_info(self):
+        """
+        Returns:
+            (CacheInfo): Named tuple of hits, misses, maxsize and currsize,
+            like functools.lru_cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    @property
+    def hit_rate(self):
+        """
+        Fraction of the lookups that were served from the cache.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics.
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class SpacegroupAnalyzer:
     """
     Takes a pymatgen.core.structure.Structure object and a symprec.
     Uses spglib to perform various symmetry finding operations.
+
+    The results of spglib.get_symmetry_dataset and spglib.get_symmetry are
+    shared between instances through the SpacegroupAnalyzer.spglib_cache
+    SpglibCache (see its cache_info for statistics).
     """
 
+    spglib_cache = SpglibCache()
+
     def __init__(self, structure, symprec=0.01, angle_tolerance=5.0):
         """
         Args:
@@ -94,8 +198,10 @@ class SpacegroupAnalyzer:
         # For now, we are setting magmom to zero.
         self._cell = latt, positions, zs, magmoms
 
-        self._space_group_data = spglib.get_symmetry_dataset(
-            self._cell, symprec=self._symprec, angle_tolerance=angle_tolerance)
+        self._space_group_data = self.spglib_cache.get(
+            "get_symmetry_dataset", self._cell, self._symprec, angle_tolerance,
+            lambda: spglib.get_symmetry_dataset(
+                self._cell, symprec=self._symprec, angle_tolerance=angle_tolerance))
 
     def get_space_group_symbol(self):
         """
@@ -223,8 +329,10 @@ class SpacegroupAnalyzer:
             "translations" gives the numpy float64 array of the translation
             vectors in scaled positions.
         """
-        d = spglib.get_symmetry(self._cell, symprec=self._symprec,
-                                angle_tolerance=self._angle_tol)
+        d = self.spglib_cache.get(
+            "get_symmetry", self._cell, self._symprec, self._angle_tol,
+            lambda: spglib.get_symmetry(self._cell, symprec=self._symprec,
+                                        angle_tolerance=self._angle_tol))
         # Sometimes spglib returns small translation vectors, e.g.
         # [1e-4, 2e-4, 1e-4]
         # (these are in fractional coordinates, so should be small denominator
@@ -121,6 +121,7 @@ class PointGroup(SymmetryGroup):
         self._symmetry_ops = set([SymmOp.from_rotation_and_translation(m)
                                   for m in self._generate_full_symmetry_ops()])
         self.order = len(self._symmetry_ops)
+        self._rotation_matrices = None
 
     @property
     def symmetry_ops(self):
@@ -155,12 +156,35 @@ class PointGroup(SymmetryGroup):
         Returns:
             ([array]) Orbit for point.
         """
-        orbit = []
-        for o in self.symmetry_ops:
-            pp = o.operate(p)
-            if not in_array_list(orbit, pp, tol=tol):
-                orbit.append(pp)
-        return orbit
+        return self.get_orbits([p], tol=tol)[0]
+
+    @property
+    def rotation_matrices(self):
+        """
+        Rotation matrices of the symmetry operations stacked in a (n, 3, 3)
+        array, in the order of iteration over symmetry_ops. Lazily
+        initialized and shared by all instances of the same group.
+        """
+        if self._rotation_matrices is None:
+            self._rotation_matrices = np.array(
+                [op.rotation_matrix for op in self.symmetry_ops])
+        return self._rotation_matrices
+
+    def get_orbits(self, points, tol=1e-5):
+        """
+        Returns the orbits for many points at once.
+
+        Args:
+            points: Points as a (m, 3) array.
+            tol: Tolerance for determining if sites are the same. 1e-5 should
+                be sufficient for most purposes. Set to 0 for exact matching.
+
+        Returns:
+            ([[array]]) Orbit for each point, as returned by get_orbit.
+        """
+        points = np.array(points, dtype=np.float64).reshape((-1, 3))
+        images = np.einsum("nij,mj->mni", self.rotation_matrices, points)
+        return _get_unique_orbits(images, tol)
 
 
 @cached_class
@@ -275,6 +299,9 @@ class SpaceGroup(SymmetryGroup):
 
             self._symmetry_ops = None
 
+        self._rotation_matrices = None
+        self._translation_vectors = None
+
     def _generate_full_symmetry_ops(self):
         symm_ops = np.array(self.generators)
         for op in symm_ops:
@@ -351,13 +378,55 @@ class SpaceGroup(SymmetryGroup):
         Returns:
             ([array]) Orbit for point.
         """
-        orbit = []
-        for o in self.symmetry_ops:
-            pp = o.operate(p)
-            pp = np.mod(np.round(pp, decimals=10), 1)
-            if not in_array_list(orbit, pp, tol=tol):
-                orbit.append(pp)
-        return orbit
+        return self.get_orbits([p], tol=tol)[0]
+
+    @property
+    def rotation_matrices(self):
+        """
+        Rotation matrices of the symmetry operations stacked in a (n, 3, 3)
+        array, in the order of symmetry_ops. Lazily initialized and shared by
+        all instances of the same group.
+        """
+        if self._rotation_matrices is None:
+            self._build_op_arrays()
+        return self._rotation_matrices
+
+    @property
+    def translation_vectors(self):
+        """
+        Translation vectors of the symmetry operations stacked in a (n, 3)
+        array, in the order of symmetry_ops.
+        """
+        if self._translation_vectors is None:
+            self._build_op_arrays()
+        return self._translation_vectors
+
+    def _build_op_arrays(self):
+        """
+        Stacks the affine matrices of symmetry_ops into the rotation_matrices
+        and translation_vectors arrays.
+        """
+        affine = np.array([op.affine_matrix for op in self.symmetry_ops])
+        self._rotation_matrices = affine[:, :3, :3]
+        self._translation_vectors = affine[:, :3, 3]
+
+    def get_orbits(self, points, tol=1e-5):
+        """
+        Returns the orbits for many points at once.
+
+        Args:
+            points: Points as a (m, 3) array.
+            tol: Tolerance for determining if sites are the same. 1e-5 should
+                be sufficient for most purposes. Set to 0 for exact matching.
+
+        Returns:
+            ([[array]]) Orbit for each point, as returned by get_orbit.
+        """
+        points = np.array(points, dtype=np.float64).reshape((-1, 3))
+        images = np.einsum("nij,mj->mni", self.rotation_matrices, points)
+        images += self.translation_vectors
+        images = np.mod(np.round(images, decimals=10), 1)
+        return _get_unique_orbits(images, tol)
 
     def is_compatible(self, lattice, tol=1e-5, angle_tol=5):
         """
@@ -518,6 +587,35 @@ def sg_symbol_from_int_number(int_number, hexagonal=True):
     return syms.pop()
 
 
+def _get_unique_orbits(images, tol=1e-5, chunk_size=2 ** 22):
+    """
+    Removes the duplicate images of each point, keeping the first occurrence
+    of each image in the same way as repeated calls to in_array_list.
+
+    Args:
+        images (array): (m, n, 3) images of m points under n operations.
+        tol (float): The tolerance. If 0, an exact match is done.
+        chunk_size (int): Maximum number of elements compared at once.
+
+    Returns:
+        ([[array]]) Unique images of each point.
+    """
+    m, n = images.shape[:2]
+    orbits = []
+    step = max(1, chunk_size // (3 * n * n))
+    for start in range(0, m, step):
+        chunk = images[start:start + step]
+        dist = np.zeros((len(chunk), n, n))
+        for i in range(3):
+            dist += np.abs(chunk[:, :, None, i] - chunk[:, None, :, i])
+        close = dist < tol if tol else dist == 0
+        keep = np.zeros(close.shape[:2], dtype=bool)
+        for j in range(n):
+            keep[:, j] = ~np.any(close[:, j, :j] & keep[:, :j], axis=1)
+        orbits.extend(list(orbit[k]) for orbit, k in zip(chunk, keep))
+    return orbits
+
+
 def in_array_list(array_list, a, tol=1e-5):
     """
     Extremely efficient nd-array comparison using numpy's broadcasting. This
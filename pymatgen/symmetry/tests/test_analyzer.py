@@ -13,7 +13,7 @@ from pymatgen.core.operations import SymmOp
 from pymatgen.io.vasp.inputs import Poscar
 from pymatgen.io.vasp.outputs import Vasprun
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, \
-    PointGroupAnalyzer, cluster_sites, iterative_symmetrize
+    PointGroupAnalyzer, cluster_sites, iterative_symmetrize, SpglibCache
 from pymatgen.io.cif import CifParser
 from pymatgen.util.testing import PymatgenTest
 from pymatgen.core.structure import Molecule, Structure
@@ -141,6 +141,29 @@ class SpacegroupAnalyzerTest(PymatgenTest):
         ds = self.sg.get_symmetry_dataset()
         self.assertEqual(ds['international'], 'Pnma')
 
+    def test_spglib_cache(self):
+        cache = SpglibCache(maxsize=2)
+        old_cache = SpacegroupAnalyzer.spglib_cache
+        SpacegroupAnalyzer.spglib_cache = cache
+        try:
+            ds = SpacegroupAnalyzer(self.structure, 0.001).get_symmetry_dataset()
+            ds['rotations'][0] = 0
+            sg = SpacegroupAnalyzer(self.structure.copy(), 0.001)
+            self.assertEqual(sg.get_space_group_symbol(), 'Pnma')
+            self.assertArrayEqual(sg.get_symmetry_dataset()['rotations'][0], np.eye(3))
+            self.assertEqual(cache.cache_info(), (1, 1, 2, 1))
+            # a different tolerance or structure is a different entry
+            SpacegroupAnalyzer(self.structure, 0.1)
+            SpacegroupAnalyzer(self.structure4, 0.001)
+            self.assertEqual(cache.cache_info(), (1, 3, 2, 2))
+            self.assertAlmostEqual(cache.hit_rate, 0.25)
+            self.assertEqual(len(sg.get_symmetry_operations()),
+                             len(self.sg.get_symmetry_operations()))
+            cache.clear()
+            self.assertEqual(cache.cache_info(), (0, 0, 2, 0))
+        finally:
+            SpacegroupAnalyzer.spglib_cache = old_cache
+
     def test_get_crystal_system(self):
         crystal_system = self.sg.get_crystal_system()
         self.assertEqual('orthorhombic', crystal_system)
@@ -28,6 +28,8 @@ class PointGroupTest(unittest.TestCase):
         self.assertEqual(len(pg.get_orbit([0.1, 0.1, 0.1])), 8)
         self.assertEqual(len(pg.get_orbit([0, 0, 0.1])), 2)
         self.assertEqual(len(pg.get_orbit([1.2, 1.2, 1])), 8)
+        orbits = pg.get_orbits([[0.1, 0.1, 0.1], [0, 0, 0.1]])
+        self.assertEqual([len(o) for o in orbits], [8, 2])
 
     def test_is_sub_super_group(self):
         with warnings.catch_warnings() as w:
@@ -107,6 +109,18 @@ class SpaceGroupTest(unittest.TestCase):
         p = np.random.randint(0, 100 + 1, size=(3,)) / 100
         self.assertLessEqual(len(sg.get_orbit(p)), sg.order)
 
+    def test_get_orbits(self):
+        sg = SpaceGroup("Fm-3m")
+        self.assertEqual(sg.rotation_matrices.shape, (192, 3, 3))
+        self.assertEqual(sg.translation_vectors.shape, (192, 3))
+        self.assertIs(SpaceGroup("Fm-3m").rotation_matrices, sg.rotation_matrices)
+        points = [[0, 0, 0], [0.25, 0.25, 0.25], [0.1, 0.2, 0.37], [0, 0, 0.5]]
+        orbits = sg.get_orbits(points)
+        self.assertEqual([len(o) for o in orbits], [4, 8, 192, 4])
+        for p, orbit in zip(points, orbits):
+            self.assertTrue(np.allclose(orbit, sg.get_orbit(p)))
+            self.assertEqual(len(sg.get_orbit(p, tol=0)), len(orbit))
+
     def test_is_compatible(self):
         cubic = Lattice.cubic(1)
         hexagonal = Lattice.hexagonal(1, 2)
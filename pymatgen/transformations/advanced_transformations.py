@@ -1727,17 +1727,17 @@ class CubicSupercellTransformation(AbstractTransformation):
                 ]
             )
 
-            # Get number of atoms
-            st = SupercellTransformation(self.transformation_matrix)
-            superstructure = st.apply_transformation(structure)
-            num_at = superstructure.num_sites
+            # Get number of atoms without building the supercell, which is
+            # only done once the constraints are satisfied
+            num_at = len(structure) * int(round(abs(np.linalg.det(self.transformation_matrix))))
 
             # Check if constraints are satisfied
             if (
                 np.min(np.linalg.norm(length_vecs, axis=1)) >= self.min_length
                 and self.min_atoms <= num_at <= self.max_atoms
             ):
-                return superstructure
+                st = SupercellTransformation(self.transformation_matrix)
+                return st.apply_transformation(structure)
             else:
                 # Increase threshold until proposed supercell meets requirements
                 target_sc_size += 0.1
@@ -11,8 +11,16 @@ import json
 import functools
 import pickle
 
+import numpy as np
+from monty.json import MontyEncoder, MontyDecoder
+
 from pymatgen.core.periodic_table import Element
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 __author__ = "Shyue Ping Ong"
 __copyright__ = "Copyright 2012, The Materials Project"
@@ -49,6 +57,78 @@ def json_pretty_dump(obj, filename):
         json.dump(obj, fh, indent=4, sort_keys=4)
 
 
+def decode_array(obj, dtype=None):
+    """
+    Convert an array field of a compact ("columnar") dict back to a numpy
+    array. Such fields may be numpy arrays (kept as is, e.g. for in-memory
+    round trips or by orjson), plain nested lists (json) or the MSON dicts
+    that MontyEncoder emits for numpy arrays.
+
+    Args:
+        obj: Array, nested list or MSON dict of a numpy array.
+        dtype: Optional dtype for the returned array.
+
+    Returns:
+        numpy array.
+    """
+    if isinstance(obj, dict) and obj.get("@module") == "numpy":
+        obj = MontyDecoder().process_decoded(obj)
+    return np.asarray(obj, dtype=dtype)
+
+
+def pmg_json_dumps(obj, backend=None):
+    """
+    Serialize obj to a JSON string. This is most useful together with the
+    compact as_dict(fmt="columnar") representations of Structure,
+    ComputedStructureEntry, BandStructure and CompleteDos, whose numpy
+    arrays are written directly by orjson. Note that orjson writes numpy
+    arrays as plain lists, so arrays in free-form fields (e.g., the data of
+    an entry) are read back as lists.
+
+    Args:
+        obj: Object to serialize. MSONable objects are converted with
+            MontyEncoder.
+        backend (str): "orjson" or "json". Defaults to orjson if it is
+            installed and the standard library json module otherwise.
+
+    Returns:
+        JSON string.
+    """
+    backend = backend or ("orjson" if orjson is not None else "json")
+    if backend == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed.")
+        return orjson.dumps(
+            obj, default=MontyEncoder().default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    if backend == "json":
+        return json.dumps(obj, cls=MontyEncoder)
+    raise ValueError("Unknown backend %s" % backend)
+
+
+def pmg_json_loads(s, backend=None):
+    """
+    Deserialize a JSON string written by pmg_json_dumps (or any MSON JSON
+    string) and reconstitute the MSONable objects in it.
+
+    Args:
+        s (str): JSON string.
+        backend (str): "orjson" or "json". Defaults to orjson if it is
+            installed and the standard library json module otherwise.
+
+    Returns:
+        Deserialized object.
+    """
+    backend = backend or ("orjson" if orjson is not None else "json")
+    if backend == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed.")
+        return MontyDecoder().process_decoded(orjson.loads(s))
+    if backend == "json":
+        return json.loads(s, cls=MontyDecoder)
+    raise ValueError("Unknown backend %s" % backend)
+
+
 class PmgPickler(pickle.Pickler):
     """
     Persistence of External Objects as described in section 12.1.5.1 of